@@ -0,0 +1,111 @@
+"""Import-time regression benchmark for the zyro CLI.
+
+Runs CLI commands under ``python -X importtime`` and reports how long their
+imports take. Exits non-zero when a command fails, imports a module it shouldn't
+need (the web stack for ``validate`` and ``--help``) or, with ``--budget-ms``,
+when its median import time goes over budget.
+
+    python benchmarks/importtime.py [--runs 5] [--budget-ms 400] [--json]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, Set, Tuple
+
+_CONFIG = """\
+endpoints:
+  - base_path: "/bench"
+    routes:
+      - path: "/ping"
+        response:
+          200:
+            content: {"pong": true}
+"""
+
+# Modules a command must not import, with the commands they apply to.
+_WEB_STACK = {"fastapi", "starlette", "uvicorn", "httpx"}
+_SCENARIOS: Dict[str, Tuple[List[str], Set[str]]] = {
+    "--help": (["--help"], _WEB_STACK | {"yaml", "zyro.core.config.schema"}),
+    "validate": (["validate", "--config", "{config}", "--no-cache"], _WEB_STACK),
+}
+
+
+def _parse(stderr: str) -> Tuple[int, Set[str]]:
+    """Total import time in microseconds and the top-level packages imported."""
+
+    total = 0
+    modules: Set[str] = set()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        total += int(self_us)
+        name = name.strip()
+        modules.add(name)
+        modules.add(name.split(".")[0])
+    return total, modules
+
+
+def run(args: List[str], runs: int) -> Dict[str, object]:
+    timings = []
+    modules: Set[str] = set()
+    returncode = 0
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-m", "zyro.cli.main", *args],
+            capture_output=True,
+            text=True,
+            env=env,
+        )
+        total, modules = _parse(result.stderr)
+        timings.append(total / 1000)
+        # A crashed command imports little and would look fast.
+        returncode = returncode or result.returncode
+    return {
+        "median_ms": statistics.median(timings),
+        "min_ms": min(timings),
+        "returncode": returncode,
+        "modules": modules,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Runs per command; the median is reported")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Fail when a median exceeds this")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    options = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        config = os.path.join(directory, "config.yaml")
+        with open(config, "w", encoding="utf-8") as f:
+            f.write(_CONFIG)
+
+        results = {}
+        failed = False
+        for name, (args, forbidden) in _SCENARIOS.items():
+            stats = run([arg.format(config=config) for arg in args], options.runs)
+            unexpected = sorted(forbidden & stats.pop("modules"))
+            over_budget = options.budget_ms is not None and stats["median_ms"] > options.budget_ms
+            failed = failed or bool(unexpected) or over_budget or stats["returncode"] != 0
+            results[name] = {**stats, "unexpected_imports": unexpected, "over_budget": over_budget}
+
+    if options.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'COMMAND':<10}  {'MEDIAN ms':>9}  {'MIN ms':>7}  {'EXIT':>4}  UNEXPECTED IMPORTS")
+        for name, r in results.items():
+            print(
+                f"{name:<10}  {r['median_ms']:>9.1f}  {r['min_ms']:>7.1f}  {r['returncode']:>4}  "
+                f"{', '.join(r['unexpected_imports']) or '-'}"
+            )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
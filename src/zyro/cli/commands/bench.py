@@ -0,0 +1,76 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Sequence
+import asyncio
+import json
+import typer
+from zyro.core.api.bench import run_bench
+from zyro.core.exceptions import ConfigLoadError, ConfigValidationError, ServerError
+from zyro.utils.parser import load_file
+from zyro.utils.validation import ensure_yaml_exists
+
+_COLUMNS = ("ROUTE", "REQS", "RPS", "P50 ms", "P95 ms", "P99 ms", "ERR %")
+
+
+def _line(row: Sequence[str], widths: Sequence[int]) -> str:
+	# Route left-aligned, numbers right-aligned.
+	return "  ".join(
+		cell.ljust(width) if i == 0 else cell.rjust(width) for i, (cell, width) in enumerate(zip(row, widths))
+	)
+
+
+def bench(
+		config: Path,
+		concurrency: int = 10,
+		duration: float = 2.0,
+		match: str | None = None,
+		output: str | None = None,
+		use_cache: bool = True
+	) -> None:
+	"""Load-tests every route of the config in-process and reports per-route latency."""
+
+	try:
+		ensure_yaml_exists(file=config)
+		configuration = load_file(file_path=config, use_cache=use_cache)
+		results = asyncio.run(run_bench(configuration, concurrency=concurrency, duration=duration, match=match))
+	except (ConfigValidationError, ConfigLoadError, ServerError) as e:
+		typer.secho("Benchmark Failed", fg=typer.colors.RED, bold=True)
+		typer.echo(str(e))
+		raise typer.Exit(code=1)
+
+	summaries = [stats.summary() for stats in results]
+	if output is not None and output.lower() == "json":
+		typer.echo(
+			json.dumps(
+				{
+					"concurrency": concurrency,
+					"duration": duration,
+					"routes": summaries
+				},
+				indent=2
+			)
+		)
+		return
+
+	if not summaries:
+		typer.secho("No routes to benchmark", fg=typer.colors.YELLOW)
+		return
+
+	rows = [
+		(
+			f"{s['method']} {s['path']}",
+			str(s["requests"]),
+			f"{s['rps']:.1f}",
+			f"{s['p50_ms']:.2f}",
+			f"{s['p95_ms']:.2f}",
+			f"{s['p99_ms']:.2f}",
+			f"{s['error_rate'] * 100:.1f}",
+		)
+		for s in summaries
+	]
+	widths = [max(len(row[i]) for row in [_COLUMNS, *rows]) for i in range(len(_COLUMNS))]
+
+	typer.secho(_line(_COLUMNS, widths), bold=True)
+	for row, s in zip(rows, summaries):
+		typer.secho(_line(row, widths), fg=typer.colors.RED if s["errors"] else None)
+	typer.echo(f"\n{concurrency} concurrent clients, {duration:g}s per route")
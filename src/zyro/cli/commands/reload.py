@@ -0,0 +1,34 @@
+from __future__ import annotations
+from pathlib import Path
+import typer
+from zyro.core.manager.registry import InstanceRegistry
+
+
+def reload(config: Path, instance: str | None = None, timeout: float = 120.0) -> None:
+	"""Replaces the workers of a config's servers with ones running the current config."""
+
+	registry = InstanceRegistry()
+	records = registry.instances(config, instance)
+	if not records:
+		typer.secho("No matching servers running", fg=typer.colors.YELLOW)
+		raise typer.Exit(code=1)
+
+	failed = False
+	for key, record in records.items():
+		name = f"{record['config']} ({record['instance']}, PID {record['pid']})"
+		if not record.get("supervised"):
+			typer.secho(f"{name} runs without a supervisor; use restart", fg=typer.colors.RED)
+			failed = True
+			continue
+		typer.echo(f"Reloading {name}...")
+		outcome = registry.reload(key, timeout=timeout)
+		if outcome:
+			typer.secho(f"Reloaded {name}", fg=typer.colors.GREEN, bold=True)
+		elif outcome is None:
+			typer.secho(f"{name} didn't report back within {timeout:g}s", fg=typer.colors.RED)
+			failed = True
+		else:
+			typer.secho(f"Reload of {name} failed, old workers kept; see the server log", fg=typer.colors.RED)
+			failed = True
+	if failed:
+		raise typer.Exit(code=1)
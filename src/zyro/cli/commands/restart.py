@@ -0,0 +1,20 @@
+from __future__ import annotations
+from pathlib import Path
+import typer
+from zyro.cli.commands.start import start as start_func
+from zyro.core.manager.registry import InstanceRegistry
+
+
+def restart(config: Path, instance: str | None = None, timeout: float = 10.0, use_cache: bool = True) -> None:
+	"""Stops the config's servers and starts each again in the background."""
+
+	registry = InstanceRegistry()
+	records = registry.instances(config, instance)
+	if not records:
+		typer.secho("No matching servers running", fg=typer.colors.YELLOW)
+		raise typer.Exit(code=1)
+
+	for key, record in records.items():
+		registry.stop(key, timeout=timeout)
+		typer.secho(f"Stopped {record['config']} ({record['instance']})", fg=typer.colors.GREEN)
+		start_func(config=Path(record["config"]), detach=True, use_cache=use_cache, instance=record["instance"])
@@ -1,33 +1,24 @@
 from __future__ import annotations
 
-import os
 import subprocess
 import sys
-from datetime import datetime
 from pathlib import Path
 
 import typer
-import uvicorn
 
 from zyro.cli.commands.validate import validate as validate_func
-from zyro.core.api.fastapi_engine import create_app
-from zyro.core.api.router import mount_routes
+from zyro.core.api.server import serve
 from zyro.core.exceptions import ServerError
 from zyro.core.logging import setup_logging
-from zyro.core.manager.state import StateManager
-from zyro.utils.parser import (
-    get_endpoints_config,
-    get_project_config,
-    get_server_config,
-    load_file,
-)
+from zyro.core.manager.registry import DEFAULT_INSTANCE, InstanceRegistry
+from zyro.utils.parser import get_server_config, load_file
 
 
-def start(config: Path, detach: bool = False) -> None:
+def start(config: Path, detach: bool = False, use_cache: bool = True, instance: str = DEFAULT_INSTANCE) -> None:
     """Spins up the FastAPI server."""
 
     try:
-        validate_func(config=config, verbose=False) 
+        validate_func(config=config, verbose=False, use_cache=use_cache) 
     except typer.Exit as e:
         if getattr(e, "exit_code", None) in (0, None):
             pass 
@@ -35,22 +26,30 @@ def start(config: Path, detach: bool = False) -> None:
             raise 
 
     try:
-        configuration = load_file(file_path=config)
-        project_config = get_project_config(config=configuration) 
+        configuration = load_file(file_path=config, use_cache=use_cache)
         server_config = get_server_config(config=configuration)
-        endpoints_config = get_endpoints_config(config=configuration) 
 
-        # Prepare state manager to record runtime info (PID is important)
-        state_manager = StateManager()
+        running = InstanceRegistry().instances(config, instance)
+        if any(record["health"] != "dead" for record in running.values()):
+            typer.secho(
+                f"Instance {instance!r} of {config} is already running; "
+                "stop it or start another with --instance",
+                fg=typer.colors.RED,
+                bold=True
+            )
+            raise typer.Exit(code=1)
 
         if detach:
 
             cmd = [
                 sys.executable,
                 "-m",
-                "src.zyro.core.api.server",
+                "zyro.core.api.server",
                 str(config.absolute())
             ]
+            if not use_cache:
+                cmd.append("--no-cache")
+            cmd.extend(["--instance", instance])
             
             process = subprocess.Popen(
                 cmd,
@@ -67,39 +66,21 @@ def start(config: Path, detach: bool = False) -> None:
                 bold=True
             )
             typer.echo(f"Running on http://{server_config.host}:{server_config.port}")
-            # Save state (record background PID and server info)
+            if server_config.workers > 1:
+                typer.echo(f"Workers: {server_config.workers}")
+            # Record it now so `zyro status` sees it before the server is up;
+            # the server replaces this record with its workers once running.
             try:
-                state_manager.add_state("pid", process.pid)
-                state_manager.add_state("mode", "detached")
-                state_manager.add_state("host", server_config.host)
-                state_manager.add_state("port", server_config.port)
-                state_manager.add_state("started_at", datetime.utcnow().isoformat() + "Z")
-                state_manager.save_state(str(config.absolute()))
+                InstanceRegistry().register(
+                    config, instance, process.pid, server_config.host, server_config.port, "detached"
+                )
             except Exception:
-                # Don't block server start on state save failures; log handled by StateManager
+                # Don't block server start on registry failures
                 pass
             
         else:
             setup_logging() 
-            app = create_app(project_config=project_config)
-            mount_routes(app=app, endpoints_config=endpoints_config)
-            # Save state (foreground PID and server info)
-            try:
-                state_manager.add_state("pid", os.getpid())
-                state_manager.add_state("mode", "foreground")
-                state_manager.add_state("host", server_config.host)
-                state_manager.add_state("port", server_config.port)
-                state_manager.add_state("started_at", datetime.utcnow().isoformat() + "Z")
-                state_manager.save_state(str(config.absolute()))
-            except Exception:
-                pass
-            uvicorn.run(
-                app=app, 
-                host=server_config.host,
-                port=server_config.port, 
-                log_level=server_config.log_level.lower(),
-                log_config=None 
-            )
+            serve(configuration, config_path=config.absolute(), instance_id=instance, use_cache=use_cache)
 
     except ServerError as e:
         typer.secho("Server Spin up Failed", fg=typer.colors.RED, bold=True)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Sequence
+import json
+import typer
+from zyro.core.manager.registry import InstanceRegistry
+
+_COLUMNS = ("CONFIG", "INSTANCE", "PID", "ADDRESS", "WORKERS", "UPTIME", "HEALTH")
+_COLORS = {"running": typer.colors.GREEN, "degraded": typer.colors.YELLOW, "dead": typer.colors.RED}
+
+
+def _uptime(started_at: str) -> str:
+	seconds = int((datetime.now(timezone.utc) - datetime.fromisoformat(started_at)).total_seconds())
+	hours, rest = divmod(max(seconds, 0), 3600)
+	return f"{hours}h{rest // 60:02d}m" if hours else f"{rest // 60}m{rest % 60:02d}s"
+
+
+def _line(row: Sequence[str], widths: Sequence[int]) -> str:
+	return "  ".join(cell.ljust(width) for cell, width in zip(row, widths))
+
+
+def status(config: Path | None = None, instance: str | None = None, output: str | None = None, prune: bool = False) -> None:
+	"""Lists the registered servers and their health."""
+
+	registry = InstanceRegistry()
+	if prune:
+		registry.prune()
+	records = list(registry.instances(config, instance).values())
+
+	if output is not None and output.lower() == "json":
+		typer.echo(json.dumps(records, indent=2))
+		return
+
+	if not records:
+		typer.secho("No servers running", fg=typer.colors.YELLOW)
+		return
+
+	rows = [
+		(
+			r["config"],
+			r["instance"],
+			str(r["pid"]),
+			f"{r['host']}:{r['port']}",
+			str(len(r["workers"])),
+			_uptime(r["started_at"]),
+			r["health"],
+		)
+		for r in records
+	]
+	widths = [max(len(row[i]) for row in [_COLUMNS, *rows]) for i in range(len(_COLUMNS))]
+
+	typer.secho(_line(_COLUMNS, widths), bold=True)
+	for row, r in zip(rows, records):
+		typer.secho(_line(row, widths), fg=_COLORS.get(r["health"]))
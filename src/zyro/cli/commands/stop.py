@@ -0,0 +1,28 @@
+from __future__ import annotations
+from pathlib import Path
+import typer
+from zyro.core.manager.registry import InstanceRegistry
+
+
+def stop(config: Path | None = None, instance: str | None = None, all_instances: bool = False, timeout: float = 10.0) -> None:
+	"""Stops the registered servers of a config, or every server with all_instances."""
+
+	if config is None and not all_instances:
+		typer.secho("Pass --config or --all", fg=typer.colors.RED, bold=True)
+		raise typer.Exit(code=2)
+
+	registry = InstanceRegistry()
+	records = registry.instances(None if all_instances else config, instance)
+	if not records:
+		typer.secho("No matching servers running", fg=typer.colors.YELLOW)
+		raise typer.Exit(code=1)
+
+	for key, record in records.items():
+		name = f"{record['config']} ({record['instance']}, PID {record['pid']})"
+		if record["health"] == "dead":
+			registry.unregister(key, pid=record["pid"])
+			typer.secho(f"Removed stale record of {name}", fg=typer.colors.YELLOW)
+		elif registry.stop(key, timeout=timeout):
+			typer.secho(f"Stopped {name}", fg=typer.colors.GREEN)
+		else:
+			typer.secho(f"Killed {name} after {timeout:g}s", fg=typer.colors.YELLOW)
@@ -1,59 +1,119 @@
 from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-import typer 
-import json 
-from zyro.core.config.loader import load_config
-from zyro.core.config.validator import valid_config
+from typing import Any, Dict, Iterator, List, Sequence
+import glob
+import os
+import typer
+import json
+from zyro.core.config.cache import compile_config
 from zyro.utils.validation import ensure_yaml_exists
 from zyro.core.exceptions import ConfigLoadError, ConfigValidationError
 
-def validate(config: Path, strict: bool = True, output: str | None = None, verbose: bool = True) -> None:
-	"""Validates the config file."""
+_YAML_SUFFIXES = (".yaml", ".yml")
 
-	try:
-		# Ensure the config file exists in the given path 
-		ensure_yaml_exists(file=config)
-		raw_config = load_config(file_path=config)
-		result = valid_config(raw_config, strict=strict) 
-
-		if output is not None and output.lower() == "json":
-			typer.echo(
-				json.dumps(
-					{
-						"valid": True, 
-						"warnings": result.warnings
-					}, 
-					indent=2
-				)
-			) 
+
+def expand_paths(paths: Sequence[str | Path]) -> List[Path]:
+	"""Files named by paths, globs and directories (searched recursively for YAML), without duplicates."""
+
+	files: List[Path] = []
+	for entry in map(str, paths):
+		if os.path.isdir(entry):
+			matches = sorted(p for p in Path(entry).rglob("*") if p.suffix.lower() in _YAML_SUFFIXES and p.is_file())
+		elif glob.has_magic(entry):
+			matches = sorted(Path(p) for p in glob.glob(entry, recursive=True) if os.path.isfile(p))
+			if not matches:
+				# Reported as a failed file, like a missing path
+				matches = [Path(entry)]
 		else:
-			if verbose:
-				typer.secho("Config is valid", fg=typer.colors.GREEN, bold=True) 
-			if result.warnings:
-				typer.secho("warnings:", fg=typer.colors.YELLOW, bold=True) 
-				for w in result.warnings:
-					typer.secho(f" - {w}", fg=typer.colors.YELLOW) 
-		raise typer.Exit(code=0) 
+			matches = [Path(entry)]
+		files.extend(matches)
+	return list(dict.fromkeys(files))
+
 
+def validate_file(config: Path, strict: bool = True, use_cache: bool = True) -> Dict[str, Any]:
+	"""Validation result of one config file, in the shape of the JSON output."""
 
+	try:
+		# Ensure the config file exists in the given path
+		ensure_yaml_exists(file=config)
+		result = compile_config(file_path=config, strict=strict, use_cache=use_cache, need_config=False)
+		return {"valid": True, "warnings": result.warnings}
 	except (ConfigValidationError, ConfigLoadError) as e:
-		if output is not None and output.lower() == "json":
-			typer.echo(
-				json.dumps(
-					{
-						"valid": False, 
-						"error": str(e), 
-						"details": getattr(e, "details", None)
-					},
-					indent=2
-				)
-			)
+		return {"valid": False, "error": str(e), "details": getattr(e, "details", None)}
+	except Exception as e:
+		# One broken file must not stop the rest of a batch.
+		return {"valid": False, "error": f"{type(e).__name__}: {e}", "details": None}
+
+
+def _validate_many(files: List[Path], strict: bool, use_cache: bool, jobs: int) -> Iterator[Dict[str, Any]]:
+	"""Results in file order, computed across a process pool."""
+
+	check = partial(validate_file, strict=strict, use_cache=use_cache)
+	jobs = min(jobs, len(files))
+	if jobs <= 1:
+		yield from map(check, files)
+		return
+	with ProcessPoolExecutor(max_workers=jobs) as pool:
+		# Small chunks keep results streaming; more than one amortizes the IPC.
+		yield from pool.map(check, files, chunksize=max(1, len(files) // (jobs * 4)))
+
+
+def _echo_text(result: Dict[str, Any], verbose: bool, prefix: str = "") -> None:
+	if result["valid"]:
+		if verbose:
+			typer.secho(f"{prefix}Config is valid", fg=typer.colors.GREEN, bold=True)
+		if result["warnings"]:
+			typer.secho("warnings:", fg=typer.colors.YELLOW, bold=True)
+			for w in result["warnings"]:
+				typer.secho(f" - {w}", fg=typer.colors.YELLOW)
+		return
+
+	typer.secho(f"{prefix}Config Validation Failed", fg=typer.colors.RED, bold=True)
+	typer.echo(result["error"])
+	if result["details"]:
+		typer.secho("Details:", fg=typer.colors.RED)
+		for d in result["details"]:
+			typer.echo(f" - {d}")
+
+
+def validate(
+	config: Path | Sequence[str | Path],
+	strict: bool = True,
+	output: str | None = None,
+	verbose: bool = True,
+	use_cache: bool = True,
+	jobs: int | None = None
+) -> None:
+	"""Validates one or more config files; exits 1 if any of them is invalid.
+
+	A single file is reported as before. Several files, from repeated paths,
+	globs or directories, are validated across a process pool and reported
+	one result per file, as NDJSON with ``output="json"``.
+	"""
+
+	paths = [config] if isinstance(config, (str, Path)) else list(config)
+	files = expand_paths(paths)
+	fmt = output.lower() if output is not None else None
+
+	if len(paths) == 1 and files == [Path(paths[0])] and fmt != "ndjson":
+		result = validate_file(files[0], strict=strict, use_cache=use_cache)
+		if fmt == "json":
+			typer.echo(json.dumps(result, indent=2))
 		else:
-			typer.secho("Config Validation Failed", fg=typer.colors.RED, bold=True)
-			typer.echo(str(e)) 
-			details = getattr(e, "details", None)
-			if details:
-				typer.secho("Details:", fg=typer.colors.RED)
-				for d in details:
-					typer.echo(f" - {d}")
-		raise typer.Exit(code=0) 
+			_echo_text(result, verbose)
+		raise typer.Exit(code=0 if result["valid"] else 1)
+
+	invalid = 0
+	for file, result in zip(files, _validate_many(files, strict, use_cache, jobs or os.cpu_count() or 1)):
+		invalid += not result["valid"]
+		if fmt in ("json", "ndjson"):
+			typer.echo(json.dumps({"file": str(file), **result}))
+		else:
+			_echo_text(result, verbose or not result["valid"], prefix=f"{file}: ")
+
+	if fmt not in ("json", "ndjson"):
+		summary = f"{len(files)} files, {len(files) - invalid} valid, {invalid} invalid"
+		typer.secho(summary, fg=typer.colors.RED if invalid else typer.colors.GREEN, bold=True)
+	raise typer.Exit(code=1 if invalid else 0)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 from pathlib import Path
 import typer 
-from zyro.cli.commands.validate import validate as validate_func
-from zyro.cli.commands.start import start as start_func 
+
+# Command modules are imported when their command runs: `start` pulls in
+# FastAPI and uvicorn, which `validate` and `--help` don't need.
 
 zyro = typer.Typer(
 	name="zyro",
@@ -12,11 +13,14 @@ zyro = typer.Typer(
 
 @zyro.command("validate")
 def validate(
-		config: Path = typer.Option(
-			..., 
+		paths: list[str] | None = typer.Argument(
+			None, 
+			help="More config files, globs or directories"
+		),
+		config: list[str] | None = typer.Option(
+			None, 
 			"--config", "-c", 
-			exists=True, dir_okay=False, readable=True, 
-			help="Path to config file"
+			help="Config file, glob or directory; repeatable"
 		), 
 		strict: bool = typer.Option(
 			True, 
@@ -25,11 +29,26 @@ def validate(
 		),
 		output: str | None = typer.Option(
 			None, "--output", 
-			help="Output path/format"
+			help="Output format (json, ndjson)"
+		),
+		jobs: int | None = typer.Option(
+			None, 
+			"--jobs", "-j", 
+			min=1, 
+			help="Processes validating files in parallel; defaults to the CPU count"
+		),
+		no_cache: bool = typer.Option(
+			False, 
+			"--no-cache", 
+			help="Ignore and don't write the compiled config cache"
 		)
 	) -> None: 
-	"""Validates the config file."""
-	validate_func(config=config, strict=strict, output=output) 
+	"""Validates config files; exits 1 if any of them is invalid."""
+	targets = [*(config or []), *(paths or [])]
+	if not targets:
+		raise typer.BadParameter("Pass at least one config file", param_hint="'--config'")
+	from zyro.cli.commands.validate import validate as validate_func
+	validate_func(config=targets, strict=strict, output=output, use_cache=not no_cache, jobs=jobs) 
 
 @zyro.command("start")
 def start(
@@ -43,10 +62,171 @@ def start(
 				False, 
 				"--detach", "-d", 
 				help="Run server in background (detached mode)" 
-			)
+			),
+		no_cache: bool = typer.Option(
+			False, 
+			"--no-cache", 
+			help="Ignore and don't write the compiled config cache"
+		),
+		instance: str = typer.Option(
+			"default", 
+			"--instance", "-i", 
+			help="Instance id, to run the same config more than once"
+		)
 	) -> None:
 	"""Spins up a fastapi server."""
-	start_func(config=config, detach=detach)  
+	from zyro.cli.commands.start import start as start_func
+	start_func(config=config, detach=detach, use_cache=not no_cache, instance=instance)  
+
+@zyro.command("bench")
+def bench(
+		config: Path = typer.Option(
+			..., 
+			"--config", "-c", 
+			exists=True, dir_okay=False, readable=True, 
+			help="Path to config file" 
+		), 
+		concurrency: int = typer.Option(
+			10, 
+			"--concurrency", "-n", 
+			min=1, 
+			help="Concurrent clients per route"
+		),
+		duration: float = typer.Option(
+			2.0, 
+			"--duration", "-d", 
+			min=0.1, 
+			help="Seconds to load each route"
+		),
+		match: str | None = typer.Option(
+			None, "--match", 
+			help="Only benchmark routes whose path contains this text"
+		),
+		output: str | None = typer.Option(
+			None, "--output", 
+			help="Output format (json)"
+		),
+		no_cache: bool = typer.Option(
+			False, 
+			"--no-cache", 
+			help="Ignore and don't write the compiled config cache"
+		)
+	) -> None:
+	"""Load-tests every route and reports RPS and latency."""
+	from zyro.cli.commands.bench import bench as bench_func
+	bench_func(
+		config=config, concurrency=concurrency, duration=duration, 
+		match=match, output=output, use_cache=not no_cache
+	)
+
+@zyro.command("status")
+def status(
+		config: Path | None = typer.Option(
+			None, 
+			"--config", "-c", 
+			dir_okay=False, 
+			help="Only servers of this config file"
+		), 
+		instance: str | None = typer.Option(
+			None, 
+			"--instance", "-i", 
+			help="Only this instance id"
+		),
+		output: str | None = typer.Option(
+			None, "--output", 
+			help="Output format (json)"
+		),
+		prune: bool = typer.Option(
+			False, 
+			"--prune", 
+			help="Forget servers that are no longer running"
+		)
+	) -> None:
+	"""Lists running servers, their workers and health."""
+	from zyro.cli.commands.status import status as status_func
+	status_func(config=config, instance=instance, output=output, prune=prune)
+
+@zyro.command("stop")
+def stop(
+		config: Path | None = typer.Option(
+			None, 
+			"--config", "-c", 
+			dir_okay=False, 
+			help="Stop the servers of this config file"
+		), 
+		instance: str | None = typer.Option(
+			None, 
+			"--instance", "-i", 
+			help="Only this instance id"
+		),
+		all_instances: bool = typer.Option(
+			False, 
+			"--all", 
+			help="Stop every registered server"
+		),
+		timeout: float = typer.Option(
+			10.0, 
+			"--timeout", "-t", 
+			min=0, 
+			help="Seconds to wait for a graceful shutdown before killing"
+		)
+	) -> None:
+	"""Stops running servers."""
+	from zyro.cli.commands.stop import stop as stop_func
+	stop_func(config=config, instance=instance, all_instances=all_instances, timeout=timeout)
+
+@zyro.command("restart")
+def restart(
+		config: Path = typer.Option(
+			..., 
+			"--config", "-c", 
+			exists=True, dir_okay=False, readable=True, 
+			help="Path to config file" 
+		), 
+		instance: str | None = typer.Option(
+			None, 
+			"--instance", "-i", 
+			help="Only this instance id"
+		),
+		timeout: float = typer.Option(
+			10.0, 
+			"--timeout", "-t", 
+			min=0, 
+			help="Seconds to wait for a graceful shutdown before killing"
+		),
+		no_cache: bool = typer.Option(
+			False, 
+			"--no-cache", 
+			help="Ignore and don't write the compiled config cache"
+		)
+	) -> None:
+	"""Stops a config's servers and starts them again in the background."""
+	from zyro.cli.commands.restart import restart as restart_func
+	restart_func(config=config, instance=instance, timeout=timeout, use_cache=not no_cache)
+
+@zyro.command("reload")
+def reload(
+		config: Path = typer.Option(
+			..., 
+			"--config", "-c", 
+			exists=True, dir_okay=False, readable=True, 
+			help="Path to config file" 
+		), 
+		instance: str | None = typer.Option(
+			None, 
+			"--instance", "-i", 
+			help="Only this instance id"
+		),
+		timeout: float = typer.Option(
+			120.0, 
+			"--timeout", "-t", 
+			min=0, 
+			help="Seconds to wait for the reload to finish"
+		)
+	) -> None:
+	"""Swaps in workers running the current config without dropping requests."""
+	from zyro.cli.commands.reload import reload as reload_func
+	reload_func(config=config, instance=instance, timeout=timeout)
 
 def main():
 	zyro() 
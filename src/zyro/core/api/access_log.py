@@ -0,0 +1,106 @@
+"""Sampled access logging with per-route rates and levels.
+
+Replaces uvicorn's access log, which writes a line for every request.
+"""
+from __future__ import annotations
+
+import logging
+import random
+from typing import Dict, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from zyro.core.config.schema import AccessLogConfig, RouteAccessLogConfig
+from zyro.core.logging import get_logger
+
+logger = get_logger("access")
+
+
+class AccessLogPolicy:
+	"""How often and at which level requests to a route are logged."""
+
+	__slots__ = ("sample_rate", "error_sample_rate", "level")
+
+	def __init__(self, sample_rate: float, error_sample_rate: float, level: int) -> None:
+		self.sample_rate = sample_rate
+		self.error_sample_rate = error_sample_rate
+		self.level = level
+
+	@classmethod
+	def from_config(
+		cls, config: AccessLogConfig, override: Optional[RouteAccessLogConfig] = None
+	) -> "AccessLogPolicy":
+		"""Server settings with the route's overrides applied."""
+
+		sample_rate, error_sample_rate, level = config.sample_rate, config.error_sample_rate, config.level
+		if override is not None:
+			if override.sample_rate is not None:
+				sample_rate = override.sample_rate
+			if override.error_sample_rate is not None:
+				error_sample_rate = override.error_sample_rate
+			if override.level is not None:
+				level = override.level
+		return cls(sample_rate, error_sample_rate, logging.getLevelName(level))
+
+	def should_log(self, status_code: int) -> bool:
+		rate = self.error_sample_rate if status_code >= 500 else self.sample_rate
+		return rate >= 1.0 or (rate > 0.0 and random.random() < rate)
+
+
+class AccessLogMiddleware:
+	"""Logs a sample of requests once their response has started.
+
+	``policies`` maps (method, route path) to the route's policy; requests
+	that match no route use ``default``.
+	"""
+
+	def __init__(
+		self,
+		app: ASGIApp,
+		default: AccessLogPolicy,
+		policies: Dict[Tuple[str, str], AccessLogPolicy],
+	) -> None:
+		self.app = app
+		self.default = default
+		self.policies = policies
+
+	async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+		if scope["type"] != "http":
+			await self.app(scope, receive, send)
+			return
+
+		status_code = 500
+
+		async def send_wrapper(message: Message) -> None:
+			nonlocal status_code
+			if message["type"] == "http.response.start":
+				status_code = message["status"]
+			await send(message)
+
+		try:
+			await self.app(scope, receive, send_wrapper)
+		finally:
+			self._log(scope, status_code)
+
+	def _log(self, scope: Scope, status_code: int) -> None:
+		route = scope.get("route")
+		policy = self.default
+		if route is not None:
+			policy = self.policies.get((scope["method"], getattr(route, "path", "")), self.default)
+
+		if not logger.isEnabledFor(policy.level) or not policy.should_log(status_code):
+			return
+
+		client = scope.get("client")
+		path = scope.get("root_path", "") + scope["path"]
+		if scope.get("query_string"):
+			path += "?" + scope["query_string"].decode("latin-1")
+		logger.log(
+			policy.level,
+			'%s - "%s %s HTTP/%s" %d',
+			f"{client[0]}:{client[1]}" if client else "-",
+			scope["method"],
+			path,
+			scope.get("http_version", "1.1"),
+			status_code,
+		)
@@ -0,0 +1,158 @@
+"""In-process load generator for the routes of a config."""
+from __future__ import annotations
+
+import asyncio
+import math
+import re
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI
+
+from zyro.core.api.fastapi_engine import create_app
+from zyro.core.api.router import full_path, mount_routes
+from zyro.core.config.schema import ZyroConfig
+from zyro.core.exceptions import ServerError
+
+try:
+	import httpx
+except ImportError:  # optional dependency, installed with the bench extra
+	httpx = None
+
+# Values sent for path parameters, by convertor.
+_SAMPLE_VALUES: Dict[str, str] = {
+	"str": "1",
+	"path": "1",
+	"int": "1",
+	"float": "1.0",
+	"uuid": "00000000-0000-0000-0000-000000000001",
+}
+_PARAM = re.compile(r"{([^}:]+)(?::([^}]+))?}")
+_BODY_METHODS = {"POST", "PUT", "PATCH"}
+
+
+def sample_path(path: str) -> str:
+	"""Fill the parameters of a route path with values its convertors accept."""
+	return _PARAM.sub(lambda m: _SAMPLE_VALUES.get(m.group(2) or "str", "1"), path)
+
+
+def percentile(ordered: List[float], pct: float) -> float:
+	"""Nearest-rank percentile of an already sorted list."""
+	if not ordered:
+		return 0.0
+	rank = max(1, math.ceil(pct / 100 * len(ordered)))
+	return ordered[min(rank, len(ordered)) - 1]
+
+
+@dataclass
+class RouteStats:
+	"""Results of benchmarking one route."""
+
+	method: str
+	path: str
+	url: str
+	requests: int = 0
+	errors: int = 0
+	elapsed: float = 0.0
+	latencies: List[float] = field(default_factory=list)
+	statuses: Dict[int, int] = field(default_factory=dict)
+
+	@property
+	def rps(self) -> float:
+		return self.requests / self.elapsed if self.elapsed else 0.0
+
+	@property
+	def error_rate(self) -> float:
+		return self.errors / self.requests if self.requests else 0.0
+
+	def summary(self) -> Dict[str, Any]:
+		ordered = sorted(self.latencies)
+		return {
+			"method": self.method,
+			"path": self.path,
+			"requests": self.requests,
+			"rps": round(self.rps, 1),
+			"p50_ms": round(percentile(ordered, 50) * 1000, 3),
+			"p95_ms": round(percentile(ordered, 95) * 1000, 3),
+			"p99_ms": round(percentile(ordered, 99) * 1000, 3),
+			"errors": self.errors,
+			"error_rate": round(self.error_rate, 4),
+			"statuses": {str(code): count for code, count in sorted(self.statuses.items())},
+		}
+
+
+def bench_app(configuration: ZyroConfig) -> FastAPI:
+	"""The app exactly as the server would mount it, minus hot reload."""
+	app = create_app(configuration.project, configuration.server, configuration.schemas)
+	mount_routes(app, configuration.endpoints)
+	return app
+
+
+def bench_targets(configuration: ZyroConfig, match: Optional[str] = None) -> List[RouteStats]:
+	"""One empty result per configured route, optionally filtered by a path substring."""
+	targets = []
+	for group in configuration.endpoints:
+		for route in group.routes:
+			path = full_path(group.base_path, route.path) or "/"
+			if match is not None and match not in path:
+				continue
+			targets.append(RouteStats(route.method.upper(), path, sample_path(path)))
+	return targets
+
+
+async def _bench_route(client: httpx.AsyncClient, stats: RouteStats, concurrency: int, duration: float) -> None:
+	body = {} if stats.method in _BODY_METHODS else None
+
+	async def send() -> None:
+		start = perf_counter()
+		try:
+			response = await client.request(stats.method, stats.url, json=body)
+		except Exception:
+			stats.statuses[0] = stats.statuses.get(0, 0) + 1
+			stats.errors += 1
+		else:
+			stats.statuses[response.status_code] = stats.statuses.get(response.status_code, 0) + 1
+			if response.status_code >= 400:
+				stats.errors += 1
+		stats.latencies.append(perf_counter() - start)
+		stats.requests += 1
+
+	async def worker(deadline: float) -> None:
+		while perf_counter() < deadline:
+			await send()
+
+	# Warm up lazy handlers and caches outside the measured window.
+	await send()
+	stats.requests, stats.errors = 0, 0
+	stats.latencies.clear()
+	stats.statuses.clear()
+
+	start = perf_counter()
+	deadline = start + duration
+	await asyncio.gather(*(worker(deadline) for _ in range(concurrency)))
+	stats.elapsed = perf_counter() - start
+
+
+async def run_bench(
+	configuration: ZyroConfig,
+	concurrency: int = 10,
+	duration: float = 2.0,
+	match: Optional[str] = None,
+) -> List[RouteStats]:
+	"""Drive every route in turn for ``duration`` seconds with ``concurrency`` clients.
+
+	Requests go straight to the ASGI app, so results measure zyro and the
+	handlers without network or server overhead.
+	"""
+	if httpx is None:
+		raise ServerError("zyro bench needs httpx: install zyro[bench]")
+	app = bench_app(configuration)
+	targets = bench_targets(configuration, match)
+
+	transport = httpx.ASGITransport(app=app)
+	async with app.router.lifespan_context(app):
+		async with httpx.AsyncClient(transport=transport, base_url="http://zyro.bench") as client:
+			for stats in targets:
+				await _bench_route(client, stats, concurrency, duration)
+	return targets
@@ -0,0 +1,372 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import unquote, urlparse
+
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response
+
+from zyro.core.api.responses import PrecompiledResponse, RawHeaders
+from zyro.core.config.schema import CacheVaryConfig, RouteCacheConfig
+from zyro.core.logging import get_logger
+
+logger = get_logger("cache")
+
+_CACHEABLE_METHODS = {"GET", "HEAD"}
+# Set per served response rather than stored with the entry.
+_DYNAMIC_HEADERS = {b"etag", b"cache-control", b"age", b"vary"}
+# Credentials always split the key so one user's response never reaches another.
+PRIVATE_HEADERS = ["authorization", "cookie"]
+
+
+@dataclass
+class CacheEntry:
+	"""A cached response body with the headers needed to replay it."""
+
+	status_code: int
+	raw_headers: RawHeaders
+	body: bytes
+	etag: str
+	expires_at: float
+
+	def encode(self) -> bytes:
+		"""Serialize for the shared and redis backends."""
+		headers = [[k.decode("latin-1"), v.decode("latin-1")] for k, v in self.raw_headers]
+		meta = json.dumps([self.status_code, self.etag, self.expires_at, headers])
+		return meta.encode("utf-8") + b"\n" + self.body
+
+	@classmethod
+	def decode(cls, data: bytes) -> "CacheEntry":
+		meta, _, body = data.partition(b"\n")
+		status_code, etag, expires_at, headers = json.loads(meta)
+		raw_headers = [(k.encode("latin-1"), v.encode("latin-1")) for k, v in headers]
+		return cls(status_code, raw_headers, body, etag, expires_at)
+
+
+class MemoryBackend:
+	"""In-process LRU bounded by entry count and total body size."""
+
+	def __init__(self, max_entries: int, max_bytes: int) -> None:
+		self.max_entries = max_entries
+		self.max_bytes = max_bytes
+		self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+		self._bytes = 0
+
+	async def get(self, key: str) -> Optional[CacheEntry]:
+		entry = self._entries.get(key)
+		if entry is None:
+			return None
+		if entry.expires_at <= time.time():
+			self._discard(key)
+			return None
+		self._entries.move_to_end(key)
+		return entry
+
+	async def set(self, key: str, entry: CacheEntry) -> None:
+		if len(entry.body) > self.max_bytes:
+			return
+		self._discard(key)
+		self._entries[key] = entry
+		self._bytes += len(entry.body)
+		while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+			_, evicted = self._entries.popitem(last=False)
+			self._bytes -= len(evicted.body)
+
+	def _discard(self, key: str) -> None:
+		entry = self._entries.pop(key, None)
+		if entry is not None:
+			self._bytes -= len(entry.body)
+
+
+class SharedMemoryBackend:
+	"""Cache shared by all workers on the host, kept in SQLite on tmpfs.
+
+	Queries run in the thread pool, as they can wait on another worker's lock.
+	"""
+
+	# Trim the route's rows back to max_entries every this many writes.
+	_TRIM_EVERY = 32
+
+	def __init__(self, namespace: str, route_key: str, max_entries: int) -> None:
+		directory = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+		self.path = os.path.join(directory, f"zyro-cache-{namespace}.sqlite3")
+		self.route_key = route_key
+		self.max_entries = max_entries
+		self._conn: Optional[sqlite3.Connection] = None
+		self._pid: Optional[int] = None
+		self._writes = 0
+		# One connection per process, used by one pool thread at a time.
+		self._lock = threading.Lock()
+
+	def _connect(self) -> sqlite3.Connection:
+		# Connections must not cross a fork.
+		if self._conn is None or self._pid != os.getpid():
+			conn = sqlite3.connect(self.path, timeout=0.05, isolation_level=None, check_same_thread=False)
+			conn.execute("PRAGMA journal_mode=WAL")
+			conn.execute("PRAGMA synchronous=OFF")
+			conn.execute(
+				"CREATE TABLE IF NOT EXISTS cache ("
+				"key TEXT PRIMARY KEY, route TEXT NOT NULL, expires_at REAL NOT NULL, data BLOB NOT NULL)"
+			)
+			conn.execute("CREATE INDEX IF NOT EXISTS cache_route ON cache (route, expires_at)")
+			self._conn, self._pid = conn, os.getpid()
+		return self._conn
+
+	async def get(self, key: str) -> Optional[CacheEntry]:
+		return await run_in_threadpool(self._get, key)
+
+	async def set(self, key: str, entry: CacheEntry) -> None:
+		await run_in_threadpool(self._set, key, entry.expires_at, entry.encode())
+
+	def _get(self, key: str) -> Optional[CacheEntry]:
+		try:
+			with self._lock:
+				row = self._connect().execute(
+					"SELECT data FROM cache WHERE key = ? AND expires_at > ?", (key, time.time())
+				).fetchone()
+		except sqlite3.Error as e:
+			logger.debug("Shared cache read failed: %s", e)
+			return None
+		return CacheEntry.decode(row[0]) if row else None
+
+	def _set(self, key: str, expires_at: float, data: bytes) -> None:
+		try:
+			with self._lock:
+				conn = self._connect()
+				conn.execute(
+					"INSERT OR REPLACE INTO cache (key, route, expires_at, data) VALUES (?, ?, ?, ?)",
+					(key, self.route_key, expires_at, data),
+				)
+				self._writes += 1
+				if self._writes % self._TRIM_EVERY == 0:
+					self._trim(conn)
+		except sqlite3.Error as e:
+			# Busy or locked: skip this write rather than wait on it.
+			logger.debug("Shared cache write failed: %s", e)
+
+	def _trim(self, conn: sqlite3.Connection) -> None:
+		conn.execute("DELETE FROM cache WHERE route = ? AND expires_at <= ?", (self.route_key, time.time()))
+		(count,) = conn.execute("SELECT COUNT(*) FROM cache WHERE route = ?", (self.route_key,)).fetchone()
+		if count > self.max_entries:
+			conn.execute(
+				"DELETE FROM cache WHERE key IN "
+				"(SELECT key FROM cache WHERE route = ? ORDER BY expires_at LIMIT ?)",
+				(self.route_key, count - self.max_entries),
+			)
+
+
+class RedisError(Exception):
+	"""Error reply or protocol failure talking to a Redis-compatible server."""
+
+
+class RedisClient:
+	"""Minimal RESP client, enough for GET and SET with an expiry."""
+
+	_TIMEOUT = 1.0
+
+	def __init__(self, url: str) -> None:
+		parsed = urlparse(url)
+		self.host = parsed.hostname or "127.0.0.1"
+		self.port = parsed.port or 6379
+		self.password = unquote(parsed.password) if parsed.password else None
+		self.db = int(parsed.path.lstrip("/") or 0)
+		self._reader: Optional[asyncio.StreamReader] = None
+		self._writer: Optional[asyncio.StreamWriter] = None
+		self._lock = asyncio.Lock()
+
+	async def _connect(self) -> None:
+		self._reader, self._writer = await asyncio.wait_for(
+			asyncio.open_connection(self.host, self.port), self._TIMEOUT
+		)
+		if self.password:
+			await self._call(b"AUTH", self.password.encode())
+		if self.db:
+			await self._call(b"SELECT", str(self.db).encode())
+
+	async def _call(self, *args: bytes) -> Any:
+		assert self._reader is not None and self._writer is not None
+		parts = [b"*%d\r\n" % len(args)]
+		for arg in args:
+			parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+		self._writer.write(b"".join(parts))
+		await self._writer.drain()
+		return await asyncio.wait_for(self._read_reply(), self._TIMEOUT)
+
+	async def _read_reply(self) -> Any:
+		assert self._reader is not None
+		line = await self._reader.readuntil(b"\r\n")
+		kind, payload = line[:1], line[1:-2]
+		if kind == b"+":
+			return payload
+		if kind == b"-":
+			raise RedisError(payload.decode("utf-8", "replace"))
+		if kind == b":":
+			return int(payload)
+		if kind == b"$":
+			length = int(payload)
+			if length < 0:
+				return None
+			data = await self._reader.readexactly(length + 2)
+			return data[:-2]
+		if kind == b"*":
+			count = int(payload)
+			return None if count < 0 else [await self._read_reply() for _ in range(count)]
+		raise RedisError(f"Unexpected reply: {line!r}")
+
+	async def execute(self, *args: bytes) -> Any:
+		"""Send one command, reconnecting if the connection was lost."""
+		async with self._lock:
+			try:
+				if self._writer is None or self._writer.is_closing():
+					await self._connect()
+				return await self._call(*args)
+			except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError) as e:
+				if self._writer is not None:
+					self._writer.close()
+				self._reader = self._writer = None
+				raise RedisError(str(e)) from e
+
+
+_redis_clients: Dict[str, RedisClient] = {}
+
+
+class RedisBackend:
+	"""Cache stored on a Redis-compatible server, shared by every worker and host."""
+
+	def __init__(self, url: str, namespace: str) -> None:
+		if url not in _redis_clients:
+			_redis_clients[url] = RedisClient(url)
+		self.client = _redis_clients[url]
+		self.prefix = f"zyro:{namespace}:"
+
+	async def get(self, key: str) -> Optional[CacheEntry]:
+		try:
+			data = await self.client.execute(b"GET", (self.prefix + key).encode())
+		except RedisError as e:
+			logger.warning("Redis cache read failed: %s", e)
+			return None
+		return CacheEntry.decode(data) if data else None
+
+	async def set(self, key: str, entry: CacheEntry) -> None:
+		ttl_ms = int((entry.expires_at - time.time()) * 1000)
+		if ttl_ms <= 0:
+			return
+		try:
+			await self.client.execute(
+				b"SET", (self.prefix + key).encode(), entry.encode(), b"PX", str(ttl_ms).encode()
+			)
+		except RedisError as e:
+			logger.warning("Redis cache write failed: %s", e)
+
+
+def create_backend(config: RouteCacheConfig, route_key: str, namespace: str) -> Any:
+	if config.backend == "shared":
+		return SharedMemoryBackend(namespace, route_key, config.max_entries)
+	if config.backend == "redis":
+		return RedisBackend(config.url or "", namespace)
+	return MemoryBackend(config.max_entries, config.max_bytes)
+
+
+def cache_key(route_key: str, request: Request, vary_by: CacheVaryConfig, headers: List[str]) -> str:
+	"""Key for a request from the route and the request parts it varies by."""
+
+	parts = [route_key]
+	if vary_by.path_params:
+		parts.extend(f"p:{k}={v}" for k, v in sorted(request.path_params.items()))
+	if vary_by.query is True:
+		parts.extend(f"q:{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+	elif vary_by.query:
+		parts.extend(f"q:{k}={v}" for k in vary_by.query for v in request.query_params.getlist(k))
+	parts.extend(f"h:{name}={request.headers.get(name, '')}" for name in headers)
+	return hashlib.blake2b("\x00".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _make_entry(response: Response, ttl: float) -> Optional[CacheEntry]:
+	"""Snapshot a response for the cache, or None when it must not be cached."""
+
+	body = getattr(response, "body", None)
+	if not isinstance(body, bytes) or response.background is not None:
+		return None
+	if not 200 <= response.status_code < 300 or response.status_code == 206:
+		return None
+
+	etag = None
+	raw_headers: RawHeaders = []
+	for name, value in response.raw_headers:
+		if name == b"set-cookie":
+			return None
+		if name == b"cache-control" and b"no-store" in value:
+			return None
+		if name == b"etag":
+			etag = value.decode("latin-1")
+		elif name not in _DYNAMIC_HEADERS:
+			raw_headers.append((name, value))
+
+	if etag is None:
+		etag = '"%s"' % hashlib.blake2b(body, digest_size=12).hexdigest()
+	return CacheEntry(response.status_code, raw_headers, body, etag, time.time() + ttl)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+	if if_none_match.strip() == "*":
+		return True
+	bare = etag[2:] if etag.startswith("W/") else etag
+	for candidate in if_none_match.split(","):
+		candidate = candidate.strip()
+		if candidate.startswith("W/"):
+			candidate = candidate[2:]
+		if candidate == bare:
+			return True
+	return False
+
+
+def cached_handler(endpoint: Callable, route_key: str, config: RouteCacheConfig, namespace: str) -> Callable:
+	"""Wrap an endpoint with the route's response cache."""
+
+	backend = create_backend(config, route_key, namespace)
+	vary_headers = PRIVATE_HEADERS + [
+		name.lower() for name in config.vary_by.headers if name.lower() not in PRIVATE_HEADERS
+	]
+	vary_value = ", ".join(vary_headers).encode("latin-1")
+
+	def serve(entry: CacheEntry, request: Request) -> Response:
+		max_age = max(0, int(entry.expires_at - time.time()))
+		# Responses to a user's credentials must not be kept by shared caches.
+		private = config.private or any(name in request.headers for name in PRIVATE_HEADERS)
+		headers = [
+			(b"etag", entry.etag.encode("latin-1")),
+			(b"cache-control", b"%s, max-age=%d" % (b"private" if private else b"public", max_age)),
+			(b"vary", vary_value),
+		]
+
+		if_none_match = request.headers.get("if-none-match")
+		if if_none_match and _etag_matches(if_none_match, entry.etag):
+			return PrecompiledResponse(b"", 304, headers)
+		return PrecompiledResponse(entry.body, entry.status_code, entry.raw_headers + headers)
+
+	async def handler(request: Request) -> Response:
+		if request.method not in _CACHEABLE_METHODS:
+			return await endpoint(request)
+
+		key = cache_key(route_key, request, config.vary_by, vary_headers)
+		entry = await backend.get(key)
+		if entry is None:
+			response = await endpoint(request)
+			entry = _make_entry(response, config.ttl)
+			if entry is None:
+				return response
+			await backend.set(key, entry)
+		return serve(entry, request)
+
+	return handler
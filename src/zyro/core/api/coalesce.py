@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Callable, Dict, List
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from zyro.core.api.cache import PRIVATE_HEADERS, cache_key
+from zyro.core.api.responses import PrecompiledResponse
+from zyro.core.config.schema import CacheVaryConfig, RouteConfig
+
+_COALESCE_METHODS = {"GET", "HEAD"}
+
+
+def _share(response: Response) -> Response:
+	"""Copy of a response for another waiter on the same execution."""
+
+	body = getattr(response, "body", None)
+	if not isinstance(body, bytes):
+		raise TypeError("streaming responses cannot be shared")
+	return PrecompiledResponse(body, response.status_code, response.raw_headers)
+
+
+def coalesced_handler(endpoint: Callable, route_key: str, route: RouteConfig) -> Callable:
+	"""Let concurrent identical GET requests share one handler execution."""
+
+	inflight: Dict[str, asyncio.Task] = {}
+	vary_by = route.cache.vary_by if route.cache is not None else CacheVaryConfig()
+	headers: List[str] = PRIVATE_HEADERS + [
+		name.lower() for name in vary_by.headers if name.lower() not in PRIVATE_HEADERS
+	]
+
+	async def handler(request: Request) -> Response:
+		if request.method not in _COALESCE_METHODS:
+			return await endpoint(request)
+
+		key = cache_key(route_key, request, vary_by, headers)
+		task = inflight.get(key)
+		if task is None:
+			# Run in its own task so the leader's disconnect doesn't cancel everyone.
+			task = asyncio.ensure_future(endpoint(request))
+			inflight[key] = task
+			task.add_done_callback(lambda _: inflight.pop(key, None))
+			return await asyncio.shield(task)
+
+		response = await asyncio.shield(task)
+		try:
+			return _share(response)
+		except TypeError:
+			return await endpoint(request)
+
+	return handler
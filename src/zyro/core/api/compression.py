@@ -0,0 +1,155 @@
+"""Response compression (br, zstd, gzip) applied chunk by chunk.
+
+Bodies are compressed as they are sent, so streamed responses stay streamed
+and large bodies are never buffered in full.
+"""
+from __future__ import annotations
+
+import zlib
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from zyro.core.api.responses import accepted_encodings
+from zyro.core.config.schema import CompressionConfig
+
+try:
+	import brotli
+except ImportError:  # optional dependency
+	brotli = None
+
+try:
+	import zstandard
+except ImportError:  # optional dependency
+	zstandard = None
+
+# (compress chunk, flush what was compressed so far, finish the stream)
+Compressor = Tuple[Callable[[bytes], bytes], Callable[[], bytes], Callable[[], bytes]]
+
+
+def _gzip(config: CompressionConfig) -> Compressor:
+	compressor = zlib.compressobj(config.gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+	return compressor.compress, lambda: compressor.flush(zlib.Z_SYNC_FLUSH), compressor.flush
+
+
+def _brotli(config: CompressionConfig) -> Compressor:
+	compressor = brotli.Compressor(quality=config.brotli_quality)
+	return compressor.process, compressor.flush, compressor.finish
+
+
+def _zstd(config: CompressionConfig) -> Compressor:
+	compressor = zstandard.ZstdCompressor(level=config.zstd_level).compressobj()
+	return (
+		compressor.compress,
+		lambda: compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK),
+		compressor.flush,
+	)
+
+
+def available_compressors() -> Dict[str, Callable[[CompressionConfig], Compressor]]:
+	"""Encodings whose libraries are installed."""
+
+	compressors: Dict[str, Callable[[CompressionConfig], Compressor]] = {"gzip": _gzip}
+	if brotli is not None:
+		compressors["br"] = _brotli
+	if zstandard is not None:
+		compressors["zstd"] = _zstd
+	return compressors
+
+
+class CompressionMiddleware:
+	"""Compresses eligible responses with the best encoding the client accepts.
+
+	``excluded`` holds the (method, route path) of routes that opted out.
+	"""
+
+	def __init__(self, app: ASGIApp, config: CompressionConfig, excluded: Set[Tuple[str, str]]) -> None:
+		self.app = app
+		self.config = config
+		self.excluded = excluded
+		installed = available_compressors()
+		# Server preference order, limited to what is installed.
+		self.compressors = [(encoding, installed[encoding]) for encoding in config.algorithms if encoding in installed]
+		self.exact_types = {t for t in config.content_types if not t.endswith("/*")}
+		self.type_prefixes = tuple(t[:-1] for t in config.content_types if t.endswith("/*"))
+
+	async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+		if scope["type"] != "http":
+			await self.app(scope, receive, send)
+			return
+
+		selected = self._negotiate(Headers(scope=scope).get("accept-encoding", ""))
+		if selected is None:
+			await self.app(scope, receive, send)
+			return
+
+		encoding, factory = selected
+		start: Optional[Message] = None
+		compressor: Optional[Compressor] = None
+		passthrough = False
+
+		async def send_wrapper(message: Message) -> None:
+			nonlocal start, compressor, passthrough
+			if passthrough or message["type"] not in ("http.response.start", "http.response.body"):
+				await send(message)
+				return
+
+			if message["type"] == "http.response.start":
+				# Hold the headers until the first chunk shows whether to compress.
+				start = message
+				return
+
+			body = message.get("body", b"")
+			more_body = message.get("more_body", False)
+
+			if compressor is None:
+				assert start is not None
+				headers = MutableHeaders(raw=start["headers"])
+				if not self._eligible(scope, start["status"], headers) or (
+					not more_body and len(body) < self.config.min_size
+				):
+					passthrough = True
+					await send(start)
+					await send(message)
+					return
+
+				compressor = factory(self.config)
+				del headers["content-length"]
+				headers["content-encoding"] = encoding
+				headers.add_vary_header("Accept-Encoding")
+				if not more_body:
+					body = compressor[0](body) + compressor[2]()
+					headers["content-length"] = str(len(body))
+					await send(start)
+					await send({"type": "http.response.body", "body": body})
+					return
+				await send(start)
+
+			compress, flush, finish = compressor
+			# Flush every chunk so streamed records (SSE, NDJSON) reach the
+			# client as they are sent, not when the stream ends.
+			chunk = compress(body) + (flush() if more_body else finish())
+			await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+		await self.app(scope, receive, send_wrapper)
+
+	def _negotiate(self, accept_encoding: str) -> Optional[Tuple[str, Callable[[CompressionConfig], Compressor]]]:
+		if not accept_encoding:
+			return None
+		accepted = accepted_encodings(accept_encoding)
+		for encoding, factory in self.compressors:
+			if encoding in accepted or "*" in accepted:
+				return encoding, factory
+		return None
+
+	def _eligible(self, scope: Scope, status_code: int, headers: MutableHeaders) -> bool:
+		if status_code < 200 or status_code in (204, 304) or "content-encoding" in headers:
+			return False
+
+		route = scope.get("route")
+		if route is not None and (scope["method"], getattr(route, "path", "")) in self.excluded:
+			return False
+
+		media_type = headers.get("content-type", "").partition(";")[0].strip().lower()
+		return media_type in self.exact_types or media_type.startswith(self.type_prefixes)
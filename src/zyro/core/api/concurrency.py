@@ -0,0 +1,135 @@
+"""Admission control: per-route and server-wide limits on concurrent handler runs.
+
+Requests over the limit wait in a bounded FIFO queue; when the queue is full
+or the wait times out they are rejected at once instead of piling up latency
+for everyone else.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Any, AsyncIterator, Callable, Deque, List, Optional
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+from zyro.core.config.schema import ConcurrencyConfig
+
+
+class ConcurrencyLimiter:
+	"""A FIFO semaphore with a bounded wait queue and a wait timeout."""
+
+	__slots__ = ("limit", "max_queue", "queue_timeout", "reject_status", "active", "_waiters")
+
+	def __init__(self, config: ConcurrencyConfig) -> None:
+		self.limit = config.max_concurrency
+		self.max_queue = config.max_queue
+		self.queue_timeout = config.queue_timeout
+		self.reject_status = config.reject_status
+		self.active = 0
+		self._waiters: Deque[asyncio.Future] = deque()
+
+	async def acquire(self) -> bool:
+		"""Take a slot; False when the queue is full or the wait timed out."""
+
+		if self.active < self.limit and not self._waiters:
+			self.active += 1
+			return True
+		if len(self._waiters) >= self.max_queue:
+			return False
+
+		waiter = asyncio.get_running_loop().create_future()
+		self._waiters.append(waiter)
+		try:
+			# A releasing request hands its slot over by resolving the future.
+			await asyncio.wait_for(waiter, self.queue_timeout)
+			return True
+		except BaseException as e:
+			if waiter.done() and not waiter.cancelled():
+				# The slot arrived just as we gave up; pass it on.
+				self.release()
+			else:
+				try:
+					self._waiters.remove(waiter)
+				except ValueError:
+					pass
+			if isinstance(e, asyncio.TimeoutError):
+				return False
+			raise
+
+	def release(self) -> None:
+		while self._waiters:
+			waiter = self._waiters.popleft()
+			if not waiter.done():
+				waiter.set_result(None)
+				return
+		self.active -= 1
+
+
+class _ReleasingIterator:
+	"""Holds slots until a stream ends, fails or is dropped unsent."""
+
+	def __init__(self, iterator: AsyncIterator[Any], release: Callable[[], None]) -> None:
+		self._iterator = iterator
+		self._release: Optional[Callable[[], None]] = release
+
+	def __aiter__(self) -> "_ReleasingIterator":
+		return self
+
+	async def __anext__(self) -> Any:
+		try:
+			return await self._iterator.__anext__()
+		except BaseException:
+			self.close()
+			raise
+
+	def close(self) -> None:
+		release, self._release = self._release, None
+		if release is not None:
+			release()
+
+	def __del__(self) -> None:
+		self.close()
+
+
+def busy_response(limiter: ConcurrencyLimiter) -> Response:
+	return JSONResponse(
+		{"detail": "Server is busy, try again later"},
+		status_code=limiter.reject_status,
+		headers={"retry-after": "1"},
+	)
+
+
+def limited_handler(endpoint: Callable, limiters: List[ConcurrencyLimiter]) -> Callable:
+	"""Wrap an endpoint so it only runs while holding a slot of every limiter.
+
+	Limiters are acquired in order, route before server, so a request queued
+	on a busy route doesn't hold a server-wide slot meanwhile.
+	"""
+
+	async def limited(request: Request) -> Response:
+		acquired: List[ConcurrencyLimiter] = []
+
+		def release() -> None:
+			while acquired:
+				acquired.pop().release()
+
+		try:
+			for limiter in limiters:
+				if not await limiter.acquire():
+					release()
+					return busy_response(limiter)
+				acquired.append(limiter)
+			response = await endpoint(request)
+		except BaseException:
+			release()
+			raise
+
+		if isinstance(response, StreamingResponse):
+			response.body_iterator = _ReleasingIterator(response.body_iterator, release)
+		else:
+			release()
+		return response
+
+	return limited
+
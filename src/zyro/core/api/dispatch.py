@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from typing import Any, List, Optional
+
+from fastapi import FastAPI
+from starlette.convertors import CONVERTOR_TYPES
+from starlette.routing import Route
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from zyro.core.config.route_index import ANY_METHOD, RouteTrie
+
+try:
+	from starlette._utils import get_route_path
+except ImportError:  # older Starlette
+	def get_route_path(scope: Scope) -> str:
+		return scope["path"]
+
+
+class TrieDispatcher:
+	"""Dispatches requests through a route trie instead of scanning every route.
+
+	Misses (404, 405, slash redirects) and routes the trie can't index go to
+	the regular router, so behaviour matches FastAPI's linear matching.
+	"""
+
+	def __init__(self, app: FastAPI, fallback: ASGIApp) -> None:
+		self.app = app
+		self.fallback = fallback
+		self._trie: Optional[RouteTrie] = None
+		self._routes: Optional[List[Any]] = None
+		self._count = -1
+
+	def _index(self) -> RouteTrie:
+		routes = self.app.router.routes
+		# Hot reload swaps in a new list; rebuild whenever the route list changes.
+		if self._trie is None or routes is not self._routes or len(routes) != self._count:
+			trie = RouteTrie()
+			for route in routes:
+				if isinstance(route, Route):
+					for method in sorted(route.methods or {ANY_METHOD}):
+						trie.insert(method, route.path, route)
+				else:
+					trie.add_unindexed()
+			self._trie, self._routes, self._count = trie, routes, len(routes)
+		return self._trie
+
+	async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+		if scope["type"] != "http":
+			await self.fallback(scope, receive, send)
+			return
+
+		match = self._index().match(scope["method"], get_route_path(scope))
+		if match is None:
+			await self.fallback(scope, receive, send)
+			return
+
+		indexed, values = match
+		route = indexed.payload
+		path_params = dict(scope.get("path_params", {}))
+		for name, convertor in zip(indexed.names, indexed.convertors):
+			path_params[name] = CONVERTOR_TYPES[convertor].convert(values[name])
+
+		scope.setdefault("router", self.app.router)
+		scope["route"] = route
+		scope.update({"endpoint": route.endpoint, "path_params": path_params})
+		await route.handle(scope, receive, send)
+
+
+def install_trie_dispatcher(app: FastAPI) -> None:
+	"""Put a trie dispatcher in front of the app's router."""
+
+	router = app.router
+	router.middleware_stack = TrieDispatcher(app, router.middleware_stack)
@@ -0,0 +1,70 @@
+"""Thread and process pools that route handlers can be offloaded to."""
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from zyro.core.config.schema import ServerConfig
+
+# Handlers resolved inside pool processes, by reference.
+_process_handlers: Dict[str, Callable] = {}
+
+
+def run_in_process(reference: str, kwargs: Dict[str, Any]) -> Any:
+	"""Entry point in a pool process: import the handler once and call it."""
+
+	from zyro.core.api.handlers import resolve_handler
+
+	target = _process_handlers.get(reference)
+	if target is None:
+		target = _process_handlers[reference] = resolve_handler(reference)
+	result = target(**kwargs)
+	if asyncio.iscoroutine(result):
+		result = asyncio.run(result)
+	return result
+
+
+class Executors:
+	"""The server's handler pools, started on first use in each worker process."""
+
+	def __init__(self, server_config: ServerConfig) -> None:
+		self.thread_pool_size = server_config.thread_pool_size
+		self.process_pool_size = server_config.process_pool_size or os.cpu_count() or 1
+		self._threads: Optional[ThreadPoolExecutor] = None
+		self._processes: Optional[ProcessPoolExecutor] = None
+		self._pid: Optional[int] = None
+
+	def _check_fork(self) -> None:
+		# Pools don't survive a fork; workers start their own.
+		if self._pid != os.getpid():
+			self._threads = self._processes = None
+			self._pid = os.getpid()
+
+	def thread_pool(self) -> ThreadPoolExecutor:
+		self._check_fork()
+		if self._threads is None:
+			self._threads = ThreadPoolExecutor(self.thread_pool_size, thread_name_prefix="zyro-handler")
+		return self._threads
+
+	def process_pool(self) -> ProcessPoolExecutor:
+		self._check_fork()
+		if self._processes is None:
+			# Workers run an event loop and logging threads; forking those is unsafe.
+			self._processes = ProcessPoolExecutor(
+				self.process_pool_size, mp_context=multiprocessing.get_context("spawn")
+			)
+		return self._processes
+
+	def shutdown(self) -> None:
+		if self._pid != os.getpid():
+			return
+		for pool in (self._threads, self._processes):
+			if pool is not None:
+				pool.shutdown(wait=False, cancel_futures=True)
+		self._threads = self._processes = None
+
+	async def on_shutdown(self) -> None:
+		self.shutdown()
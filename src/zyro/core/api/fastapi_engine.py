@@ -1,12 +1,72 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from fastapi import FastAPI 
-from zyro.core.config.schema import ProjectConfig, ServerConfig
+from zyro.core.config.schema import ProjectConfig, SchemasConfig, ServerConfig
+from zyro.core.api.dispatch import install_trie_dispatcher
+from zyro.core.api.metrics import create_registry
+from zyro.core.api.access_log import AccessLogMiddleware, AccessLogPolicy
+from zyro.core.api.models import ModelRegistry
+from zyro.core.api.responses import json_response_class
+from zyro.core.api.compression import CompressionMiddleware
+from zyro.core.api.concurrency import ConcurrencyLimiter
+from zyro.core.api.executors import Executors
 
-def create_app(project_config: ProjectConfig) -> FastAPI: 
+def create_app(
+		project_config: ProjectConfig, 
+		server_config: Optional[ServerConfig] = None, 
+		schemas_config: Optional[SchemasConfig] = None
+	) -> FastAPI: 
+	server_config = server_config or ServerConfig()
+	response_class = json_response_class(server_config.json_backend)
 	zyro_app = FastAPI(
 		title=project_config.name, 
 		version=project_config.version, 
-		description=project_config.description
+		description=project_config.description, 
+		default_response_class=response_class
 	)
+	# Routes mounted later read server-wide settings from here
+	zyro_app.state.server_config = server_config
+	zyro_app.state.json_response_class = response_class
+	# (method, path) -> mounted route, used to swap routes on hot reload
+	zyro_app.state.zyro_routes = {}
+	# Request/response models referenced by routes, compiled once
+	zyro_app.state.models = ModelRegistry(schemas_config)
+
+	# (method, path) -> access log policy, filled in as routes are mounted
+	zyro_app.state.access_log_policies = {}
+	zyro_app.add_middleware(
+		AccessLogMiddleware,
+		default=AccessLogPolicy.from_config(zyro_app.state.server_config.access_log),
+		policies=zyro_app.state.access_log_policies
+	)
+
+	# (method, path) of routes that opted out of compression
+	zyro_app.state.uncompressed_routes = set()
+	if server_config.compression.enabled:
+		zyro_app.add_middleware(
+			CompressionMiddleware, 
+			config=server_config.compression, 
+			excluded=zyro_app.state.uncompressed_routes
+		)
+
+	# (group, version, base_path) -> (rate limit config, limiter shared by the group's routes)
+	zyro_app.state.group_rate_limiters = {}
+
+	# Pools for handlers offloaded to threads or processes
+	zyro_app.state.executors = Executors(server_config)
+	zyro_app.router.on_shutdown.append(zyro_app.state.executors.on_shutdown)
+
+	# Shared by every route when the server caps concurrent handlers
+	zyro_app.state.concurrency_limiter = None
+	if server_config.concurrency.max_concurrency is not None:
+		zyro_app.state.concurrency_limiter = ConcurrencyLimiter(server_config.concurrency)
+
+	# Set before routes are mounted so each one is instrumented
+	zyro_app.state.metrics = None
+	metrics_config = zyro_app.state.server_config.metrics
+	if metrics_config.enabled:
+		create_registry(zyro_app.state.server_config).install(zyro_app, metrics_config.path)
+
+	if zyro_app.state.server_config.router == "trie":
+		install_trie_dispatcher(zyro_app)
 
 	return zyro_app 
\ No newline at end of file
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import importlib
+import inspect
+import os
+import sys
+import threading
+from functools import partial
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type
+
+from fastapi import HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
+from starlette.concurrency import run_in_threadpool
+
+from zyro.core.api.executors import Executors, run_in_process
+from zyro.core.exceptions import HandlerImportError, ZyroError
+from zyro.core.logging import get_logger
+
+logger = get_logger("handlers")
+
+# Seconds spent importing each handler module, in import order.
+_import_times: Dict[str, float] = {}
+
+# Annotations of path/query params that are converted before the call.
+_COERCIBLE = (int, float)
+
+_MISSING = object()
+
+
+def _import_module(name: str) -> Any:
+	"""Import a module, timing it when it was not loaded yet."""
+
+	module = sys.modules.get(name)
+	if module is not None:
+		return module
+
+	cwd = os.getcwd()
+	if cwd not in sys.path:
+		# Handlers live in the project, not next to the zyro entry point.
+		sys.path.insert(0, cwd)
+
+	start = perf_counter()
+	module = importlib.import_module(name)
+	_import_times[name] = perf_counter() - start
+	return module
+
+
+def _import_prefix(parts: List[str]) -> Tuple[Any, List[str]]:
+	"""Import the longest importable module prefix of a dotted reference."""
+
+	for i in range(len(parts) - 1, 0, -1):
+		module_name = ".".join(parts[:i])
+		try:
+			return _import_module(module_name), parts[i:]
+		except ModuleNotFoundError as e:
+			# Only keep shortening when the missing module is the one we tried.
+			if e.name is None or not module_name.startswith(e.name):
+				raise
+	raise ModuleNotFoundError(f"No module found for {'.'.join(parts)!r}", name=parts[0])
+
+
+def import_reference(
+	reference: str, error: Type[ZyroError] = HandlerImportError, kind: str = "handler"
+) -> Any:
+	"""Import the object behind 'pkg.module:attr' or 'pkg.module.attr'.
+
+	Failures are raised as ``error``, with ``kind`` naming what was imported.
+	"""
+
+	reference = reference.strip()
+	try:
+		if ":" in reference:
+			module_name, _, attr_path = reference.partition(":")
+			if not module_name or not attr_path:
+				raise error(f"Invalid {kind} reference: {reference!r}")
+			target = _import_module(module_name)
+			attrs = attr_path.split(".")
+		else:
+			parts = reference.split(".")
+			if len(parts) < 2 or not all(parts):
+				raise error(f"Invalid {kind} reference: {reference!r}")
+			target, attrs = _import_prefix(parts)
+
+		for attr in attrs:
+			target = getattr(target, attr)
+	except ZyroError:
+		raise
+	except Exception as e:
+		raise error(f"Failed to import {kind} {reference!r}: {e}") from e
+	return target
+
+
+def resolve_handler(reference: str) -> Callable:
+	"""Import the callable behind 'pkg.module:func' or 'pkg.module.func'."""
+
+	target = import_reference(reference)
+	if not callable(target):
+		raise HandlerImportError(f"Handler {reference!r} is not callable")
+	return target
+
+
+class HandlerRef:
+	"""A route handler resolved from its reference, imported eagerly or on first use."""
+
+	def __init__(
+		self,
+		reference: str,
+		body_adapter: Optional[TypeAdapter] = None,
+		executor: Optional[str] = None,
+		executors: Optional[Executors] = None,
+	) -> None:
+		self.reference = reference
+		# Validates the request body when the route declares a request model.
+		self.body_adapter = body_adapter
+		self.executor = executor
+		self.executors = executors
+		self.target: Optional[Callable] = None
+		self.is_async = False
+		# Generator functions only build their generator when called.
+		self.is_generator = False
+		self._params: List[Tuple[str, Any]] = []
+		self._var_keyword = False
+		self._lock = threading.Lock()
+
+	def load(self) -> Callable:
+		"""Import the handler once; concurrent callers wait on the lock."""
+
+		if self.target is None:
+			with self._lock:
+				if self.target is None:
+					target = resolve_handler(self.reference)
+					self._inspect(target)
+					self.target = target
+		return self.target
+
+	def _inspect(self, target: Callable) -> None:
+		try:
+			signature = inspect.signature(target, eval_str=True)
+		except (NameError, TypeError, ValueError):
+			signature = inspect.signature(target)
+
+		for name, param in signature.parameters.items():
+			if param.kind is param.VAR_KEYWORD:
+				self._var_keyword = True
+			elif param.kind is not param.VAR_POSITIONAL:
+				self._params.append((name, param.annotation))
+
+		self.is_async = inspect.iscoroutinefunction(target) or inspect.iscoroutinefunction(
+			getattr(target, "__call__", None)
+		)
+		self.is_generator = inspect.isgeneratorfunction(target) or inspect.isasyncgenfunction(target)
+
+		if self.executor == "process":
+			# Arguments and results cross a process boundary.
+			if self.is_generator:
+				raise HandlerImportError(f"Handler {self.reference!r} is a generator and can't run in a process")
+			if any(name == "request" for name, _ in self._params):
+				raise HandlerImportError(
+					f"Handler {self.reference!r} takes the request and can't run in a process"
+				)
+
+	async def bind(self, request: Request) -> Dict[str, Any]:
+		"""Map request data onto the handler's parameters by name."""
+
+		path_params = request.path_params
+		query_params = request.query_params
+		kwargs: Dict[str, Any] = {}
+
+		body: Any = _MISSING
+		if self.body_adapter is not None:
+			# Invalid bodies are rejected whether or not the handler takes them.
+			body = await _read_body(request, self.body_adapter)
+
+		for name, annotation in self._params:
+			if name == "request":
+				kwargs[name] = request
+			elif name == "body":
+				kwargs[name] = body if body is not _MISSING else await _read_body(request)
+			elif name in path_params:
+				kwargs[name] = _coerce(name, path_params[name], annotation)
+			elif name in query_params:
+				kwargs[name] = _coerce(name, query_params[name], annotation)
+
+		if self._var_keyword:
+			for name, value in query_params.items():
+				kwargs.setdefault(name, value)
+			for name, value in path_params.items():
+				kwargs.setdefault(name, value)
+		return kwargs
+
+	async def __call__(self, request: Request) -> Any:
+		target = self.target
+		if target is None:
+			# Lazy handler: import off the event loop on first hit.
+			target = await run_in_threadpool(self.load)
+
+		kwargs = await self.bind(request)
+		if self.is_generator:
+			return target(**kwargs)
+		if self.executor == "process" and self.executors is not None:
+			return await asyncio.get_running_loop().run_in_executor(
+				self.executors.process_pool(), partial(run_in_process, self.reference, kwargs)
+			)
+		if self.is_async:
+			return await target(**kwargs)
+		if self.executor == "async":
+			return target(**kwargs)
+		if self.executor == "thread" and self.executors is not None:
+			context = contextvars.copy_context()
+			return await asyncio.get_running_loop().run_in_executor(
+				self.executors.thread_pool(), partial(context.run, target, **kwargs)
+			)
+		return await run_in_threadpool(target, **kwargs)
+
+
+def _coerce(name: str, value: str, annotation: Any) -> Any:
+	if annotation in _COERCIBLE:
+		try:
+			return annotation(value)
+		except ValueError:
+			raise HTTPException(
+				status_code=422, detail=f"Parameter {name!r} must be of type {annotation.__name__}"
+			)
+	return value
+
+
+async def _read_body(request: Request, adapter: Optional[TypeAdapter] = None) -> Any:
+	body = await request.body()
+	if adapter is not None:
+		try:
+			return adapter.validate_json(body)
+		except ValidationError as e:
+			raise RequestValidationError(e.errors(include_url=False), body=body)
+	if not body:
+		return None
+	if "json" in request.headers.get("content-type", ""):
+		try:
+			return await request.json()
+		except ValueError:
+			raise HTTPException(status_code=400, detail="Request body is not valid JSON")
+	return body
+
+
+def load_handlers(refs: Iterable[HandlerRef]) -> Dict[str, float]:
+	"""Eagerly import handlers and log how long each new module took."""
+
+	already_imported = set(_import_times)
+	start = perf_counter()
+	count = 0
+	for ref in refs:
+		ref.load()
+		count += 1
+
+	imported = {name: t for name, t in _import_times.items() if name not in already_imported}
+	if imported:
+		logger.info(
+			"Loaded %d handlers in %.1f ms (%d modules imported)",
+			count,
+			(perf_counter() - start) * 1000,
+			len(imported),
+		)
+		for name, seconds in sorted(imported.items(), key=lambda item: item[1], reverse=True):
+			logger.info("  %8.1f ms  %s", seconds * 1000, name)
+	return imported
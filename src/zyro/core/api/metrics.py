@@ -0,0 +1,309 @@
+"""Per-route request metrics exposed in the Prometheus text format.
+
+Counters are plain attributes updated on the event loop thread, so recording
+a request takes no lock. With several workers every process periodically
+writes a snapshot to a shared directory and a scrape, served by whichever
+worker accepts it, sums the snapshots of all workers.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import tempfile
+from bisect import bisect_left
+from pathlib import Path
+from time import perf_counter
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from fastapi import FastAPI, Request
+from fastapi.responses import Response, StreamingResponse
+
+from zyro.core.config.schema import ServerConfig
+from zyro.core.logging import get_logger
+
+logger = get_logger("metrics")
+
+SIZE_BUCKETS: Tuple[float, ...] = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# group, version, method, path
+Labels = Tuple[str, str, str, str]
+_LABEL_NAMES = ("group", "version", "method", "path")
+
+_FLUSH_INTERVAL = 1.0
+
+
+class RouteMetrics:
+	"""Counters of one route. Bucket counts are per bucket, not cumulative."""
+
+	__slots__ = ("requests", "in_flight", "duration", "duration_sum", "size", "size_sum", "_buckets")
+
+	def __init__(self, buckets: Sequence[float]) -> None:
+		self._buckets = buckets
+		self.requests: Dict[int, int] = {}
+		self.in_flight = 0
+		self.duration = [0] * (len(buckets) + 1)
+		self.duration_sum = 0.0
+		self.size = [0] * (len(SIZE_BUCKETS) + 1)
+		self.size_sum = 0
+
+	def observe(self, status_code: int, seconds: float, size: int) -> None:
+		self.requests[status_code] = self.requests.get(status_code, 0) + 1
+		self.duration[bisect_left(self._buckets, seconds)] += 1
+		self.duration_sum += seconds
+		self.size[bisect_left(SIZE_BUCKETS, size)] += 1
+		self.size_sum += size
+
+	def to_dict(self) -> Dict[str, Any]:
+		return {
+			"requests": {str(code): count for code, count in self.requests.items()},
+			"in_flight": self.in_flight,
+			"duration": self.duration,
+			"duration_sum": self.duration_sum,
+			"size": self.size,
+			"size_sum": self.size_sum,
+		}
+
+	def merge(self, data: Dict[str, Any], with_gauges: bool = True) -> None:
+		"""Add another process' snapshot to these counters."""
+
+		for code, count in data["requests"].items():
+			self.requests[int(code)] = self.requests.get(int(code), 0) + count
+		if with_gauges:
+			self.in_flight += data["in_flight"]
+		for i, count in enumerate(data["duration"][: len(self.duration)]):
+			self.duration[i] += count
+		self.duration_sum += data["duration_sum"]
+		for i, count in enumerate(data["size"][: len(self.size)]):
+			self.size[i] += count
+		self.size_sum += data["size_sum"]
+
+
+class MetricsRegistry:
+	"""Metrics of every mounted route of an app."""
+
+	def __init__(self, buckets: Sequence[float], directory: Optional[Path] = None) -> None:
+		self.buckets = tuple(buckets)
+		self.directory = directory
+		self.routes: Dict[Labels, RouteMetrics] = {}
+
+	def route(self, labels: Labels) -> RouteMetrics:
+		"""Counters for a route; remounted routes keep counting where they left off."""
+
+		metrics = self.routes.get(labels)
+		if metrics is None:
+			metrics = self.routes[labels] = RouteMetrics(self.buckets)
+		return metrics
+
+	def snapshot(self) -> Dict[str, Any]:
+		return {"routes": [[list(labels), metrics.to_dict()] for labels, metrics in self.routes.items()]}
+
+	def flush(self) -> None:
+		"""Write this process' counters where the other workers can read them."""
+
+		if self.directory is None:
+			return
+		path = self.directory / f"{os.getpid()}.json"
+		tmp = path.with_suffix(".tmp")
+		try:
+			self.directory.mkdir(parents=True, exist_ok=True)
+			tmp.write_text(json.dumps(self.snapshot()))
+			os.replace(tmp, path)
+		except OSError as e:
+			logger.warning("Failed to write metrics snapshot %s: %s", path, e)
+
+	def collect(self) -> Dict[Labels, RouteMetrics]:
+		"""Counters summed over every worker that has written a snapshot."""
+
+		if self.directory is None:
+			return self.routes
+
+		self.flush()
+		totals: Dict[Labels, RouteMetrics] = {}
+		for path in self.directory.glob("*.json"):
+			try:
+				pid = int(path.stem)
+				data = json.loads(path.read_text())
+			except (ValueError, OSError):
+				continue
+			# Requests of exited workers still count; their in-flight gauge doesn't.
+			alive = _is_alive(pid)
+			for labels, values in data["routes"]:
+				key = tuple(labels)
+				if key not in totals:
+					totals[key] = RouteMetrics(self.buckets)
+				totals[key].merge(values, with_gauges=alive)
+		return totals
+
+	def render(self) -> str:
+		"""All metrics in the Prometheus text exposition format."""
+
+		routes = sorted(self.collect().items())
+		lines: List[str] = [
+			"# HELP zyro_requests_total Requests handled, by route and status code.",
+			"# TYPE zyro_requests_total counter",
+		]
+		for labels, metrics in routes:
+			for code, count in sorted(metrics.requests.items()):
+				lines.append(f"zyro_requests_total{_format_labels(labels, ('status', str(code)))} {count}")
+
+		lines += [
+			"# HELP zyro_requests_in_flight Requests currently being handled.",
+			"# TYPE zyro_requests_in_flight gauge",
+		]
+		for labels, metrics in routes:
+			lines.append(f"zyro_requests_in_flight{_format_labels(labels)} {metrics.in_flight}")
+
+		lines += _histogram(
+			"zyro_request_duration_seconds",
+			"Time to produce a response, in seconds.",
+			routes,
+			self.buckets,
+			lambda m: (m.duration, m.duration_sum),
+		)
+		lines += _histogram(
+			"zyro_response_size_bytes",
+			"Size of response bodies, in bytes.",
+			routes,
+			SIZE_BUCKETS,
+			lambda m: (m.size, m.size_sum),
+		)
+		return "\n".join(lines) + "\n"
+
+	async def _flush_periodically(self) -> None:
+		while True:
+			await asyncio.sleep(_FLUSH_INTERVAL)
+			self.flush()
+
+	def install(self, app: FastAPI, path: str) -> None:
+		"""Serve the metrics at ``path`` and keep the shared snapshot fresh."""
+
+		async def metrics_endpoint(request: Request) -> Response:
+			return Response(self.render(), media_type=CONTENT_TYPE)
+
+		app.add_api_route(path, metrics_endpoint, methods=["GET"], include_in_schema=False)
+		app.state.metrics = self
+
+		if self.directory is None:
+			return
+		tasks: List[asyncio.Task] = []
+
+		async def start() -> None:
+			tasks.append(asyncio.create_task(self._flush_periodically()))
+
+		async def stop() -> None:
+			for task in tasks:
+				task.cancel()
+			self.flush()
+
+		app.router.on_startup.append(start)
+		app.router.on_shutdown.append(stop)
+
+
+def _is_alive(pid: int) -> bool:
+	if pid == os.getpid():
+		return True
+	try:
+		os.kill(pid, 0)
+	except ProcessLookupError:
+		return False
+	except PermissionError:
+		pass
+	return True
+
+
+def _escape(value: str) -> str:
+	return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels, *extra: Tuple[str, str]) -> str:
+	pairs = [*zip(_LABEL_NAMES, labels), *extra]
+	return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _histogram(
+	name: str,
+	help_text: str,
+	routes: Iterable[Tuple[Labels, RouteMetrics]],
+	buckets: Sequence[float],
+	values: Callable[[RouteMetrics], Tuple[List[int], float]],
+) -> List[str]:
+	lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+	for labels, metrics in routes:
+		counts, total = values(metrics)
+		cumulative = 0
+		for bound, count in zip([*map(str, map(float, buckets)), "+Inf"], counts):
+			cumulative += count
+			lines.append(f"{name}_bucket{_format_labels(labels, ('le', bound))} {cumulative}")
+		lines.append(f"{name}_sum{_format_labels(labels)} {total}")
+		lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+	return lines
+
+
+async def _counted_stream(
+	body: AsyncIterator[Any], metrics: RouteMetrics, status_code: int, start: float
+) -> AsyncIterator[Any]:
+	size = 0
+	try:
+		async for chunk in body:
+			size += len(chunk if isinstance(chunk, (bytes, memoryview)) else chunk.encode())
+			yield chunk
+	finally:
+		metrics.in_flight -= 1
+		metrics.observe(status_code, perf_counter() - start, size)
+
+
+def metrics_handler(endpoint: Callable, registry: MetricsRegistry, labels: Labels) -> Callable:
+	"""Wrap an endpoint to count its requests, latency and response sizes."""
+
+	metrics = registry.route(labels)
+
+	async def instrumented(request: Request) -> Response:
+		metrics.in_flight += 1
+		start = perf_counter()
+		try:
+			response = await endpoint(request)
+		except Exception as e:
+			metrics.in_flight -= 1
+			metrics.observe(getattr(e, "status_code", 500), perf_counter() - start, 0)
+			raise
+		except BaseException:
+			metrics.in_flight -= 1
+			raise
+
+		body = getattr(response, "body", None)
+		if body is None and isinstance(response, StreamingResponse):
+			# Streams are measured when their last chunk has been sent.
+			response.body_iterator = _counted_stream(response.body_iterator, metrics, response.status_code, start)
+			return response
+
+		metrics.in_flight -= 1
+		size = len(body) if body is not None else int(response.headers.get("content-length", 0))
+		metrics.observe(response.status_code, perf_counter() - start, size)
+		return response
+
+	return instrumented
+
+
+def shared_metrics_directory(server_config: ServerConfig) -> Path:
+	"""Where the workers of a server exchange metric snapshots."""
+
+	base = Path("/dev/shm") if os.path.isdir("/dev/shm") else Path(tempfile.gettempdir())
+	return base / f"zyro-metrics-{server_config.port}"
+
+
+def reset_shared_metrics(server_config: ServerConfig) -> None:
+	"""Forget snapshots left by a previous run before workers start."""
+
+	directory = shared_metrics_directory(server_config)
+	for path in directory.glob("*"):
+		try:
+			path.unlink()
+		except OSError:
+			pass
+
+
+def create_registry(server_config: ServerConfig) -> MetricsRegistry:
+	directory = shared_metrics_directory(server_config) if server_config.workers > 1 else None
+	return MetricsRegistry(server_config.metrics.buckets, directory)
@@ -0,0 +1,70 @@
+"""Pydantic models referenced by routes, resolved once and compiled to TypeAdapters."""
+from __future__ import annotations
+
+import sys
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from pydantic import TypeAdapter
+
+from zyro.core.api.handlers import import_reference
+from zyro.core.config.schema import RouteConfig, SchemasConfig
+from zyro.core.exceptions import SchemaImportError
+
+
+@lru_cache(maxsize=None)
+def type_adapter(model: Any) -> TypeAdapter:
+	"""Compiled validator/serializer of a model, built once per model."""
+	return TypeAdapter(model)
+
+
+class ModelRegistry:
+	"""Resolves model references against ``schemas.models``.
+
+	A reference is either a name from the registry or an import path.
+	"""
+
+	def __init__(self, schemas: Optional[SchemasConfig] = None) -> None:
+		self.models: Dict[str, str] = dict(schemas.models) if schemas is not None else {}
+		self.import_path = schemas.import_path if schemas is not None else None
+		self._resolved: Dict[str, Any] = {}
+
+	def resolve(self, reference: str) -> Any:
+		model = self._resolved.get(reference)
+		if model is not None:
+			return model
+
+		path = self.models.get(reference)
+		if path is None:
+			if "." not in reference and ":" not in reference:
+				raise SchemaImportError(f"Unknown model {reference!r}: add it to schemas.models")
+			path = reference
+
+		if self.import_path is not None and self.import_path.is_dir():
+			directory = str(self.import_path.absolute())
+			if directory not in sys.path:
+				sys.path.insert(0, directory)
+
+		model = import_reference(path, SchemaImportError, "model")
+		try:
+			type_adapter(model)
+		except Exception as e:
+			raise SchemaImportError(f"Model {reference!r} ({path}) is not a valid pydantic type: {e}") from e
+		self._resolved[reference] = model
+		return model
+
+	def adapter(self, reference: Optional[str]) -> Optional[TypeAdapter]:
+		"""Cached TypeAdapter for a reference, or None when there is none."""
+		if reference is None:
+			return None
+		return type_adapter(self.resolve(reference))
+
+	def request_adapter(self, route: RouteConfig) -> Optional[TypeAdapter]:
+		return self.adapter(route.request_model)
+
+	def response_adapter(self, route: RouteConfig) -> Optional[TypeAdapter]:
+		"""Adapter of the model declared for the route's success status."""
+		response = route.response.get(route.success_status())
+		if response is None or not isinstance(response.response_model, str):
+			return None
+		return self.adapter(response.response_model)
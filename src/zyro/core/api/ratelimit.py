@@ -0,0 +1,191 @@
+"""Token-bucket rate limiting for endpoint groups and routes.
+
+Each client key owns a bucket of ``burst`` tokens refilled at
+``requests / window`` tokens per second; a request spends one token or is
+rejected with 429. Buckets are refilled lazily on access, so a check is O(1).
+"""
+from __future__ import annotations
+
+import math
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple, Union
+
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, Response
+
+from zyro.core.config.schema import RateLimitConfig
+from zyro.core.logging import get_logger
+
+logger = get_logger("ratelimit")
+
+# (allowed, seconds until a token is available)
+Decision = Tuple[bool, float]
+
+
+class MemoryRateLimiter:
+	"""Buckets of one process, least recently used first.
+
+	A bucket untouched for longer than it takes to refill is identical to a
+	new one, so those are evicted from the front as requests come in.
+	"""
+
+	def __init__(self, config: RateLimitConfig, max_keys: int = 100_000) -> None:
+		self.rate = config.requests / config.window
+		self.capacity = float(config.burst or config.requests)
+		self.refill_time = self.capacity / self.rate
+		self.max_keys = max_keys
+		# key -> [tokens, updated_at]
+		self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+
+	async def hit(self, key: str) -> Decision:
+		now = time.monotonic()
+		buckets = self._buckets
+		bucket = buckets.get(key)
+		if bucket is None:
+			bucket = buckets[key] = [self.capacity, now]
+		else:
+			bucket[0] = min(self.capacity, bucket[0] + (now - bucket[1]) * self.rate)
+			bucket[1] = now
+			buckets.move_to_end(key)
+
+		allowed = bucket[0] >= 1
+		if allowed:
+			bucket[0] -= 1
+		retry_after = 0.0 if allowed else (1 - bucket[0]) / self.rate
+
+		while buckets:
+			oldest = next(iter(buckets.values()))
+			if now - oldest[1] < self.refill_time and len(buckets) <= self.max_keys:
+				break
+			buckets.popitem(last=False)
+		return allowed, retry_after
+
+
+class SharedRateLimiter:
+	"""Buckets shared by all workers on the host, kept in SQLite on tmpfs.
+
+	The refill and the spend happen in one UPSERT, so concurrent workers
+	can't both take the last token. Checks run in the thread pool, as they
+	can wait on another worker's lock.
+	"""
+
+	# Drop fully refilled buckets every this many requests.
+	_SWEEP_EVERY = 1024
+	# UPSERT ... RETURNING needs SQLite 3.35.
+	MIN_SQLITE_VERSION = (3, 35)
+
+	_HIT = (
+		"INSERT INTO buckets (scope, key, tokens, updated, allowed) VALUES (:scope, :key, :capacity - 1, :now, 1) "
+		"ON CONFLICT (scope, key) DO UPDATE SET "
+		"allowed = MIN(:capacity, tokens + (:now - updated) * :rate) >= 1, "
+		"tokens = MIN(:capacity, tokens + (:now - updated) * :rate) "
+		"- (MIN(:capacity, tokens + (:now - updated) * :rate) >= 1), "
+		"updated = :now "
+		"RETURNING allowed, tokens"
+	)
+
+	def __init__(self, config: RateLimitConfig, scope: str, namespace: str) -> None:
+		directory = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+		self.path = os.path.join(directory, f"zyro-ratelimit-{namespace}.sqlite3")
+		self.scope = scope
+		self.rate = config.requests / config.window
+		self.capacity = float(config.burst or config.requests)
+		self.refill_time = self.capacity / self.rate
+		self._conn: Optional[sqlite3.Connection] = None
+		self._pid: Optional[int] = None
+		self._hits = 0
+		self._failed = False
+		# One connection per process, used by one pool thread at a time.
+		self._lock = threading.Lock()
+
+	def _connect(self) -> sqlite3.Connection:
+		# Connections must not cross a fork.
+		if self._conn is None or self._pid != os.getpid():
+			conn = sqlite3.connect(self.path, timeout=0.05, isolation_level=None, check_same_thread=False)
+			conn.execute("PRAGMA journal_mode=WAL")
+			conn.execute("PRAGMA synchronous=OFF")
+			conn.execute(
+				"CREATE TABLE IF NOT EXISTS buckets ("
+				"scope TEXT NOT NULL, key TEXT NOT NULL, tokens REAL NOT NULL, updated REAL NOT NULL, "
+				"allowed INTEGER NOT NULL, PRIMARY KEY (scope, key))"
+			)
+			conn.execute("CREATE INDEX IF NOT EXISTS buckets_updated ON buckets (scope, updated)")
+			self._conn, self._pid = conn, os.getpid()
+		return self._conn
+
+	async def hit(self, key: str) -> Decision:
+		return await run_in_threadpool(self._hit, key)
+
+	def _hit(self, key: str) -> Decision:
+		# Wall clock: monotonic clocks aren't comparable across processes.
+		now = time.time()
+		try:
+			with self._lock:
+				conn = self._connect()
+				allowed, tokens = conn.execute(
+					self._HIT,
+					{"scope": self.scope, "key": key, "capacity": self.capacity, "now": now, "rate": self.rate},
+				).fetchone()
+				self._hits += 1
+				if self._hits % self._SWEEP_EVERY == 0:
+					conn.execute(
+						"DELETE FROM buckets WHERE scope = ? AND updated < ?", (self.scope, now - self.refill_time)
+					)
+		except sqlite3.Error as e:
+			# Fail open: a busy database must not turn into rejected requests.
+			# The first failure is a warning, in case it isn't just contention.
+			log = logger.debug if self._failed else logger.warning
+			log("Shared rate limit check failed, allowing the request: %s", e)
+			self._failed = True
+			return True, 0.0
+		return bool(allowed), 0.0 if allowed else (1 - tokens) / self.rate
+
+
+RateLimiter = Union[MemoryRateLimiter, SharedRateLimiter]
+
+
+def create_limiter(config: RateLimitConfig, scope: str, namespace: str) -> RateLimiter:
+	if config.backend == "shared":
+		if sqlite3.sqlite_version_info >= SharedRateLimiter.MIN_SQLITE_VERSION:
+			return SharedRateLimiter(config, scope, namespace)
+		logger.warning(
+			"Shared rate limits need SQLite %s or newer, found %s; limiting %s per worker instead",
+			".".join(map(str, SharedRateLimiter.MIN_SQLITE_VERSION)),
+			sqlite3.sqlite_version,
+			scope,
+		)
+	return MemoryRateLimiter(config)
+
+
+def client_key(request: Request, config: RateLimitConfig) -> str:
+	"""Who a request is counted against: a header value, else the client address."""
+
+	if config.key_by == "header" and config.header:
+		value = request.headers.get(config.header)
+		if value:
+			return "h:" + value
+	client = request.client
+	return "ip:" + (client.host if client else "unknown")
+
+
+def rate_limited_handler(endpoint: Callable, limits: List[Tuple[RateLimitConfig, RateLimiter]]) -> Callable:
+	"""Wrap an endpoint so every limit (group, then route) must admit the request."""
+
+	async def limited(request: Request) -> Response:
+		for config, limiter in limits:
+			allowed, retry_after = await limiter.hit(client_key(request, config))
+			if not allowed:
+				return JSONResponse(
+					{"detail": "Rate limit exceeded"},
+					status_code=429,
+					headers={"retry-after": str(max(1, math.ceil(retry_after)))},
+				)
+		return await endpoint(request)
+
+	return limited
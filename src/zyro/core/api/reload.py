@@ -0,0 +1,157 @@
+"""Config hot reload that remounts only the routes that changed."""
+from __future__ import annotations
+
+import asyncio
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, FastAPI
+
+from zyro.core.api.handlers import HandlerRef, load_handlers
+from zyro.core.api.models import ModelRegistry
+from zyro.core.api.router import full_path, mount_single_route
+from zyro.core.config.cache import compile_config, source_files
+from zyro.core.config.schema import EndpointConfig, RouteConfig, ZyroConfig
+from zyro.core.exceptions import ZyroError
+from zyro.core.logging import Logger
+
+RouteKey = Tuple[str, str]
+
+
+def route_table(configuration: ZyroConfig) -> Dict[RouteKey, Tuple[EndpointConfig, RouteConfig]]:
+    """Routes of a config keyed by (method, full path), in mount order."""
+
+    table: Dict[RouteKey, Tuple[EndpointConfig, RouteConfig]] = {}
+    for group in configuration.endpoints:
+        # Group settings without its routes, so one route change doesn't dirty the group
+        settings = group.model_copy(update={"routes": []})
+        for route in group.routes:
+            table[(route.method.upper(), full_path(group.base_path, route.path))] = (settings, route)
+    return table
+
+
+class ConfigReloader(Logger):
+    """Polls the config file and atomically swaps changed routes into the running app."""
+
+    def __init__(
+        self,
+        app: FastAPI,
+        config_path: Path,
+        configuration: ZyroConfig,
+        interval: float = 1.0,
+    ) -> None:
+        super().__init__()
+        self.app = app
+        self.config_path = config_path
+        self.configuration = configuration
+        self.interval = interval
+        self._routes = route_table(configuration)
+        # Unknown until the first poll, which also catches edits made while
+        # a restarted worker was being built from an older config.
+        self._stamp: Optional[List[Tuple[str, int, int]]] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def install(self) -> None:
+        """Start watching with the app and stop on shutdown."""
+
+        self.app.router.on_startup.append(self._start)
+        self.app.router.on_shutdown.append(self._stop)
+
+    async def _start(self) -> None:
+        self._task = asyncio.create_task(self.watch())
+
+    async def _stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+    async def watch(self) -> None:
+        while True:
+            try:
+                stamp = self._current_stamp()
+                if stamp != self._stamp:
+                    self._stamp = stamp
+                    await self.reload()
+            except FileNotFoundError:
+                pass
+            except Exception:
+                self.logger.exception("Hot reload failed")
+            await asyncio.sleep(self.interval)
+
+    def _current_stamp(self) -> List[Tuple[str, int, int]]:
+        """mtime and size of the config and every file it includes."""
+
+        stamp = []
+        try:
+            files = [self.config_path, *source_files(self.config_path, self.configuration.include)]
+        except ZyroError:
+            # An include pattern stopped matching; let reload() report it.
+            files = [self.config_path]
+        for path in files:
+            stat = os.stat(path)
+            stamp.append((str(path), stat.st_mtime_ns, stat.st_size))
+        return stamp
+
+    async def reload(self) -> bool:
+        """Re-validate the config and remount what changed; keep serving the old routes on error."""
+
+        try:
+            result = await asyncio.to_thread(compile_config, self.config_path, True)
+        except ZyroError as e:
+            self.logger.error("Config reload rejected, keeping current routes: %s", e)
+            return False
+
+        new_config = result.config
+        if new_config.server != self.configuration.server:
+            self.logger.warning("Server settings changed in %s; restart to apply them", self.config_path)
+
+        new_routes = route_table(new_config)
+        changed = [
+            key for key, entry in new_routes.items()
+            if key not in self._routes or self._routes[key] != entry
+        ]
+        removed = [key for key in self._routes if key not in new_routes]
+        if not changed and not removed:
+            self.configuration = new_config
+            return False
+
+        if new_config.schemas != self.configuration.schemas:
+            self.app.state.models = ModelRegistry(new_config.schemas)
+
+        scratch = APIRouter()
+        eager_refs: List[HandlerRef] = []
+        try:
+            for key in changed:
+                settings, route = new_routes[key]
+                eager_ref = mount_single_route(
+                    self.app, settings.base_path, route, router=scratch, group=settings
+                )
+                if eager_ref is not None:
+                    eager_refs.append(eager_ref)
+            await asyncio.to_thread(load_handlers, eager_refs)
+        except ZyroError as e:
+            self.logger.error("Config reload rejected, keeping current routes: %s", e)
+            return False
+
+        built = dict(zip(changed, scratch.routes))
+        mounted: Dict[RouteKey, Any] = self.app.state.zyro_routes
+        zyro_routes = {key: built.get(key) or mounted[key] for key in new_routes}
+
+        old_ids = {id(r) for r in mounted.values()}
+        others = [r for r in self.app.router.routes if id(r) not in old_ids]
+        # One assignment: in-flight requests keep the route they matched.
+        self.app.router.routes = others + list(zyro_routes.values())
+        self.app.state.zyro_routes = zyro_routes
+        self.app.openapi_schema = None
+
+        added = sum(1 for key in changed if key not in self._routes)
+        self.logger.info(
+            "Reloaded %s: %d added, %d changed, %d removed routes",
+            self.config_path,
+            added,
+            len(changed) - added,
+            len(removed),
+        )
+        self.configuration = new_config
+        self._routes = new_routes
+        return True
@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import gzip
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import ResponseValidationError
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from zyro.core.config.schema import RouteConfig, RouteResponse
+from zyro.core.exceptions import InvalidRoute
+from zyro.core.logging import get_logger
+
+try:
+	import brotli
+except ImportError:  # optional dependency
+	brotli = None
+
+try:
+	import orjson
+except ImportError:  # optional dependency
+	orjson = None
+
+try:
+	import msgspec
+except ImportError:  # optional dependency
+	msgspec = None
+
+logger = get_logger("responses")
+
+RawHeaders = List[Tuple[bytes, bytes]]
+
+# Bodies smaller than this are not worth a compressed variant.
+_MIN_COMPRESS_SIZE = 512
+
+
+class PrecompiledResponse(Response):
+	"""Response whose body and headers were rendered ahead of time."""
+
+	def __init__(self, body: bytes, status_code: int, raw_headers: RawHeaders) -> None:
+		# Response.__init__ renders and builds headers; both are already done.
+		self.body = body
+		self.status_code = status_code
+		# Middleware may mutate headers in place, so every response gets its own list.
+		self.raw_headers = list(raw_headers)
+		self.background = None
+
+
+def _json_default(value: Any) -> Any:
+	"""Encode values the fast JSON libraries don't know, such as pydantic models."""
+
+	if isinstance(value, BaseModel):
+		return value.model_dump(mode="json")
+	return jsonable_encoder(value)
+
+
+def _stdlib_dumps(value: Any) -> bytes:
+	# Same output as JSONResponse.render
+	return json.dumps(
+		jsonable_encoder(value), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+	).encode("utf-8")
+
+
+def _orjson_dumps(value: Any) -> bytes:
+	return orjson.dumps(value, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+_msgspec_encoder: Any = None
+
+
+def _msgspec_dumps(value: Any) -> bytes:
+	global _msgspec_encoder
+	if _msgspec_encoder is None:
+		_msgspec_encoder = msgspec.json.Encoder(enc_hook=_json_default)
+	return _msgspec_encoder.encode(value)
+
+
+class ORJSONResponse(JSONResponse):
+	"""JSON response encoded by orjson, without a jsonable_encoder pass."""
+
+	def render(self, content: Any) -> bytes:
+		return _orjson_dumps(content)
+
+
+class MsgspecJSONResponse(JSONResponse):
+	"""JSON response encoded by msgspec, without a jsonable_encoder pass."""
+
+	def render(self, content: Any) -> bytes:
+		return _msgspec_dumps(content)
+
+
+def json_dumps(response_class: Type[JSONResponse]) -> Callable[[Any], bytes]:
+	"""Encoder matching a JSON response class, for bodies built piece by piece."""
+
+	if response_class is ORJSONResponse:
+		return _orjson_dumps
+	if response_class is MsgspecJSONResponse:
+		return _msgspec_dumps
+	return _stdlib_dumps
+
+
+def json_response_class(backend: str) -> Type[JSONResponse]:
+	"""Response class of a JSON backend; stdlib json when its library isn't installed."""
+
+	if backend == "orjson" and orjson is not None:
+		return ORJSONResponse
+	if backend == "msgspec" and msgspec is not None:
+		return MsgspecJSONResponse
+	if backend != "stdlib":
+		logger.warning("json_backend %r is not installed, falling back to stdlib json", backend)
+	return JSONResponse
+
+
+def render_result(result: Any, status_code: int, response_class: Type[JSONResponse] = JSONResponse) -> Response:
+	"""Turn a handler's return value into a response."""
+
+	if isinstance(result, Response):
+		return result
+	if response_class is JSONResponse:
+		return JSONResponse(content=jsonable_encoder(result), status_code=status_code)
+	return response_class(content=result, status_code=status_code)
+
+
+def render_model(result: Any, adapter: TypeAdapter, status_code: int, validate: bool = True) -> Response:
+	"""Serialize a handler's return value with the route's compiled response model."""
+
+	if isinstance(result, Response):
+		return result
+	if validate:
+		try:
+			result = adapter.validate_python(result, from_attributes=True)
+		except ValidationError as e:
+			raise ResponseValidationError(e.errors(include_url=False), body=result)
+	# Unvalidated results may not match the model; serialize them as they are.
+	return Response(
+		content=adapter.dump_json(result, warnings=validate),
+		status_code=status_code,
+		media_type="application/json"
+	)
+
+
+def render_body(content: Any, media_type: str) -> bytes:
+	"""Encode static content declared in YAML to response bytes."""
+
+	if isinstance(content, bytes):
+		return content
+	if isinstance(content, str) and not media_type.endswith("json"):
+		return content.encode("utf-8")
+	return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _compress(body: bytes) -> Dict[str, bytes]:
+	"""Precompute compressed variants that are actually smaller than the body."""
+
+	variants: Dict[str, bytes] = {}
+	if len(body) < _MIN_COMPRESS_SIZE:
+		return variants
+
+	candidates: List[Tuple[str, Callable[[bytes], bytes]]] = [("gzip", lambda b: gzip.compress(b, mtime=0))]
+	if brotli is not None:
+		candidates.insert(0, ("br", brotli.compress))
+
+	for encoding, compress in candidates:
+		compressed = compress(body)
+		if len(compressed) < len(body):
+			variants[encoding] = compressed
+	return variants
+
+
+def accepted_encodings(header: str) -> List[str]:
+	"""Codings listed in an Accept-Encoding header, skipping those with q=0."""
+
+	accepted = []
+	for item in header.split(","):
+		coding, _, params = item.partition(";")
+		coding = coding.strip().lower()
+		if not coding:
+			continue
+		q = params.strip()
+		if q.startswith("q="):
+			try:
+				if float(q[2:]) == 0:
+					continue
+			except ValueError:
+				continue
+		accepted.append(coding)
+	return accepted
+
+
+class StaticResponse:
+	"""Pre-rendered body, headers and compressed variants of a static route."""
+
+	def __init__(self, status_code: int, response: RouteResponse, compress: bool = True) -> None:
+		media_type = response.media_type
+		if media_type.startswith("text/") and "charset" not in media_type:
+			media_type += "; charset=utf-8"
+
+		self.status_code = status_code
+		self.body = render_body(response.content, response.media_type)
+		self.variants: Dict[Optional[str], Tuple[bytes, RawHeaders]] = {}
+
+		base_headers: RawHeaders = [
+			(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in response.headers.items()
+		]
+		base_headers.append((b"content-type", media_type.encode("latin-1")))
+
+		encoded = _compress(self.body) if compress else {}
+		if encoded:
+			base_headers.append((b"vary", b"Accept-Encoding"))
+
+		self.variants[None] = (
+			self.body,
+			base_headers + [(b"content-length", str(len(self.body)).encode("latin-1"))],
+		)
+		for encoding, body in encoded.items():
+			self.variants[encoding] = (
+				body,
+				base_headers + [
+					(b"content-encoding", encoding.encode("latin-1")),
+					(b"content-length", str(len(body)).encode("latin-1")),
+				],
+			)
+
+	def respond(self, accept_encoding: Optional[str]) -> PrecompiledResponse:
+		"""Pick the best pre-rendered variant for the client."""
+
+		if accept_encoding and len(self.variants) > 1:
+			accepted = accepted_encodings(accept_encoding)
+			for encoding in ("br", "gzip"):
+				if encoding in self.variants and encoding in accepted:
+					body, headers = self.variants[encoding]
+					return PrecompiledResponse(body, self.status_code, headers)
+
+		body, headers = self.variants[None]
+		return PrecompiledResponse(body, self.status_code, headers)
+
+
+def static_handler(route: RouteConfig) -> Callable:
+	"""Build an endpoint serving the route's statically declared response."""
+
+	declared = route.static_response()
+	if declared is None:
+		raise InvalidRoute(f"Route {route.method} {route.path} has no static response")
+
+	static = StaticResponse(*declared, compress=route.compress)
+
+	async def handler(request: Request) -> PrecompiledResponse:
+		return static.respond(request.headers.get("accept-encoding"))
+
+	return handler
@@ -1,8 +1,21 @@
 import re
-from fastapi.responses import HTMLResponse, JSONResponse
-from fastapi import FastAPI
-from typing import Callable, List, Dict, Any 
-from zyro.core.config.schema import EndpointConfig, RouteConfig
+import threading
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import HTMLResponse, JSONResponse, Response
+from fastapi import APIRouter, FastAPI, Request
+from pydantic import TypeAdapter
+from typing import Callable, List, Dict, Any, Optional, Type
+from zyro.core.config.schema import EndpointConfig, RouteConfig, ServerConfig
+from zyro.core.api.cache import cached_handler
+from zyro.core.api.coalesce import coalesced_handler
+from zyro.core.api.handlers import HandlerRef, load_handlers
+from zyro.core.api.metrics import metrics_handler
+from zyro.core.api.access_log import AccessLogPolicy
+from zyro.core.api.responses import json_dumps, render_model, render_result, static_handler
+from zyro.core.api.streaming import stream_handler
+from zyro.core.api.concurrency import ConcurrencyLimiter, limited_handler
+from zyro.core.api.ratelimit import RateLimiter, create_limiter, rate_limited_handler
+from zyro.core.api.models import ModelRegistry
 
 def zyro_info_page() -> HTMLResponse:
 	return HTMLResponse(
@@ -10,37 +23,168 @@ def zyro_info_page() -> HTMLResponse:
 			status_code=200
 		)
 
-def response_handler() -> Callable:
+def response_handler(
+		route: RouteConfig, handler: HandlerRef, adapter: Optional[TypeAdapter] = None, validate: bool = True, 
+		response_class: Type[JSONResponse] = JSONResponse
+	) -> Callable:
+	status_code = route.success_status()
 
-	async def handler() -> JSONResponse:
-		return JSONResponse(
-				status_code=200, 
-				content={
-					"message": "Successfull", 
-				}
-			)
+	if adapter is not None:
+		async def endpoint(request: Request) -> Response:
+			return render_model(await handler(request), adapter, status_code, validate)
+
+		return endpoint
+
+	async def endpoint(request: Request) -> Response:
+		return render_result(await handler(request), status_code, response_class)
+
+	return endpoint
+
+def deferred_handler(build: Callable[[], Callable]) -> Callable:
+	"""Endpoint built on its first request, off the event loop; a failed build is retried."""
+
+	built: List[Callable] = []
+	lock = threading.Lock()
+
+	def load() -> Callable:
+		with lock:
+			if not built:
+				built.append(build())
+		return built[0]
 
-	return handler 
+	async def endpoint(request: Request) -> Response:
+		target = built[0] if built else await run_in_threadpool(load)
+		return await target(request)
 
-def mount_single_route(app: FastAPI, group_base_path: str, route: RouteConfig) -> None:
-	"""Moute single route to the FastAPI application."""
+	return endpoint
+
+def _is_lazy(route: RouteConfig, server_config: ServerConfig) -> bool:
+	if route.lazy is not None:
+		return route.lazy
+	return server_config.handler_loading == "lazy"
+
+def group_rate_limiter(app: FastAPI, group: EndpointConfig) -> RateLimiter:
+	"""The limiter shared by a group's routes; kept across reloads while its settings don't change."""
+
+	key = (group.group, group.version, group.base_path)
+	current = app.state.group_rate_limiters.get(key)
+	if current is None or current[0] != group.rate_limit:
+		scope = f"group {group.group or ''} {group.base_path}"
+		limiter = create_limiter(group.rate_limit, scope, str(app.state.server_config.port))
+		current = app.state.group_rate_limiters[key] = (group.rate_limit, limiter)
+	return current[1]
+
+def full_path(group_base_path: str, path: str) -> str:
+	"""Path a route is mounted at within its endpoint group."""
+	return (group_base_path.rstrip("/") + "/" + path.lstrip("/")).rstrip("/")
+
+def mount_single_route(
+		app: FastAPI, group_base_path: str, route: RouteConfig, router: Optional[APIRouter] = None, 
+		group: Optional[EndpointConfig] = None
+	) -> Optional[HandlerRef]:
+	"""Moute single route to the FastAPI application.
+
+	Routes are added to ``router`` instead of the app when given, which lets
+	hot reload build replacements before swapping them in. ``group`` supplies
+	the group and version labels of the route's metrics.
+	Returns the handler reference when it still has to be loaded eagerly.
+	"""
 
 	path = route.path
 	method = route.method.upper() 
 	description = route.description 
+	server_config: ServerConfig = app.state.server_config
 
-	final_path = (group_base_path.rstrip("/") + "/" + path.lstrip("/")).rstrip("/")
+	final_path = full_path(group_base_path, path)
 
-	app.add_api_route(
+	eager_ref = None
+	# Static routes are rendered once here instead of on every request
+	if route.static_response() is not None:
+		endpoint = static_handler(route)
+	else:
+		models: ModelRegistry = app.state.models
+		handler = HandlerRef(
+			route.handler, 
+			executor=route.executor, 
+			executors=app.state.executors
+		)
+
+		def build() -> Callable:
+			# Models are imported with the handler: eagerly, or on first request when lazy
+			handler.body_adapter = models.request_adapter(route)
+			if route.stream_type() is not None:
+				return stream_handler(
+					route, handler, json_dumps(app.state.json_response_class), 
+					models.response_adapter(route), server_config.validate_responses
+				)
+			return response_handler(
+				route, handler, models.response_adapter(route), server_config.validate_responses, 
+				app.state.json_response_class
+			)
+
+		if _is_lazy(route, server_config):
+			endpoint = deferred_handler(build)
+		else:
+			eager_ref = handler
+			endpoint = build()
+		limiters = []
+		if route.concurrency is not None and route.concurrency.max_concurrency is not None:
+			limiters.append(ConcurrencyLimiter(route.concurrency))
+		if app.state.concurrency_limiter is not None:
+			limiters.append(app.state.concurrency_limiter)
+		if limiters:
+			endpoint = limited_handler(endpoint, limiters)
+		if route.coalesce:
+			endpoint = coalesced_handler(endpoint, f"{method} {final_path}", route)
+		if route.cache is not None:
+			endpoint = cached_handler(
+				endpoint, f"{method} {final_path}", route.cache, namespace=str(server_config.port)
+			)
+
+	limits = []
+	if group is not None and group.rate_limit is not None:
+		limits.append((group.rate_limit, group_rate_limiter(app, group)))
+	if route.rate_limit is not None:
+		limits.append((
+			route.rate_limit, 
+			create_limiter(route.rate_limit, f"{method} {final_path}", str(server_config.port))
+		))
+	if limits:
+		endpoint = rate_limited_handler(endpoint, limits)
+
+	if app.state.metrics is not None:
+		labels = (
+			(group.group or "") if group is not None else "", 
+			(group.version or "") if group is not None else "", 
+			method, 
+			final_path or "/"
+		)
+		endpoint = metrics_handler(endpoint, app.state.metrics, labels)
+
+	app.state.access_log_policies[(method, final_path)] = AccessLogPolicy.from_config(
+		server_config.access_log, route.access_log
+	)
+	if route.compress:
+		app.state.uncompressed_routes.discard((method, final_path))
+	else:
+		app.state.uncompressed_routes.add((method, final_path))
+
+	target = router if router is not None else app.router
+	target.add_api_route(
 			path=final_path, 
-			endpoint=response_handler(),   
+			endpoint=endpoint,   
 			methods=[method], 
 			description=description
 		)
+	if router is None:
+		app.state.zyro_routes[(method, final_path)] = app.router.routes[-1]
+
+	return eager_ref
 
 def mount_routes(app: FastAPI, endpoints_config: List[EndpointConfig]) -> None:
 	"""Mount endpoint groups to the FastAPI application."""
 
+	eager_refs: List[HandlerRef] = []
 	try:
 		for group in endpoints_config:
 			base_path = group.base_path
@@ -48,9 +192,24 @@ def mount_routes(app: FastAPI, endpoints_config: List[EndpointConfig]) -> None:
 
 			for route in routes:
 				try:
-					mount_single_route(app, base_path, route)  
+					eager_ref = mount_single_route(app, base_path, route, group=group)
+					if eager_ref is not None:
+						eager_refs.append(eager_ref)
 				except Exception as e:
 					raise e 
 
 	except Exception as e:
-		raise e 
\ No newline at end of file
+		raise e 
+
+	# Fail fast on broken handler references and warm their imports
+	load_handlers(eager_refs)
+
+def preload_handlers(endpoints_config: List[EndpointConfig], server_config: ServerConfig) -> None:
+	"""Import eager handlers ahead of forking so workers inherit the loaded modules."""
+
+	load_handlers(
+		HandlerRef(route.handler)
+		for group in endpoints_config
+		for route in group.routes
+		if route.static_response() is None and not _is_lazy(route, server_config)
+	)
@@ -1,35 +1,125 @@
 """Background server runner."""
+import os
 import sys
 from pathlib import Path
+from typing import Callable, Optional, Tuple
+
 import uvicorn
+from fastapi import FastAPI
+
 from zyro.utils.parser import (
-    get_server_config, get_project_config, 
-    load_file, get_endpoints_config
+    get_server_config, get_project_config,
+    load_file, get_endpoints_config, get_schemas_config
 )
+from zyro.core.config.schema import ServerConfig, ZyroConfig
 from zyro.core.logging import setup_logging
-from zyro.core.api.router import mount_routes
+from zyro.core.manager.registry import DEFAULT_INSTANCE, InstanceRegistry
+from zyro.core.api.router import mount_routes, preload_handlers
 from zyro.core.api.fastapi_engine import create_app
+from zyro.core.api.metrics import reset_shared_metrics
+from zyro.core.api.reload import ConfigReloader
+from zyro.core.api.supervisor import WorkerSupervisor
+
+def build_app(configuration: ZyroConfig, config_path: Optional[Path] = None) -> FastAPI:
+    """Create the FastAPI app and mount every configured route."""
+    server_config = get_server_config(config=configuration)
+    app = create_app(
+        project_config=get_project_config(config=configuration),
+        server_config=server_config,
+        schemas_config=get_schemas_config(config=configuration),
+    )
+    mount_routes(app=app, endpoints_config=get_endpoints_config(config=configuration))
+    if config_path is not None and server_config.hot_reload:
+        ConfigReloader(app, config_path, configuration).install()
+    return app
+
+def serve(
+    configuration: ZyroConfig,
+    config_path: Optional[Path] = None,
+    instance_id: str = DEFAULT_INSTANCE,
+    mode: str = "foreground",
+    use_cache: bool = True,
+) -> None:
+    """Serve the configuration in this process or through the worker supervisor.
+
+    With a config path the server is recorded in the instance registry
+    while it runs, so `zyro status` and `zyro stop` can find it. Detached
+    servers always run under the supervisor so `zyro reload` can replace
+    their workers without downtime.
+    """
+    server_config = get_server_config(config=configuration)
+    supervised = server_config.workers > 1 or mode == "detached"
 
-def run_server(config_path: str):
+    registry: Optional[InstanceRegistry] = None
+    key: Optional[str] = None
+    if config_path is not None:
+        try:
+            registry = InstanceRegistry()
+            key = registry.register(
+                config_path, instance_id, os.getpid(), server_config.host, server_config.port, mode,
+                workers=[] if supervised else [os.getpid()],
+                supervised=supervised,
+            )
+        except Exception:
+            # The registry is bookkeeping; don't refuse to serve over it.
+            registry = None
+
+    try:
+        if supervised:
+            # Import once in the supervisor; forked workers inherit the modules
+            preload_handlers(get_endpoints_config(config=configuration), server_config)
+            if server_config.metrics.enabled:
+                reset_shared_metrics(server_config)
+            supervisor = WorkerSupervisor(
+                app_factory=lambda: build_app(configuration, config_path),
+                server_config=server_config,
+                registry=registry,
+                instance_key=key,
+                reload_factory=(
+                    (lambda: _reload_factory(config_path, use_cache)) if config_path is not None else None
+                ),
+            )
+            supervisor.run()
+            return
+
+        uvicorn.run(
+            app=build_app(configuration, config_path),
+            host=server_config.host,
+            port=server_config.port,
+            log_level=server_config.log_level.lower(),
+            log_config=None,
+            # Requests are logged, sampled, by AccessLogMiddleware
+            access_log=False,
+            timeout_graceful_shutdown=server_config.graceful_timeout,
+        )
+    finally:
+        if registry is not None and key is not None:
+            try:
+                registry.unregister(key, pid=os.getpid())
+            except Exception:
+                pass
+
+def _reload_factory(config_path: Path, use_cache: bool) -> Tuple[Callable[[], FastAPI], ServerConfig]:
+    """Load the config again and return the app factory and settings of the next worker generation."""
+    configuration = load_file(file_path=config_path, use_cache=use_cache)
+    server_config = get_server_config(config=configuration)
+    preload_handlers(get_endpoints_config(config=configuration), server_config)
+    return (lambda: build_app(configuration, config_path)), server_config
+
+def run_server(config_path: str, use_cache: bool = True, instance_id: str = DEFAULT_INSTANCE):
     """Run server - called by detached process."""
     setup_logging()
-    
-    configuration = load_file(file_path=Path(config_path))
-    project_config = get_project_config(config=configuration)
-    server_config = get_server_config(config=configuration)
-    endpoints_config = get_endpoints_config(config=configuration) 
-
-    app = create_app(project_config=project_config)
-    mount_routes(app=app, endpoints_config=endpoints_config) 
-    
-    uvicorn.run(
-        app=app,
-        host=server_config.host,
-        port=server_config.port,
-        log_level=server_config.log_level.lower(),
-        log_config=None 
+
+    configuration = load_file(file_path=Path(config_path), use_cache=use_cache)
+    serve(
+        configuration, config_path=Path(config_path), instance_id=instance_id, mode="detached", use_cache=use_cache
     )
 
 if __name__ == "__main__":
     if len(sys.argv) > 1:
-        run_server(sys.argv[1])
+        args = sys.argv[2:]
+        run_server(
+            sys.argv[1],
+            use_cache="--no-cache" not in args,
+            instance_id=args[args.index("--instance") + 1] if "--instance" in args else DEFAULT_INSTANCE,
+        )
@@ -0,0 +1,138 @@
+"""Routes whose generator handlers stream items as they are produced.
+
+Items are sent one chunk at a time through StreamingResponse, which awaits
+each send, so a slow client pauses the generator instead of letting output
+pile up in memory.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, Optional, Union
+
+from fastapi import Request
+from fastapi.responses import Response, StreamingResponse
+from pydantic import TypeAdapter
+
+from zyro.core.api.handlers import HandlerRef
+from zyro.core.config.schema import RouteConfig
+
+Items = Union[Iterable[Any], AsyncIterator[Any]]
+
+MEDIA_TYPES = {
+	"sse": "text/event-stream",
+	"ndjson": "application/x-ndjson",
+}
+
+
+@dataclass
+class ServerSentEvent:
+	"""An SSE event with more than data; plain items are sent as data only."""
+
+	data: Any = None
+	event: Optional[str] = None
+	id: Optional[str] = None
+	retry: Optional[int] = None
+
+
+def _as_items(result: Any) -> Items:
+	"""Iterate a handler result, treating scalars and strings as a single item."""
+
+	if hasattr(result, "__aiter__"):
+		return result
+	if isinstance(result, (str, bytes, dict)) or not hasattr(result, "__iter__"):
+		return [result]
+	return result
+
+
+def _map(items: Items, encode: Callable[[Any], bytes]) -> Union[Iterator[bytes], AsyncIterator[bytes]]:
+	"""Encode items lazily; sync generators keep running in the threadpool."""
+
+	if hasattr(items, "__aiter__"):
+		async def encoded() -> AsyncIterator[bytes]:
+			async for item in items:  # type: ignore[union-attr]
+				yield encode(item)
+
+		return encoded()
+	return (encode(item) for item in items)  # type: ignore[union-attr]
+
+
+def _raw_chunk(item: Any) -> bytes:
+	if isinstance(item, (bytes, bytearray, memoryview)):
+		return bytes(item)
+	return str(item).encode("utf-8")
+
+
+def sse_encoder(dumps: Callable[[Any], bytes]) -> Callable[[Any], bytes]:
+	def encode(item: Any) -> bytes:
+		event = item if isinstance(item, ServerSentEvent) else ServerSentEvent(data=item)
+		lines = []
+		if event.event is not None:
+			lines.append(f"event: {event.event}")
+		if event.id is not None:
+			lines.append(f"id: {event.id}")
+		if event.retry is not None:
+			lines.append(f"retry: {event.retry}")
+		if event.data is not None:
+			data = event.data if isinstance(event.data, str) else dumps(event.data).decode("utf-8")
+			lines.extend(f"data: {line}" for line in data.splitlines() or [""])
+		return ("\n".join(lines) + "\n\n").encode("utf-8")
+
+	return encode
+
+
+def item_dumps(
+	dumps: Callable[[Any], bytes], adapter: Optional[TypeAdapter] = None, validate: bool = True
+) -> Callable[[Any], bytes]:
+	"""JSON encoder for single items, going through the response model when there is one."""
+
+	if adapter is None:
+		return dumps
+
+	def encode(item: Any) -> bytes:
+		if validate:
+			item = adapter.validate_python(item, from_attributes=True)
+		return adapter.dump_json(item, warnings=validate)
+
+	return encode
+
+
+def stream_handler(
+	route: RouteConfig,
+	handler: HandlerRef,
+	dumps: Callable[[Any], bytes],
+	adapter: Optional[TypeAdapter] = None,
+	validate: bool = True,
+) -> Callable:
+	"""Endpoint sending what the handler yields as raw chunks, SSE events or NDJSON lines."""
+
+	kind = route.stream_type()
+	status_code = route.success_status()
+	declared = route.response[status_code]
+	json_item = item_dumps(dumps, adapter, validate)
+
+	if kind == "sse":
+		encode = sse_encoder(json_item)
+		headers = {"cache-control": "no-cache", "x-accel-buffering": "no"}
+	elif kind == "ndjson":
+		encode = lambda item: json_item(item) + b"\n"
+		headers = {}
+	else:
+		encode = _raw_chunk
+		headers = {}
+	# Raw streams use the declared media type only when one was given.
+	media_type = MEDIA_TYPES.get(kind) or (
+		declared.media_type if "media_type" in declared.model_fields_set else "application/octet-stream"
+	)
+
+	async def endpoint(request: Request) -> Response:
+		result = await handler(request)
+		if isinstance(result, Response):
+			return result
+		return StreamingResponse(
+			_map(_as_items(result), encode),
+			status_code=status_code,
+			media_type=media_type,
+			headers=headers
+		)
+
+	return endpoint
@@ -0,0 +1,333 @@
+"""Pre-fork worker supervisor."""
+from __future__ import annotations
+
+import os
+import select
+import signal
+import socket
+import time
+from types import FrameType
+from typing import Callable, Dict, List, Optional, Tuple
+
+import uvicorn
+from fastapi import FastAPI
+
+from zyro.core.config.schema import ServerConfig
+from zyro.core.exceptions import ServerError, ZyroError
+from zyro.core.logging import Logger, stop_logging
+from zyro.core.manager.registry import InstanceRegistry
+
+
+class _Wakeup(Exception):
+    """Interrupts the supervisor's wait for a worker to exit."""
+
+
+class _ReadyServer(uvicorn.Server):
+    """Uvicorn server that reports on a pipe once it accepts connections."""
+
+    def __init__(self, config: uvicorn.Config, ready_fd: Optional[int]) -> None:
+        super().__init__(config)
+        self.ready_fd = ready_fd
+
+    async def startup(self, sockets: Optional[List[socket.socket]] = None) -> None:
+        await super().startup(sockets=sockets)
+        if self.ready_fd is not None:
+            fd, self.ready_fd = self.ready_fd, None
+            if not self.should_exit:
+                os.write(fd, b"1")
+            os.close(fd)
+
+
+class WorkerSupervisor(Logger):
+    """Forks worker processes that serve the app from one shared listening socket.
+
+    SIGHUP reloads without downtime: a new generation of workers is built
+    from ``reload_factory`` and, once every new worker accepts connections,
+    the old generation drains in-flight requests and exits.
+    """
+
+    _BACKLOG = 2048
+    # Workers dying faster than this after spawn are restarted with a delay,
+    # so a broken app doesn't turn into a fork loop.
+    _MIN_UPTIME = 1.0
+    _RESTART_DELAY = 1.0
+
+    def __init__(
+        self,
+        app_factory: Callable[[], FastAPI],
+        server_config: ServerConfig,
+        registry: Optional[InstanceRegistry] = None,
+        instance_key: Optional[str] = None,
+        reload_factory: Optional[Callable[[], Tuple[Callable[[], FastAPI], ServerConfig]]] = None,
+    ) -> None:
+        super().__init__()
+        self.app_factory = app_factory
+        self.server_config = server_config
+        self.registry = registry
+        self.instance_key = instance_key
+        self.reload_factory = reload_factory
+        self.workers: Dict[int, float] = {}
+        self._socket: Optional[socket.socket] = None
+        self._shutting_down = False
+        self._reload_requested = False
+        self._waiting = False
+
+    def bind(self) -> socket.socket:
+        """Bind the listening socket shared by every worker."""
+
+        host, port = self.server_config.host, self.server_config.port
+        family = socket.AF_INET6 if ":" in host else socket.AF_INET
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind((host, port))
+            sock.listen(self._BACKLOG)
+        except OSError as e:
+            sock.close()
+            raise ServerError(f"Failed to bind {host}:{port}: {e}") from e
+        sock.set_inheritable(True)
+        return sock
+
+    def run(self) -> None:
+        """Spawn the workers and keep them alive until asked to stop."""
+
+        self._socket = self.bind()
+        signal.signal(signal.SIGINT, self._handle_exit)
+        signal.signal(signal.SIGTERM, self._handle_exit)
+        signal.signal(signal.SIGHUP, self._handle_reload)
+
+        self.logger.info(
+            "Starting %d workers on %s:%d (supervisor PID %d)",
+            self.server_config.workers,
+            self.server_config.host,
+            self.server_config.port,
+            os.getpid(),
+        )
+        for _ in range(self.server_config.workers):
+            self._spawn()
+        self._record_workers()
+
+        try:
+            while self.workers:
+                try:
+                    # A SIGHUP while blocked in wait() raises _Wakeup; one that
+                    # arrives before is seen through the flag.
+                    self._waiting = True
+                    if self._reload_requested:
+                        self._waiting = False
+                        self._reload_requested = False
+                        if not self._shutting_down:
+                            self.reload()
+                        continue
+                    pid, status = os.wait()
+                except _Wakeup:
+                    continue
+                except ChildProcessError:
+                    break
+                finally:
+                    self._waiting = False
+
+                self._reap(pid, status)
+        finally:
+            self._socket.close()
+            self.logger.info("All workers stopped")
+
+    def _reap(self, pid: int, status: int) -> None:
+        """Restart a worker that exited unexpectedly."""
+
+        spawned_at = self.workers.pop(pid, None)
+        if spawned_at is None or self._shutting_down:
+            return
+
+        self.logger.warning(
+            "Worker %d exited with code %d, restarting",
+            pid,
+            os.waitstatus_to_exitcode(status),
+        )
+        if time.monotonic() - spawned_at < self._MIN_UPTIME:
+            time.sleep(self._RESTART_DELAY)
+        if not self._shutting_down:
+            self._spawn()
+            self._record_workers()
+
+    def reload(self) -> bool:
+        """Replace every worker with one built from the reloaded config.
+
+        The old generation keeps serving until the whole new generation is
+        ready; if it isn't, the new workers are stopped and nothing changes.
+        """
+
+        if self.reload_factory is None:
+            self.logger.warning("Reload requested, but this server can't reload its config")
+            self._record_reload(False)
+            return False
+        try:
+            app_factory, server_config = self.reload_factory()
+        except ZyroError as e:
+            self.logger.error("Reload rejected, keeping current workers: %s", e)
+            self._record_reload(False)
+            return False
+        except Exception:
+            # e.g. the config file was moved away; the running generation must survive it.
+            self.logger.exception("Reload failed, keeping current workers")
+            self._record_reload(False)
+            return False
+        if (server_config.host, server_config.port) != (self.server_config.host, self.server_config.port):
+            self.logger.warning("Address changed in the config; restart to apply it")
+            server_config = server_config.model_copy(
+                update={"host": self.server_config.host, "port": self.server_config.port}
+            )
+
+        old_workers = dict(self.workers)
+        old_factory, old_config = self.app_factory, self.server_config
+        self.app_factory, self.server_config = app_factory, server_config
+        self.logger.info("Reloading: starting %d new workers", server_config.workers)
+
+        pending: Dict[int, int] = {}
+        for _ in range(server_config.workers):
+            read_fd, write_fd = os.pipe()
+            pid = self._spawn(ready_fd=write_fd)
+            os.close(write_fd)
+            pending[read_fd] = pid
+
+        deadline = time.monotonic() + server_config.ready_timeout
+        failed = False
+        while pending and not failed:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                failed = True
+                break
+            readable, _, _ = select.select(list(pending), [], [], remaining)
+            for fd in readable:
+                # EOF without a byte: the worker exited or failed its startup.
+                if not os.read(fd, 1):
+                    failed = True
+                os.close(fd)
+                pending.pop(fd)
+        for fd in pending:
+            os.close(fd)
+
+        new_pids = [pid for pid in self.workers if pid not in old_workers]
+        if failed or self._shutting_down:
+            self.logger.error("Reload failed: new workers didn't become ready, keeping current workers")
+            self.app_factory, self.server_config = old_factory, old_config
+            self._retire(new_pids, old_config.graceful_timeout)
+            self._record_reload(False)
+            return False
+
+        self.logger.info("New workers ready; draining %d old workers", len(old_workers))
+        self._retire(list(old_workers), server_config.graceful_timeout)
+        self._record_workers()
+        self._record_reload(True)
+        self.logger.info("Reload complete")
+        return True
+
+    def _retire(self, pids: List[int], grace: float) -> None:
+        """SIGTERM workers, let them finish in-flight requests, SIGKILL them after grace."""
+
+        retiring = set(pids)
+        for pid in retiring:
+            self.workers.pop(pid, None)
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+        # Uvicorn gives up on in-flight requests after the grace period; allow
+        # it a moment to exit before killing it.
+        deadline = time.monotonic() + grace + self._RESTART_DELAY
+        while retiring:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                if time.monotonic() < deadline:
+                    time.sleep(0.05)
+                    continue
+                for pid in retiring:
+                    self.logger.warning("Worker %d didn't drain within %gs, killing it", pid, grace)
+                    try:
+                        os.kill(pid, signal.SIGKILL)
+                    except ProcessLookupError:
+                        pass
+                deadline = float("inf")
+                continue
+            if pid in retiring:
+                retiring.discard(pid)
+            else:
+                self._reap(pid, status)
+
+    def _spawn(self, ready_fd: Optional[int] = None) -> int:
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 0
+            try:
+                self._run_worker(ready_fd)
+            except SystemExit as e:
+                exit_code = e.code if isinstance(e.code, int) else 1
+            except BaseException:
+                self.logger.exception("Worker %d crashed", os.getpid())
+                exit_code = 1
+            finally:
+                # os._exit skips atexit; write out queued log records first
+                stop_logging()
+                os._exit(exit_code)
+
+        self.workers[pid] = time.monotonic()
+        self.logger.info("Spawned worker %d", pid)
+        return pid
+
+    def _run_worker(self, ready_fd: Optional[int] = None) -> None:
+        # Drop the supervisor's handlers; uvicorn installs its own and
+        # re-raises the signal on shutdown, which then exits through Python
+        # so queued log records are still written.
+        signal.signal(signal.SIGINT, self._exit_worker)
+        signal.signal(signal.SIGTERM, self._exit_worker)
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+
+        app = self.app_factory()
+        config = uvicorn.Config(
+            app=app,
+            log_level=self.server_config.log_level.lower(),
+            log_config=None,
+            access_log=False,
+            timeout_graceful_shutdown=self.server_config.graceful_timeout,
+        )
+        _ReadyServer(config, ready_fd).run(sockets=[self._socket])
+
+    @staticmethod
+    def _exit_worker(sig: int, frame: Optional[FrameType]) -> None:
+        raise SystemExit(128 + sig)
+
+    def _handle_exit(self, sig: int, frame: Optional[FrameType]) -> None:
+        if self._shutting_down:
+            return
+        self._shutting_down = True
+        self.logger.info("Received signal %d, stopping workers", sig)
+        for pid in list(self.workers):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def _handle_reload(self, sig: int, frame: Optional[FrameType]) -> None:
+        self._reload_requested = True
+        if self._waiting:
+            raise _Wakeup()
+
+    def _record_workers(self) -> None:
+        if self.registry is None or self.instance_key is None:
+            return
+        try:
+            self.registry.set_workers(self.instance_key, self.workers)
+        except Exception:
+            pass
+
+    def _record_reload(self, ok: bool) -> None:
+        if self.registry is None or self.instance_key is None:
+            return
+        try:
+            self.registry.record_reload(self.instance_key, ok)
+        except Exception:
+            pass
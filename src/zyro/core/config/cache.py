@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import glob
+import hashlib
+import os
+import pickle
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pydantic
+
+from zyro.core.config import route_index, schema, validator
+from zyro.core.config.loader import parse_config
+from zyro.core.config.schema import EndpointConfig
+from zyro.core.config.validator import (
+	ValidatorResult,
+	check_routes,
+	ensure_no_duplicates,
+	valid_config,
+	valid_fragment,
+)
+from zyro.core.exceptions import ConfigLoadError
+
+# Bump when the layout of the cached artifact changes.
+_CACHE_VERSION = 3
+
+# (mtime_ns, size, sha256) of a source file when it was compiled.
+SourceRecord = Tuple[int, int, str]
+
+# Header keys of each kind of artifact. Main configs and included fragments
+# share build keys and digests, so a header of the wrong kind is a miss.
+_HEADER_KEYS = {
+	"config": ("key", "digest", "include", "main_routes", "sources", "warnings", "duplicates", "shadowed"),
+	"fragment": ("key", "digest", "stamp", "routes"),
+}
+
+
+def cache_path(file_path: Path, kind: str = "config") -> Path:
+	"""Location of the compiled artifact for a config file, or for it as an included fragment."""
+
+	suffix = ".zyroc" if kind == "config" else f".{kind}.zyroc"
+	return file_path.with_name(f".{file_path.name}{suffix}")
+
+
+def _digest(content: bytes) -> str:
+	return hashlib.sha256(content).hexdigest()
+
+
+@lru_cache
+def _build_key() -> str:
+	"""Fingerprint of everything besides the YAML that shapes the artifact."""
+
+	parts = [
+		str(_CACHE_VERSION),
+		"%d.%d" % sys.version_info[:2],
+		pydantic.VERSION,
+		_digest(Path(schema.__file__).read_bytes()),
+		_digest(Path(validator.__file__).read_bytes()),
+		# Cached warnings, duplicates and shadowed routes come from the route index
+		_digest(Path(route_index.__file__).read_bytes()),
+	]
+	return ":".join(parts)
+
+
+def _read_artifact(path: Path, kind: str, with_payload: bool = False) -> Optional[Dict[str, Any]]:
+	"""Read an artifact's header, and its payload of validated models when asked.
+
+	The two are separate pickles so callers that only need route keys never
+	pay for unpickling thousands of models. An artifact of another kind or
+	with missing keys reads as None.
+	"""
+
+	try:
+		with path.open("rb") as file:
+			header = pickle.load(file)
+			if (
+				not isinstance(header, dict)
+				or header.get("kind") != kind
+				or any(name not in header for name in _HEADER_KEYS[kind])
+			):
+				return None
+			if with_payload:
+				try:
+					payload = pickle.load(file)
+				except EOFError:
+					payload = None
+				header["payload"] = payload if isinstance(payload, dict) else None
+	except FileNotFoundError:
+		return None
+	except Exception:
+		# Corrupt or incompatible artifact, it gets rebuilt.
+		return None
+	return header
+
+
+def _write_artifact(
+	path: Path, kind: str, header: Dict[str, Any], payload: Optional[Dict[str, Any]] = None
+) -> None:
+	header = {"kind": kind, **header}
+	tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+	try:
+		with tmp_path.open("wb") as file:
+			pickle.dump(header, file, protocol=pickle.HIGHEST_PROTOCOL)
+			if payload is not None:
+				pickle.dump(payload, file, protocol=pickle.HIGHEST_PROTOCOL)
+		os.replace(tmp_path, path)
+	except OSError:
+		# The cache is an optimisation; read-only config dirs still work.
+		try:
+			tmp_path.unlink()
+		except OSError:
+			pass
+
+
+def _read_source(file_path: Path) -> bytes:
+	try:
+		return file_path.read_bytes()
+	except FileNotFoundError:
+		raise ConfigLoadError(f"Configuration file not found: {file_path}")
+	except OSError as e:
+		raise ConfigLoadError(f"Failed to read configuration file {file_path}: {e}") from e
+
+
+def _stamp(file_path: Path) -> Tuple[int, int]:
+	stat = file_path.stat()
+	return stat.st_mtime_ns, stat.st_size
+
+
+def source_files(file_path: Path, patterns: List[str]) -> List[Path]:
+	"""Files matched by a config's include patterns, in a stable order."""
+
+	files: List[Path] = []
+	seen = {file_path.resolve()}
+	for pattern in patterns:
+		full_pattern = pattern if os.path.isabs(pattern) else str(file_path.parent / pattern)
+		matches = sorted(glob.glob(full_pattern, recursive=True))
+		if not matches and not glob.has_magic(pattern):
+			raise ConfigLoadError(f"Included file not found: {pattern} (from {file_path})")
+		for match in matches:
+			path = Path(match)
+			resolved = path.resolve()
+			if resolved in seen or not path.is_file():
+				continue
+			seen.add(resolved)
+			files.append(path)
+	return files
+
+
+def _sources_unchanged(recorded: Dict[str, SourceRecord], files: List[Path]) -> bool:
+	"""Whether included files match what the artifact was built from; stat first, hash only on doubt."""
+
+	if [str(f) for f in files] != list(recorded):
+		return False
+	for f in files:
+		mtime_ns, size, digest = recorded[str(f)]
+		try:
+			if _stamp(f) != (mtime_ns, size) and _digest(f.read_bytes()) != digest:
+				return False
+		except OSError:
+			return False
+	return True
+
+
+def _load_fragment(
+	file_path: Path, key: str, use_cache: bool, need_endpoints: bool
+) -> Tuple[Optional[List[EndpointConfig]], List[Tuple[str, str]], SourceRecord]:
+	"""Route keys (and endpoints when needed) of an included file, revalidated only when it changed."""
+
+	artifact_path = cache_path(file_path, "fragment")
+	try:
+		stamp = _stamp(file_path)
+	except OSError as e:
+		raise ConfigLoadError(f"Failed to read configuration file {file_path}: {e}") from e
+
+	artifact = _read_artifact(artifact_path, "fragment", with_payload=need_endpoints) if use_cache else None
+	if artifact is not None and (
+		artifact["key"] != key or (need_endpoints and "endpoints" not in (artifact["payload"] or {}))
+	):
+		artifact = None
+
+	if artifact is not None and artifact["stamp"] == stamp:
+		endpoints = artifact["payload"]["endpoints"] if need_endpoints else None
+		return endpoints, artifact["routes"], (*stamp, artifact["digest"])
+
+	content = _read_source(file_path)
+	digest = _digest(content)
+	payload = None
+	if artifact is not None and artifact["digest"] == digest:
+		# Touched but unchanged: keep the validated fragment, refresh the stamp.
+		routes = artifact["routes"]
+		payload = artifact.get("payload")
+		if payload is None:
+			# The artifact may have been replaced since its header was read
+			reread = _read_artifact(artifact_path, "fragment", with_payload=True)
+			if reread is not None and reread["key"] == key and reread["digest"] == digest:
+				payload = reread["payload"]
+	if payload is None or "endpoints" not in payload:
+		endpoints, routes = valid_fragment(parse_config(content, file_path), str(file_path))
+		payload = {"endpoints": endpoints}
+
+	if use_cache:
+		_write_artifact(
+			artifact_path, "fragment", {"key": key, "digest": digest, "stamp": stamp, "routes": routes}, payload
+		)
+	endpoints = payload["endpoints"] if need_endpoints and payload else None
+	return endpoints, routes, (*stamp, digest)
+
+
+def compile_config(
+	file_path: Path, strict: bool = True, use_cache: bool = True, need_config: bool = True
+) -> ValidatorResult:
+	"""Load and validate a config file and its includes, reusing compiled artifacts of unchanged files.
+
+	With need_config=False only warnings and duplicates are computed, which is
+	all ``zyro validate`` needs, and the result carries no config.
+	"""
+
+	content = _read_source(file_path)
+	digest = _digest(content)
+	artifact_path = cache_path(file_path)
+	key = _build_key()
+
+	artifact = _read_artifact(artifact_path, "config", with_payload=need_config) if use_cache else None
+	if artifact is not None and (artifact["key"] != key or artifact["digest"] != digest):
+		artifact = None
+
+	main_config = None
+	if artifact is not None:
+		include = artifact["include"]
+		main_routes = artifact["main_routes"]
+		files = source_files(file_path, include)
+		payload = artifact.get("payload")
+		if need_config and payload:
+			main_config = payload.get("main_config")
+		complete = not need_config or (payload is not None and "config" in payload and "routes" in payload)
+		if _sources_unchanged(artifact["sources"], files) and complete:
+			if strict:
+				ensure_no_duplicates(artifact["duplicates"], artifact["shadowed"])
+			return ValidatorResult(
+				warnings=artifact["warnings"], duplicates=artifact["duplicates"], shadowed=artifact["shadowed"],
+				config=payload["config"] if need_config else None,
+				routes=payload["routes"] if need_config else [], sources=[file_path, *files],
+			)
+	if main_config is None and (artifact is None or need_config):
+		main = valid_config(parse_config(content, file_path), strict=False)
+		main_config, main_routes, include = main.config, main.routes, main.config.include
+		files = source_files(file_path, include)
+
+	# Fragments carry their route keys, so cross-file checks need no revalidation
+	endpoints = list(main_config.endpoints) if need_config else []
+	routes = list(main_routes)
+	records: Dict[str, SourceRecord] = {}
+	for f in files:
+		fragment_endpoints, fragment_routes, records[str(f)] = _load_fragment(f, key, use_cache, need_config)
+		if need_config:
+			endpoints.extend(fragment_endpoints)
+		routes.extend(fragment_routes)
+	warnings, duplicates, shadowed = check_routes(routes)
+
+	config = None
+	if need_config:
+		config = main_config.model_copy(update={"endpoints": endpoints}) if files else main_config
+
+	if use_cache:
+		header = {
+			"key": key, "digest": digest, "include": include, "main_routes": main_routes,
+			"sources": records, "warnings": warnings, "duplicates": duplicates, "shadowed": shadowed,
+		}
+		if need_config:
+			payload = {"main_config": main_config, "config": config, "routes": routes}
+		else:
+			# Keep the validated main config so the next start only merges the
+			# fragments; the merged config is rebuilt then.
+			if main_config is None and artifact is not None:
+				previous = _read_artifact(artifact_path, "config", with_payload=True)
+				if previous is not None and previous["key"] == key and previous["digest"] == digest:
+					main_config = (previous["payload"] or {}).get("main_config")
+			payload = {"main_config": main_config} if main_config is not None else None
+		_write_artifact(artifact_path, "config", header, payload)
+
+	if strict:
+		ensure_no_duplicates(duplicates, shadowed)
+	return ValidatorResult(
+		warnings=warnings, duplicates=duplicates, config=config, routes=routes if need_config else [],
+		sources=[file_path, *files], shadowed=shadowed,
+	)
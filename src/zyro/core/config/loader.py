@@ -35,4 +35,23 @@ def load_config(file_path: Path) -> Dict[str, Any]:
 	except Exception as e:
 	    raise ConfigLoadError(
 	        f"Unexpected error while loading configuration file {file_path}: {e}"
-	    ) from e
\ No newline at end of file
+	    ) from e
+
+
+def parse_config(content: bytes, file_path: Path) -> Dict[str, Any]:
+	"""Parse YAML content read from file_path into a python dictionary."""
+
+	try:
+		config = yaml.load(content, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+	except yaml.YAMLError as e:
+		raise ConfigLoadError(f"Failed to parse YAML in {file_path}: {e}") from e
+
+	if config is None:
+		raise ConfigLoadError(f"Configuration file not found: {file_path}") 
+
+	if not isinstance(config, dict):
+		raise ConfigLoadError(
+			f"Configuration file {file_path} must contain a valid YAML dictionary."
+		)
+
+	return config
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Pattern, Set, Tuple
+
+# Same patterns as Starlette's path convertors, so matching agrees with FastAPI.
+CONVERTOR_PATTERNS: Dict[str, Pattern[str]] = {
+	"str": re.compile("[^/]+"),
+	"path": re.compile(".*"),
+	"int": re.compile("[0-9]+"),
+	"float": re.compile(r"[0-9]+(\.[0-9]+)?"),
+	"uuid": re.compile(
+		"[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}"
+	),
+}
+
+# Convertors whose matches include every match of the other convertor.
+_COVERS: Dict[str, Set[str]] = {
+	"str": {"str", "int", "float", "uuid"},
+	"path": {"str", "int", "float", "uuid", "path"},
+	"int": {"int"},
+	"float": {"float", "int"},
+	"uuid": {"uuid"},
+}
+
+ANY_METHOD = "*"
+
+# A parsed path segment: ("static", text) or ("param", (name, convertor)).
+Segment = Tuple[str, Any]
+
+
+def parse_path(path: str) -> Optional[List[Segment]]:
+	"""Split a route path into segments, or None when it can't be indexed.
+
+	Only whole-segment parameters are indexed, and a ``path`` parameter must
+	be the last segment; anything else is left to FastAPI's linear matching.
+	"""
+
+	segments: List[Segment] = []
+	parts = path.split("/")[1:]
+	for i, part in enumerate(parts):
+		if "{" not in part and "}" not in part:
+			segments.append(("static", part))
+			continue
+		if not (part.startswith("{") and part.endswith("}")) or part.count("{") != 1:
+			return None
+		name, _, convertor = part[1:-1].partition(":")
+		convertor = convertor or "str"
+		if convertor not in CONVERTOR_PATTERNS or (convertor == "path" and i != len(parts) - 1):
+			return None
+		segments.append(("param", (name, convertor)))
+	return segments
+
+
+@dataclass
+class IndexedRoute:
+	"""A route stored at a trie node."""
+
+	order: int
+	method: str
+	path: str
+	names: Tuple[str, ...]
+	convertors: Tuple[str, ...]
+	payload: Any
+
+
+class _ParamEdge:
+	__slots__ = ("convertor", "pattern", "node", "names")
+
+	def __init__(self, convertor: str) -> None:
+		self.convertor = convertor
+		self.pattern = CONVERTOR_PATTERNS[convertor]
+		self.node = _Node()
+		self.names: Set[str] = set()
+
+
+class _Node:
+	__slots__ = ("static", "params", "routes")
+
+	def __init__(self) -> None:
+		self.static: Dict[str, _Node] = {}
+		self.params: Dict[str, _ParamEdge] = {}
+		self.routes: Dict[str, IndexedRoute] = {}
+
+
+class RouteTrie:
+	"""Radix trie of route paths; lookups cost O(path length), not O(routes).
+
+	Routes keep their declaration order and a lookup returns the earliest
+	matching route, which is the one FastAPI's linear scan would pick.
+	"""
+
+	def __init__(self) -> None:
+		self.root = _Node()
+		self.size = 0
+		# Order of the first route that couldn't be indexed; later matches are unsafe.
+		self.barrier: Optional[int] = None
+		self.warnings: List[str] = []
+		self.shadowed: List[Tuple[str, str]] = []
+
+	def add_unindexed(self) -> None:
+		"""Record a route the trie can't represent, keeping declaration order."""
+
+		if self.barrier is None:
+			self.barrier = self.size
+		self.size += 1
+
+	def insert(self, method: str, path: str, payload: Any = None, check: bool = False) -> bool:
+		"""Add a route; with check, first record whether an earlier route shadows it."""
+
+		segments = parse_path(path)
+		if segments is None:
+			self.add_unindexed()
+			return False
+
+		if check:
+			self._check_shadowing(method, path, segments)
+
+		node = self.root
+		prefix = ""
+		names: List[str] = []
+		convertors: List[str] = []
+		for kind, value in segments:
+			if kind == "static":
+				node = node.static.setdefault(value, _Node())
+				prefix += "/" + value
+				continue
+			name, convertor = value
+			edge = node.params.get(convertor)
+			if edge is None:
+				edge = node.params[convertor] = _ParamEdge(convertor)
+			if check and edge.names and name not in edge.names:
+				self.warnings.append(
+					f"Parameter name conflict at {prefix}/{{...}}: "
+					f"{', '.join(sorted(edge.names))} vs {name} ({method} {path})"
+				)
+			edge.names.add(name)
+			node = edge.node
+			prefix += "/{" + name + "}"
+			names.append(name)
+			convertors.append(convertor)
+
+		if method not in node.routes:
+			node.routes[method] = IndexedRoute(
+				self.size, method, path, tuple(names), tuple(convertors), payload
+			)
+		self.size += 1
+		return True
+
+	def _check_shadowing(self, method: str, path: str, segments: List[Segment]) -> None:
+		for earlier in self._covering(self.root, segments, 0):
+			route = earlier.routes.get(method) or earlier.routes.get(ANY_METHOD)
+			if route is None or route.path == path:
+				# Exact duplicates are reported by duplicate detection.
+				continue
+			self.shadowed.append((method, path))
+			self.warnings.append(
+				f"Unreachable route: {method} {path} is shadowed by {route.method} {route.path} declared earlier"
+			)
+			return
+
+	def _covering(self, node: _Node, segments: List[Segment], index: int) -> List[_Node]:
+		"""Nodes of earlier routes matching every path the segments can match."""
+
+		if index == len(segments):
+			return [node]
+
+		kind, value = segments[index]
+		found: List[_Node] = []
+		if kind == "static":
+			child = node.static.get(value)
+			if child is not None:
+				found.extend(self._covering(child, segments, index + 1))
+			for convertor, edge in node.params.items():
+				if convertor == "path":
+					found.append(edge.node)
+				elif edge.pattern.fullmatch(value):
+					found.extend(self._covering(edge.node, segments, index + 1))
+		else:
+			_, convertor = value
+			for edge_convertor, edge in node.params.items():
+				if convertor not in _COVERS[edge_convertor]:
+					continue
+				if edge_convertor == "path":
+					found.append(edge.node)
+				else:
+					found.extend(self._covering(edge.node, segments, index + 1))
+		return found
+
+	def match(self, method: str, path: str) -> Optional[Tuple[IndexedRoute, Dict[str, str]]]:
+		"""Earliest route matching method and path, with raw parameter values."""
+
+		parts = path.split("/")[1:]
+		best: Optional[IndexedRoute] = None
+		best_values: List[str] = []
+
+		stack: List[Tuple[_Node, int, List[str]]] = [(self.root, 0, [])]
+		while stack:
+			node, index, values = stack.pop()
+			if index == len(parts):
+				route = node.routes.get(method) or node.routes.get(ANY_METHOD)
+				if route is not None and (best is None or route.order < best.order):
+					best, best_values = route, values
+				continue
+
+			part = parts[index]
+			child = node.static.get(part)
+			if child is not None:
+				stack.append((child, index + 1, values))
+			for convertor, edge in node.params.items():
+				if convertor == "path":
+					remainder = "/".join(parts[index:])
+					route = edge.node.routes.get(method) or edge.node.routes.get(ANY_METHOD)
+					if route is not None and (best is None or route.order < best.order):
+						best, best_values = route, values + [remainder]
+				elif part and edge.pattern.fullmatch(part):
+					stack.append((edge.node, index + 1, values + [part]))
+
+		if best is None or (self.barrier is not None and best.order > self.barrier):
+			return None
+		return best, dict(zip(best.names, best_values))
+
+
+def analyze_routes(routes: List[Tuple[str, str]]) -> Tuple[List[str], List[Tuple[str, str]]]:
+	"""Warnings about ambiguous routes and the (method, path) keys that can never match."""
+
+	trie = RouteTrie()
+	for method, path in routes:
+		trie.insert(method, path, check=True)
+	return trie.warnings, trie.shadowed
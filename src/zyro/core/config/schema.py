@@ -3,8 +3,8 @@ from dataclasses import field
 import decimal
 from io import FileIO
 from pathlib import Path 
-from pydantic import BaseModel, Field, field_validator, model_validator
-from typing import Dict, Literal, List, Optional, Union
+from pydantic import AliasChoices, BaseModel, Field, field_validator, model_validator
+from typing import Any, Dict, Literal, List, Optional, Tuple, Union
 from pydantic_core.core_schema import DatetimeSchema
 from zyro.core.exceptions import InvalidStatusCode, InvalidRoute
 
@@ -21,13 +21,123 @@ class ProjectConfig(BaseModel):
 	environment: str = Field("dev", description="Environment of the project") 
 
 
+class MetricsConfig(BaseModel):
+    """Prometheus metrics settings."""
+
+    enabled: bool = Field(False, description="Record per-route metrics and serve them at 'path'.")
+    path: str = Field("/metrics", description="Path the metrics are served at.")
+    buckets: List[float] = Field(
+        default_factory=lambda: [0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+        min_length=1,
+        description="Upper bounds, in seconds, of the request latency histogram buckets.",
+    )
+
+    @field_validator("path", mode="before")
+    @classmethod
+    def normalize_path(cls, v: str) -> str:
+        """Ensures leading slash."""
+        return v if v.startswith("/") else "/" + v
+
+    @field_validator("buckets")
+    @classmethod
+    def sort_buckets(cls, v: List[float]) -> List[float]:
+        """Buckets must be positive; keep them sorted and unique."""
+        if any(bound <= 0 for bound in v):
+            raise ValueError("Histogram buckets must be positive")
+        return sorted(set(v))
+
+
+class AccessLogConfig(BaseModel):
+    """Access log sampling; routes can override any of these."""
+
+    sample_rate: float = Field(1.0, ge=0, le=1, description="Fraction of requests logged (0 disables).")
+    error_sample_rate: float = Field(1.0, ge=0, le=1, description="Fraction of 5xx responses logged.")
+    level: LogLevel = Field("INFO", description="Level access lines are logged at.")
+
+
+class CompressionConfig(BaseModel):
+    """Response compression settings."""
+
+    enabled: bool = Field(False, description="Compress responses the client accepts compressed.")
+    algorithms: List[Literal["br", "zstd", "gzip"]] = Field(
+        default_factory=lambda: ["br", "zstd", "gzip"],
+        description="Encodings in order of preference; br and zstd need brotli/zstandard installed.",
+    )
+    min_size: int = Field(500, ge=0, description="Bodies smaller than this many bytes are sent uncompressed.")
+    gzip_level: int = Field(6, ge=1, le=9, description="gzip compression level.")
+    brotli_quality: int = Field(4, ge=0, le=11, description="Brotli quality.")
+    zstd_level: int = Field(3, ge=1, le=22, description="zstd compression level.")
+    content_types: List[str] = Field(
+        default_factory=lambda: [
+            "application/json",
+            "application/problem+json",
+            "application/x-ndjson",
+            "application/javascript",
+            "application/xml",
+            "image/svg+xml",
+            "text/html",
+            "text/plain",
+            "text/css",
+            "text/csv",
+            "text/xml",
+        ],
+        description="Media types that get compressed; 'type/*' matches a whole type.",
+    )
+
+    @field_validator("content_types")
+    @classmethod
+    def normalize_content_types(cls, v: List[str]) -> List[str]:
+        """Media types are matched in lower case."""
+        return [t.strip().lower() for t in v]
+
+
+class ConcurrencyConfig(BaseModel):
+    """Limit on concurrently running handlers, with a bounded wait queue."""
+
+    max_concurrency: Optional[int] = Field(None, ge=1, description="Handlers allowed to run at once (unlimited if unset).")
+    max_queue: int = Field(100, ge=0, description="Requests allowed to wait for a slot; more are rejected at once.")
+    queue_timeout: float = Field(5.0, gt=0, description="Seconds a request waits for a slot before it is rejected.")
+    reject_status: Literal[429, 503] = Field(503, description="Status code of rejected requests.")
+
+
 class ServerConfig(BaseModel):
     """Server deployment configuration."""
 
     host: str = Field("0.0.0.0", description="Host/interface to bind (e.g. 0.0.0.0 or 127.0.0.1).")
     port: int = Field(8000, ge=1, le=65535, description="Port number to bind the application.")
-    hot_reload: bool = Field(True, description="Enable automatic reload on source changes (for development).")
+    hot_reload: bool = Field(
+        False, description="Reload routes when the config file changes (for development; every worker watches it)."
+    )
     log_level: LogLevel = Field("INFO", description="Logging level for the application.")
+    workers: int = Field(1, ge=1, description="Number of worker processes sharing the listening socket.")
+    handler_loading: Literal["eager", "lazy"] = Field(
+        "eager", description="Import route handlers at startup (eager) or on their first request (lazy)."
+    )
+    router: Literal["fastapi", "trie"] = Field(
+        "fastapi", description="Match requests by FastAPI's linear scan or by a route trie."
+    )
+    graceful_timeout: int = Field(
+        30, ge=0, description="Seconds a stopping worker gets to finish in-flight requests."
+    )
+    ready_timeout: float = Field(
+        30.0, gt=0, description="Seconds new workers get to start accepting connections during a reload."
+    )
+    thread_pool_size: int = Field(32, ge=1, description="Threads running handlers with executor 'thread'.")
+    process_pool_size: Optional[int] = Field(
+        None, ge=1, description="Processes running handlers with executor 'process'; defaults to the CPU count."
+    )
+    json_backend: Literal["stdlib", "orjson", "msgspec"] = Field(
+        "stdlib", description="Library encoding JSON responses; falls back to stdlib when not installed."
+    )
+    validate_responses: bool = Field(
+        True, description="Validate handler results against response models; disable to only serialize them."
+    )
+    metrics: MetricsConfig = Field(default_factory=MetricsConfig, description="Prometheus metrics endpoint.")
+    access_log: AccessLogConfig = Field(default_factory=AccessLogConfig, description="Access log sampling.")
+    concurrency: ConcurrencyConfig = Field(
+        default_factory=ConcurrencyConfig, description="Server-wide cap on concurrently running handlers."
+    )
+    compression: CompressionConfig = Field(default_factory=CompressionConfig, description="Response compression.")
 
 
 class SchemasConfig(BaseModel):
@@ -41,9 +151,92 @@ class RouteResponse(BaseModel):
 	"""Response Schema for the Routes."""
 
 	response_model: Optional[Union[str, SchemasConfig]] = Field(
-		None, description="Optional reference to a response model/schema."
+		None, 
+		validation_alias=AliasChoices("response_model", "model"), 
+		description="Optional reference to a response model/schema (a schemas.models name or import path)."
+	)
+	content: Optional[Any] = Field(
+		None, description="Static body served for this status code; makes the route static."
+	)
+	type: Literal["json", "stream", "sse", "ndjson"] = Field(
+		"json", 
+		description="json buffers the handler result; stream, sse and ndjson send the items a generator handler yields as they come."
+	)
+	media_type: str = Field("application/json", description="Media type of the static content or raw stream.")
+	headers: Dict[str, str] = Field(default_factory=dict, description="Extra headers sent with the static content.")
+
+	@field_validator("response_model", mode="before")
+	@classmethod
+	def normalize_model(cls, v: Any) -> Any:
+		"""YAML configs spell a missing model as the string 'None'."""
+		if isinstance(v, str) and v.strip() in ("", "None", "null"):
+			return None
+		return v 
+
+
+class CacheVaryConfig(BaseModel):
+	"""Request parts that make up a response cache key."""
+
+	path_params: bool = Field(True, description="Key on path parameter values.")
+	query: Union[bool, List[str]] = Field(
+		True, description="Key on all query params (true), none (false) or only the listed names."
+	)
+	headers: List[str] = Field(default_factory=list, description="Request headers the response varies by.")
+
+
+class RouteCacheConfig(BaseModel):
+	"""Response cache settings for a route."""
+
+	ttl: float = Field(60, gt=0, description="Seconds a cached response stays fresh.")
+	max_entries: int = Field(1024, ge=1, description="Maximum number of cached responses for the route.")
+	max_bytes: int = Field(
+		16 * 1024 * 1024, ge=1, description="Maximum total body bytes cached for the route (memory backend)."
+	)
+	vary_by: CacheVaryConfig = Field(default_factory=CacheVaryConfig, description="What the cache key is built from.")
+	backend: Literal["memory", "shared", "redis"] = Field(
+		"memory", description="memory (per process), shared (across workers on this host) or redis."
+	)
+	url: Optional[str] = Field(None, description="Server URL for the redis backend, e.g. redis://127.0.0.1:6379/0")
+	private: bool = Field(
+		False,
+		description="Send Cache-Control: private instead of public; always private for requests with credentials.",
 	)
 
+	@model_validator(mode="after")
+	def ensure_redis_url(self) -> "RouteCacheConfig":
+		"""The redis backend needs a server URL."""
+		if self.backend == "redis" and not self.url:
+			raise ValueError("Cache backend 'redis' requires 'url'")
+		return self 
+
+
+class RateLimitConfig(BaseModel):
+	"""Token-bucket rate limit, counted per client."""
+
+	requests: int = Field(..., ge=1, description="Requests allowed per window.")
+	window: float = Field(60, gt=0, description="Window length in seconds.")
+	burst: Optional[int] = Field(None, ge=1, description="Requests allowed back to back; defaults to 'requests'.")
+	key_by: Literal["ip", "header"] = Field("ip", description="Count requests per client IP or per header value.")
+	header: Optional[str] = Field(None, description="Header identifying the client, e.g. X-API-Key.")
+	backend: Literal["memory", "shared"] = Field(
+		"memory", description="memory (per process) or shared (across workers on this host)."
+	)
+
+	@model_validator(mode="after")
+	def ensure_header(self) -> "RateLimitConfig":
+		"""Keying by header needs the header name."""
+		if self.key_by == "header" and not self.header:
+			raise ValueError("Rate limit key_by 'header' requires 'header'")
+		return self 
+
+
+class RouteAccessLogConfig(BaseModel):
+	"""Per-route access log overrides; unset fields use the server settings."""
+
+	sample_rate: Optional[float] = Field(None, ge=0, le=1, description="Fraction of requests logged, e.g. 0.01.")
+	error_sample_rate: Optional[float] = Field(None, ge=0, le=1, description="Fraction of 5xx responses logged.")
+	level: Optional[LogLevel] = Field(None, description="Level this route's access lines are logged at.")
+
 
 class RouteConfig(BaseModel):
 	"""Configuration for single route.""" 
@@ -52,8 +245,27 @@ class RouteConfig(BaseModel):
 	method: HTTPMethods = Field(
 		"GET", description="HTTP method for the route. One of: GET, POST, PUT, DELETE, PATCH."
 	)
-	handler: str = Field(..., description="Source/handler reference (python callable path, module:function, or file).") 
+	handler: Optional[str] = Field(None, description="Source/handler reference (python callable path, module:function, or file).") 
+	request_model: Optional[str] = Field(
+		None, description="Model (schemas.models name or import path) the JSON request body is validated against."
+	)
 	description: str | None = Field(None, description="Human-friendly description of the route")
+	executor: Optional[Literal["async", "thread", "process"]] = Field(
+		None, 
+		description="Run a sync handler on the event loop (async), in the server thread pool or in the process pool; "
+		"by default sync handlers use the shared threadpool."
+	)
+	lazy: Optional[bool] = Field(
+		None, description="Import the handler on first request; defaults to server.handler_loading."
+	)
+	cache: Optional[RouteCacheConfig] = Field(None, description="Cache GET responses of this route.")
+	coalesce: bool = Field(False, description="Share one handler execution between concurrent identical GET requests.")
+	access_log: Optional[RouteAccessLogConfig] = Field(None, description="Access log sampling for this route.")
+	compress: bool = Field(True, description="Set to false to never compress this route's responses.")
+	concurrency: Optional[ConcurrencyConfig] = Field(
+		None, description="Cap on concurrent runs of this route's handler, with its own wait queue."
+	)
+	rate_limit: Optional[RateLimitConfig] = Field(None, description="Rate limit of this route, per client.")
 	response: Dict[int, RouteResponse] = Field(
 		default_factory=dict, 
 		description="Mapping of HTTP status code (100-599) to the response schema for that code."
@@ -82,6 +294,39 @@ class RouteConfig(BaseModel):
 				raise InvalidStatusCode(f"Invalid HTTP status code in response mapping: {code}")
 		return self 
 
+	@model_validator(mode="after")
+	def ensure_handler_or_static(self) -> "RouteConfig":
+		"""A route needs a handler unless it declares static content."""
+		if self.handler is None and self.static_response() is None:
+			raise ValueError("Route needs a 'handler' or a response with static 'content'")
+		return self 
+
+	@model_validator(mode="after")
+	def ensure_stream_is_not_buffered(self) -> "RouteConfig":
+		"""Streamed responses are never held in full, so they can't be cached or shared."""
+		if self.stream_type() is not None and (self.cache is not None or self.coalesce):
+			raise ValueError("Streaming routes can't use 'cache' or 'coalesce'")
+		return self 
+
+	def success_status(self) -> int:
+		"""Lowest declared 2xx status code, used for handler results."""
+		codes = sorted(code for code in self.response if 200 <= code < 300)
+		return codes[0] if codes else 200 
+
+	def stream_type(self) -> Optional[str]:
+		"""Streaming type declared for the success status, if any."""
+		response = self.response.get(self.success_status())
+		if response is None or response.type == "json":
+			return None
+		return response.type 
+
+	def static_response(self) -> Optional[Tuple[int, RouteResponse]]:
+		"""Lowest status code declaring static content, with its response."""
+		for status_code in sorted(self.response):
+			if self.response[status_code].content is not None:
+				return status_code, self.response[status_code]
+		return None 
+
 
 class EndpointConfig(BaseModel):
 	"""A group of related routes (an endpoint collection)."""
@@ -89,6 +334,9 @@ class EndpointConfig(BaseModel):
 	group: Optional[str] = Field(None, description="Optional logical group name for this endpoint collection.")
 	version: Optional[str] = Field("v1", description="Semantic version or API version string for these endpoints, e.g. 'v1'.")
 	base_path: str = Field("/", description="Base path prefix for the endpoint collection. Must start with '/'.")
+	rate_limit: Optional[RateLimitConfig] = Field(
+		None, description="Rate limit shared by all routes of the group, per client."
+	)
 	routes: List[RouteConfig] = Field(default_factory=list, description="List of route definitions under this endpoint.") 
 
 	@field_validator("base_path", mode="before")
@@ -101,6 +349,12 @@ class EndpointConfig(BaseModel):
 		return v
 		
 
+class EndpointsFragment(BaseModel):
+	"""An included YAML file contributing endpoint groups."""
+
+	endpoints: List[EndpointConfig] = Field(default_factory=list, description="List of endpoint collections.")
+
+
 class ZyroConfig(BaseModel):
     """Top-level configuration root for Zyro projects."""
 
@@ -108,6 +362,10 @@ class ZyroConfig(BaseModel):
     server: ServerConfig = Field(default_factory=ServerConfig, description="Server and deployment settings.")
     schemas: Optional[SchemasConfig] = Field(None, description="Configuration for the server ")
     endpoints: List[EndpointConfig] = Field(default_factory=list, description="List of endpoint collections.")
+    include: List[str] = Field(
+        default_factory=list,
+        description="Glob patterns, relative to this file, of YAML files holding more endpoints.",
+    )
 
     @model_validator(mode="after")
     def ensure_base_paths_are_consistent(self) -> "ZyroConfig":
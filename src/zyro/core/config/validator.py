@@ -1,14 +1,20 @@
 from __future__ import annotations 
-from dataclasses import dataclass 
-from typing import Any, Dict, List, Tuple
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 from pydantic import BaseModel, ValidationError
-from zyro.core.config.schema import ZyroConfig
+from zyro.core.config.route_index import analyze_routes
+from zyro.core.config.schema import EndpointConfig, EndpointsFragment, ZyroConfig
 from zyro.core.exceptions import ConfigValidationError
 
 @dataclass
 class ValidatorResult:
 	warnings: List[str] 
 	duplicates: List[Tuple[str, str]] 
+	config: Optional[ZyroConfig] = None
+	routes: List[Tuple[str, str]] = field(default_factory=list)
+	sources: List[Path] = field(default_factory=list)
+	shadowed: List[Tuple[str, str]] = field(default_factory=list)
 
 def _normalize_full_path(base_path: str, route_path: str) -> str:
 	"""Normalize and join base_path and route_path into a full path."""
@@ -33,29 +39,33 @@ def _normalize_full_path(base_path: str, route_path: str) -> str:
 
 	return full 
 
-def valid_config(data: Dict[str, Any], strict: bool = True) -> ValidatorResult:
-	"""Validates raw config data against the predefined schema."""
+def ensure_no_duplicates(duplicates: List[Tuple[str, str]], shadowed: Optional[List[Tuple[str, str]]] = None) -> None:
+	"""Raise when strict validation finds duplicate or unreachable routes."""
+	if duplicates:
+		detail_msg = [f"{m} {p}" for m, p in duplicates]
+		raise ConfigValidationError("Duplicate route detected", detail_msg)
+	if shadowed:
+		detail_msg = [f"{m} {p}" for m, p in shadowed]
+		raise ConfigValidationError("Unreachable route detected", detail_msg)
 
-	warnings: List[str] = [] 
-	duplicates: List[Tuple[str, str]] = [] 
+def _schema_error(e: ValidationError, source: Optional[str] = None) -> ConfigValidationError:
+	"""Flatten pydantic errors into ConfigValidationError details."""
+	details = [] 
+	for err in e.errors():
+		loc = err.get("loc", ())
+		if isinstance(loc, (list, tuple)):
+			loc_str = ".".join(map(str, loc)) 
+		else:
+			loc_str = str(loc)
 
-	try:
-		config = ZyroConfig(**data) 
-	except ValidationError as e:
-		details = [] 
-		for err in e.errors():
-			loc = err.get("loc", ())
-			if isinstance(loc, (list, tuple)):
-				loc_str = ".".join(map(str, loc)) 
-			else:
-				loc_str = str(loc)
-
-			msg = err.get("msg", str(err)) 
-			details.append(f"{loc_str}: {msg}")
-		raise ConfigValidationError("Schema Validation Failed", details) from e 
+		msg = err.get("msg", str(err)) 
+		details.append(f"{source}: {loc_str}: {msg}" if source else f"{loc_str}: {msg}")
+	return ConfigValidationError("Schema Validation Failed", details)
 
-	seen_routes = set() 
-	for ep in config.endpoints:
+def collect_routes(endpoints: List[EndpointConfig]) -> List[Tuple[str, str]]:
+	"""(method, full path) of every route, in declaration order."""
+	routes: List[Tuple[str, str]] = [] 
+	for ep in endpoints:
 		base_path = ep.base_path or "/"
 		for route in ep.routes:
 			route_path = getattr(route, "path", "/") 
@@ -67,16 +77,53 @@ def valid_config(data: Dict[str, Any], strict: bool = True) -> ValidatorResult:
 			except Exception:
 				method_key = "GET" 
 
-			key = (method_key, full_path) 
-			if key in seen_routes:
-				msg = f"Duplicate route found: {method_key} {full_path}"
-				warnings.append(msg) 
-				duplicates.append((method_key, full_path)) 
-			else:
-				seen_routes.add(key) 
+			routes.append((method_key, full_path)) 
+	return routes 
 
-	if strict and duplicates:
-		detail_msg = [f"{m} {p}" for m, p in duplicates]
-		raise ConfigValidationError("Duplicate route detected", detail_msg)
+def find_duplicates(routes: List[Tuple[str, str]]) -> Tuple[List[str], List[Tuple[str, str]]]:
+	"""Warnings and keys for routes declared more than once."""
+	warnings: List[str] = [] 
+	duplicates: List[Tuple[str, str]] = [] 
+
+	seen_routes = set() 
+	for key in routes:
+		if key in seen_routes:
+			method_key, full_path = key
+			msg = f"Duplicate route found: {method_key} {full_path}"
+			warnings.append(msg) 
+			duplicates.append(key) 
+		else:
+			seen_routes.add(key) 
+	return warnings, duplicates 
+
+def check_routes(routes: List[Tuple[str, str]]) -> Tuple[List[str], List[Tuple[str, str]], List[Tuple[str, str]]]:
+	"""Warnings, duplicate routes and routes shadowed by an earlier one."""
+	warnings, duplicates = find_duplicates(routes) 
+	route_warnings, shadowed = analyze_routes(routes) 
+	return warnings + route_warnings, duplicates, shadowed 
+
+def valid_fragment(data: Dict[str, Any], source: str) -> Tuple[List[EndpointConfig], List[Tuple[str, str]]]:
+	"""Validates an included file holding more endpoint groups."""
+	try:
+		fragment = EndpointsFragment(**data) 
+	except ValidationError as e:
+		raise _schema_error(e, source) from e 
+	return fragment.endpoints, collect_routes(fragment.endpoints) 
+
+def valid_config(data: Dict[str, Any], strict: bool = True) -> ValidatorResult:
+	"""Validates raw config data against the predefined schema."""
+
+	try:
+		config = ZyroConfig(**data) 
+	except ValidationError as e:
+		raise _schema_error(e) from e 
+
+	routes = collect_routes(config.endpoints) 
+	warnings, duplicates, shadowed = check_routes(routes) 
+
+	if strict:
+		ensure_no_duplicates(duplicates, shadowed)
 
-	return ValidatorResult(warnings=warnings, duplicates=duplicates) 
\ No newline at end of file
+	return ValidatorResult(
+		warnings=warnings, duplicates=duplicates, config=config, routes=routes, shadowed=shadowed
+	)
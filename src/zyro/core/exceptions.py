@@ -21,6 +21,14 @@ class ServerError(ZyroError):
 	"""Raised when fastapi server got into an exception."""
 	pass 
 
+class HandlerImportError(ServerError):
+	"""Raised when a route handler reference cannot be imported."""
+	pass 
+
+class SchemaImportError(ServerError):
+	"""Raised when a model referenced by a route cannot be resolved."""
+	pass 
+
 class ConfigValidationError(ZyroError):
 	"""Raised when the YAML file is not valid."""
 	def __init__(self, message: str, errors: Optional[List[str]] = None) -> None:
@@ -1,17 +1,251 @@
 import os
+import sys
+import json
+import atexit
+import queue
 import logging
-import logging.config
-from datetime import datetime
-from logging.handlers import RotatingFileHandler
-from typing import Dict, Any, cast 
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Dict, List, Optional
 from zyro.core.setting import ensure_directories, get_settings
 
+# Block this long for queue space under the "block" policy before dropping.
+_BLOCK_TIMEOUT = 0.05
 
-def setup_logging() -> RotatingFileHandler:
-    """Application logging configuration."""
+# The running listener; restarted in forked workers and drained on shutdown.
+_listener: Optional["BatchingQueueListener"] = None
+_fork_hook_installed = False
 
+# Attributes every LogRecord has; anything else was passed through `extra`.
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName"}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record, including exceptions and `extra` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "logger": record.name,
+            "level": record.levelname,
+            "file": record.filename,
+            "line": record.lineno,
+            "function": record.funcName,
+            "process": record.process,
+            "message": record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exception"] = record.exc_text
+        if record.stack_info:
+            payload["stack"] = self.formatStack(record.stack_info)
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+
+class _DeferredFlush:
+    """Leaves flushing to the listener, which flushes once per batch."""
+
+    def flush(self) -> None:
+        pass
+
+    def flush_batch(self) -> None:
+        super().flush()  # type: ignore[misc]
+
+
+class BatchStreamHandler(_DeferredFlush, logging.StreamHandler):
+    pass
+
+
+class BatchRotatingFileHandler(_DeferredFlush, RotatingFileHandler):
+    pass
+
+
+class BoundedQueueHandler(QueueHandler):
+    """Hands records to the listener thread without blocking on I/O.
+
+    When the queue is full, ``drop_new`` discards the incoming record,
+    ``drop_oldest`` discards the oldest queued one and ``block`` waits
+    briefly for space before dropping.
+    """
+
+    def __init__(self, log_queue: "queue.Queue[Any]", drop_policy: str = "drop_new") -> None:
+        super().__init__(log_queue)
+        self.drop_policy = drop_policy
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolve the message now, but leave formatting to the target handlers
+        # so each one applies its own formatter.
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            if self.drop_policy == "block":
+                self.queue.put(record, timeout=_BLOCK_TIMEOUT)
+            else:
+                self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+
+        if self.drop_policy == "drop_oldest":
+            try:
+                self.queue.get_nowait()
+                self.queue.put_nowait(record)
+            except (queue.Empty, queue.Full):
+                pass
+        self.dropped += 1
+
+
+class BatchingQueueListener(QueueListener):
+    """Writes queued records in batches and flushes each handler once per batch."""
+
+    def __init__(
+        self,
+        log_queue: "queue.Queue[Any]",
+        *handlers: logging.Handler,
+        batch_size: int = 256,
+        source: Optional[BoundedQueueHandler] = None,
+    ) -> None:
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.batch_size = batch_size
+        self.source = source
+        self._reported_drops = 0
+
+    def _monitor(self) -> None:
+        log_queue = self.queue
+        has_task_done = hasattr(log_queue, "task_done")
+        stopping = False
+        while not stopping:
+            batch = [log_queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(log_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for record in batch:
+                if record is self._sentinel:
+                    stopping = True
+                else:
+                    self.handle(record)
+            self._report_drops()
+            for handler in self.handlers:
+                flush = getattr(handler, "flush_batch", handler.flush)
+                flush()
+            if has_task_done:
+                for _ in batch:
+                    log_queue.task_done()
+
+    def enqueue_sentinel(self) -> None:
+        # Wait for room: the sentinel must get through even when the queue is full.
+        self.queue.put(self._sentinel)
+
+    def _report_drops(self) -> None:
+        if self.source is None or self.source.dropped == self._reported_drops:
+            return
+        dropped = self.source.dropped - self._reported_drops
+        self._reported_drops = self.source.dropped
+        self.handle(
+            logging.makeLogRecord({
+                "name": "zyro.logging",
+                "levelno": logging.WARNING,
+                "levelname": "WARNING",
+                "msg": f"Dropped {dropped} log records: logging queue is full",
+            })
+        )
+
+
+def _build_handlers(log_filename: str, log_format: str) -> List[logging.Handler]:
+    settings = get_settings()
+
+    detailed = logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - "
+        "%(filename)s:%(lineno)d - %(funcName)s - %(message)s"
+    )
+    json_formatter = JsonFormatter()
+
+    file_handler = BatchRotatingFileHandler(
+        log_filename, maxBytes=10 * 1024 * 1024, backupCount=5
+    )
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(json_formatter if log_format == "json" else detailed)
+
+    console = BatchStreamHandler(sys.stdout)
+    console.setLevel(logging.INFO)
+    console.setFormatter(logging.Formatter("%(levelname)s:\t%(message)s"))
+
+    error_file = BatchRotatingFileHandler(
+        os.path.join(settings.logs_directory, "errors.log"),
+        maxBytes=10 * 1024 * 1024,
+        backupCount=5,
+    )
+    error_file.setLevel(logging.ERROR)
+    error_file.setFormatter(json_formatter)
+
+    return [file_handler, console, error_file]
+
+
+def _start_listener(handlers: List[logging.Handler]) -> QueueHandler:
+    """Start a listener over ``handlers`` and return the handler feeding it."""
+
+    global _listener
+    settings = get_settings()
+    log_queue: "queue.Queue[Any]" = queue.Queue(maxsize=settings.log_queue_size)
+    queue_handler = BoundedQueueHandler(log_queue, settings.log_drop_policy)
+    _listener = BatchingQueueListener(
+        log_queue, *handlers, batch_size=settings.log_batch_size, source=queue_handler
+    )
+    _listener.start()
+    return queue_handler
+
+
+def _restart_in_child() -> None:
+    """Forked workers have no listener thread; give them their own queue and listener."""
+
+    global _listener
+    if _listener is None:
+        return
+    handlers = list(_listener.handlers)
+    old_handler = _listener.source
+    _listener = None
+    queue_handler = _start_listener(handlers)
+    for name in ("", "uvicorn"):
+        target = logging.getLogger(name)
+        if old_handler in target.handlers:
+            target.removeHandler(old_handler)
+            target.addHandler(queue_handler)
+
+
+def stop_logging() -> None:
+    """Write out every queued record and stop the listener thread."""
+
+    global _listener
+    if _listener is not None:
+        listener, _listener = _listener, None
+        listener.stop()
+
+
+def setup_logging() -> QueueListener:
+    """Application logging configuration.
+
+    Loggers only enqueue records; a listener thread formats and writes them
+    in batches, so log calls never do file I/O on the event loop.
+    """
+
+    global _fork_hook_installed
     settings = get_settings()
     ensure_directories()
+    stop_logging()
 
     # Create a log file with timestamp
     log_filename = os.path.join(
@@ -19,72 +253,24 @@ def setup_logging() -> RotatingFileHandler:
         f"zyro_{datetime.now().strftime('%Y%m%d')}.log"
     )
 
-    logging_config: Dict[str, Any] = {
-        "version": 1,
-        "disable_existing_loggers": False,
-
-        "formatters": {
-            "detailed": {
-                "format": (
-                    "%(asctime)s - %(name)s - %(levelname)s - "
-                    "%(filename)s:%(lineno)d - %(funcName)s - %(message)s"
-                )
-            },
-            "console": {
-                "format": "%(levelname)s:\t%(message)s"
-            },
-            "json": {
-                "format": (
-                    '{"timestamp": "%(asctime)s", "logger": "%(name)s", '
-                    '"level": "%(levelname)s", "file": "%(filename)s", '
-                    '"line": %(lineno)d, "function": "%(funcName)s", '
-                    '"message": "%(message)s"}'
-                )
-            }
-        },
-
-        "handlers": {
-            "file": {
-                "class": "logging.handlers.RotatingFileHandler",
-                "level": "DEBUG",
-                "formatter": "detailed",
-                "filename": log_filename,
-                "maxBytes": 10 * 1024 * 1024,
-                "backupCount": 5
-            },
-            "console": {
-                "class": "logging.StreamHandler",
-                "level": "INFO",
-                "formatter": "console",
-                "stream": "ext://sys.stdout"
-            },
-            "error_file": {
-                "class": "logging.handlers.RotatingFileHandler",
-                "level": "ERROR",
-                "formatter": "json",
-                "filename": os.path.join(settings.logs_directory, "errors.log"),
-                "maxBytes": 10 * 1024 * 1024,
-                "backupCount": 5
-            }
-        },
-
-        "loggers": {
-            "uvicorn": {
-                "level": "INFO",
-                "handlers": ["file", "error_file", "console"], 
-                "propagate": False
-            },
-        },
-
-        "root": {
-            "level": "INFO",
-            "handlers": ["file", "console", "error_file"]
-        }
-    }
+    queue_handler = _start_listener(_build_handlers(log_filename, settings.log_format))
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(logging.INFO)
+
+    uvicorn_logger = logging.getLogger("uvicorn")
+    uvicorn_logger.handlers = [queue_handler]
+    uvicorn_logger.setLevel(logging.INFO)
+    uvicorn_logger.propagate = False
 
-    logging.config.dictConfig(logging_config)
+    if not _fork_hook_installed:
+        os.register_at_fork(after_in_child=_restart_in_child)
+        atexit.register(stop_logging)
+        _fork_hook_installed = True
 
-    return cast(RotatingFileHandler, logging.getLogger().handlers[0])
+    assert _listener is not None
+    return _listener
 
 def get_logger(name: str) -> logging.Logger:
     """Get a logger with the specified name."""
@@ -98,4 +284,4 @@ class Logger:
     def logger(self) -> logging.Logger:
         """logger for the class."""
 
-        return get_logger(self.__class__.__name__) 
\ No newline at end of file
+        return get_logger(self.__class__.__name__)
@@ -0,0 +1,226 @@
+"""Registry of the zyro servers running on this host."""
+import os
+import signal
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from zyro.core.logging import Logger
+from zyro.core.manager.state import StateManager
+from zyro.core.setting import get_settings
+
+DEFAULT_INSTANCE = "default"
+
+
+def is_alive(pid: int) -> bool:
+    """Whether a process exists, without signalling it."""
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Exists, but belongs to another user.
+        return True
+    try:
+        # A zombie still accepts signal 0 until its parent reaps it.
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            return f.read().rpartition(b")")[2].split()[0] != b"Z"
+    except (OSError, IndexError):
+        return True
+
+
+def _reap(pid: int) -> None:
+    # A server started from this process stays a zombie, and "alive", until reaped.
+    try:
+        os.waitpid(pid, os.WNOHANG)
+    except ChildProcessError:
+        pass
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def instance_key(config_path: Union[str, Path], instance_id: str = DEFAULT_INSTANCE) -> str:
+    return f"{Path(config_path).resolve()}#{instance_id}"
+
+
+def health(record: Dict[str, Any]) -> str:
+    """running, degraded (some workers gone) or dead (the server process is gone)."""
+
+    if not is_alive(record["pid"]):
+        return "dead"
+    workers = record.get("workers") or []
+    if any(not is_alive(worker["pid"]) for worker in workers):
+        return "degraded"
+    return "running"
+
+
+class InstanceRegistry(Logger):
+    """Server processes keyed by config path and instance id.
+
+    Every record holds the server PID, its workers, address, start time and
+    launch mode. Health is derived from process liveness when read, so a
+    crashed server shows up as dead rather than needing to clean up.
+    """
+
+    def __init__(self, registry_file: Optional[str] = None) -> None:
+        super().__init__()
+        path = os.path.expanduser(registry_file or get_settings().registry_file)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.state = StateManager(path)
+
+    def register(
+        self,
+        config_path: Union[str, Path],
+        instance_id: str,
+        pid: int,
+        host: str,
+        port: int,
+        mode: str,
+        workers: Iterable[int] = (),
+        supervised: bool = True,
+    ) -> str:
+        """Record a server, replacing any earlier record of the same instance."""
+
+        key = instance_key(config_path, instance_id)
+        started_at = _now()
+        with self.state.transaction():
+            record = {
+                "config": str(Path(config_path).resolve()),
+                "instance": instance_id,
+                "pid": pid,
+                "host": host,
+                "port": port,
+                "mode": mode,
+                "supervised": supervised,
+                "started_at": started_at,
+                "workers": [{"pid": worker, "started_at": started_at} for worker in workers],
+            }
+            existing = self.state.get_state(key)
+            if existing is not None and existing["pid"] == pid:
+                # The launcher and the server both register; keep whichever came first.
+                record["started_at"] = existing["started_at"]
+                record["workers"] = record["workers"] or existing.get("workers", [])
+            self.state.add_state(key, record)
+        return key
+
+    def set_workers(self, key: str, pids: Iterable[int]) -> None:
+        """Replace the worker list, keeping the start time of workers already recorded."""
+
+        with self.state.transaction():
+            record = self.state.get_state(key)
+            if record is None:
+                return
+            known = {worker["pid"]: worker["started_at"] for worker in record.get("workers", [])}
+            record["workers"] = [
+                {"pid": pid, "started_at": known.get(pid) or _now()} for pid in sorted(pids)
+            ]
+            self.state.add_state(key, record)
+
+    def record_reload(self, key: str, ok: bool) -> None:
+        """Note the outcome of a reload, which `reload()` waits for."""
+
+        with self.state.transaction():
+            record = self.state.get_state(key)
+            if record is None:
+                return
+            record["last_reload"] = {"at": _now(), "ok": ok}
+            self.state.add_state(key, record)
+
+    def reload(self, key: str, timeout: float = 120.0) -> Optional[bool]:
+        """SIGHUP a supervised server and wait for the outcome of its reload.
+
+        Returns None when the server isn't running, can't reload or didn't
+        report back within timeout.
+        """
+
+        record = self.instances().get(key)
+        if record is None or not record.get("supervised") or record["health"] == "dead":
+            return None
+        previous = record.get("last_reload")
+        os.kill(record["pid"], signal.SIGHUP)
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            time.sleep(0.1)
+            current = self.instances().get(key)
+            if current is None or current["pid"] != record["pid"] or current["health"] == "dead":
+                return None
+            if current.get("last_reload") != previous:
+                return current["last_reload"]["ok"]
+        return None
+
+    def unregister(self, key: str, pid: Optional[int] = None) -> bool:
+        """Drop a record; with pid, only while it still belongs to that process."""
+
+        with self.state.transaction():
+            record = self.state.get_state(key)
+            if record is None or (pid is not None and record["pid"] != pid):
+                return False
+            return self.state.remove_state(key)
+
+    def instances(
+        self,
+        config_path: Optional[Union[str, Path]] = None,
+        instance_id: Optional[str] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Records matching the config and instance, each with its current health."""
+
+        self.state.load_state()
+        config = str(Path(config_path).resolve()) if config_path is not None else None
+        found = {}
+        for key, record in self.state.state_data.items():
+            if config is not None and record.get("config") != config:
+                continue
+            if instance_id is not None and record.get("instance") != instance_id:
+                continue
+            found[key] = {**record, "health": health(record)}
+        return found
+
+    def prune(self) -> List[str]:
+        """Remove the records of servers that are no longer running."""
+
+        with self.state.transaction():
+            dead = [key for key, record in self.state.state_data.items() if not is_alive(record["pid"])]
+            for key in dead:
+                self.state.remove_state(key)
+        return dead
+
+    def stop(self, key: str, timeout: float = 10.0) -> bool:
+        """SIGTERM the server and wait for it; SIGKILL it and its workers after timeout.
+
+        Returns False when the server had to be killed.
+        """
+
+        record = self.state.get_state(key) or self.instances().get(key)
+        if record is None:
+            return True
+
+        pid = record["pid"]
+        graceful = True
+        if is_alive(pid):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline:
+                _reap(pid)
+                if not is_alive(pid):
+                    break
+                time.sleep(0.05)
+            else:
+                graceful = False
+                self.logger.warning("Server %d didn't stop within %gs, killing it", pid, timeout)
+                for target in [pid, *(worker["pid"] for worker in record.get("workers", []))]:
+                    try:
+                        os.kill(target, signal.SIGKILL)
+                    except ProcessLookupError:
+                        pass
+                _reap(pid)
+
+        self.unregister(key, pid=pid)
+        return graceful
@@ -1,24 +1,41 @@
 import hashlib
 import json
 import os
+import tempfile
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Callable
+from typing import Any, Callable, Iterator, Optional
 
 from zyro.core.logging import Logger
 
+try:
+    import fcntl
+except ImportError:  # not available on Windows; state is then unlocked
+    fcntl = None
+
 
 class StateManager(Logger):
-    """Root-based state manager with versioning and migration support."""
+    """Root-based state manager with versioning and migration support.
+
+    Writes go through a temporary file that is fsynced and renamed over the
+    state file, so readers never see a partial file. Updates made inside
+    ``transaction()`` hold an ``fcntl`` lock and are written once, on exit.
+    """
 
     _STATE_FILENAME = ".zyro_state.json"
     _LOCK_FILENAME = ".zyro_state.json.lock"
     _CURRENT_VERSION = 1
 
-    def __init__(self) -> None:
+    def __init__(self, state_file: Optional[str] = None) -> None:
         super().__init__()
+        self.state_file = state_file or self._STATE_FILENAME
+        self.lock_file = self.state_file + ".lock" if state_file else self._LOCK_FILENAME
         self.state_data: dict[str, Any] = {}
         self._migrations: dict[int, Callable[[dict[str, Any]], None]] = {}
-        self.logger.info("Initialized StateManager using root state file")
+        self._lock_fd: Optional[int] = None
+        self._depth = 0
+        self._dirty = False
+        self.logger.debug("Initialized StateManager using %s", self.state_file)
 
     def _get_timestamp(self) -> str:
         return datetime.utcnow().isoformat() + "Z"
@@ -35,7 +52,7 @@ class StateManager(Logger):
 
     def load_state(self) -> None:
         try:
-            with open(self._STATE_FILENAME, "r", encoding="utf-8") as f:
+            with open(self.state_file, "r", encoding="utf-8") as f:
                 raw_state = json.load(f)
 
             state_version = raw_state.get("_meta", {}).get("version", 0)
@@ -48,15 +65,15 @@ class StateManager(Logger):
                     state_version,
                 )
                 self._run_migrations(state_version, self._CURRENT_VERSION)
-                self.save_state()
+                self._write()
             else:
-                self.logger.info(
+                self.logger.debug(
                     "Loaded state (version %d)",
                     state_version,
                 )
 
         except FileNotFoundError:
-            self.logger.info("No state file found. Starting fresh.")
+            self.logger.debug("No state file found. Starting fresh.")
             self.state_data = {}
 
         except json.JSONDecodeError as e:
@@ -64,6 +81,15 @@ class StateManager(Logger):
             self.state_data = {}
 
     def save_state(self) -> None:
+        """Write the state now, or when the enclosing transaction commits."""
+
+        if self._depth:
+            self._dirty = True
+            return
+        with self.transaction(reload=False):
+            self._dirty = True
+
+    def _write(self) -> None:
         state_with_meta = {
             "_meta": {
                 "version": self._CURRENT_VERSION,
@@ -73,29 +99,109 @@ class StateManager(Logger):
             "data": self.state_data,
         }
 
+        directory = os.path.dirname(os.path.abspath(self.state_file))
+        fd, tmp_path = tempfile.mkstemp(prefix=".zyro_state.", suffix=".tmp", dir=directory)
         try:
-            with open(self._STATE_FILENAME, "w", encoding="utf-8") as f:
-                json.dump(state_with_meta, f, indent=4)
-            self.logger.info("Saved state to %s", self._STATE_FILENAME)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(state_with_meta, f, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.state_file)
         except Exception as e:
             self.logger.error("Failed to save state: %s", e)
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+        self._fsync_directory(directory)
+        self.logger.debug("Saved state to %s", self.state_file)
+
+    @staticmethod
+    def _fsync_directory(directory: str) -> None:
+        # Makes the rename itself durable.
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    @contextmanager
+    def transaction(self, reload: bool = True) -> Iterator["StateManager"]:
+        """Lock the state, re-read it and write it once if anything changed.
+
+        Nested transactions join the outermost one. Nothing is written when
+        the block raises.
+        """
+
+        if self._depth:
+            self._depth += 1
+            try:
+                yield self
+            finally:
+                self._depth -= 1
+            return
+
+        acquired = self._acquire(blocking=True)
+        self._depth = 1
+        self._dirty = False
+        try:
+            if reload:
+                self.load_state()
+            yield self
+            if self._dirty:
+                self._write()
+        finally:
+            self._depth = 0
+            self._dirty = False
+            if acquired:
+                self._release()
+
+    def _acquire(self, blocking: bool) -> bool:
+        """Take the lock file's exclusive lock; False if this manager already holds it."""
+
+        if self._lock_fd is not None or fcntl is None:
+            return False
+        fd = os.open(self.lock_file, os.O_CREAT | os.O_RDWR, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
             raise
+        self._lock_fd = fd
+        return True
+
+    def _release(self) -> None:
+        if self._lock_fd is None:
+            return
+        fd, self._lock_fd = self._lock_fd, None
+        try:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
 
     def add_state(self, key: str, value: Any) -> None:
-        self.state_data[key] = value
-        self.save_state()
+        with self.transaction():
+            self.state_data[key] = value
+            self._dirty = True
         self.logger.debug("Set state: %s=%s", key, value)
 
     def get_state(self, key: str, default: Any = None) -> Any:
         return self.state_data.get(key, default)
 
     def remove_state(self, key: str) -> bool:
-        if key in self.state_data:
+        with self.transaction():
+            if key not in self.state_data:
+                return False
             del self.state_data[key]
-            self.save_state()
-            self.logger.debug("Removed state: %s", key)
-            return True
-        return False
+            self._dirty = True
+        self.logger.debug("Removed state: %s", key)
+        return True
 
     def register_migration(
         self,
@@ -112,31 +218,32 @@ class StateManager(Logger):
                 migration(self.state_data)
 
     def lock_state(self, lock_id: str) -> bool:
-        try:
-            fd = os.open(
-                self._LOCK_FILENAME,
-                os.O_CREAT | os.O_EXCL | os.O_WRONLY,
-            )
-            os.write(
-                fd,
-                json.dumps(
-                    {"lock_id": lock_id, "timestamp": self._get_timestamp()}
-                ).encode(),
-            )
-            os.close(fd)
-            self.logger.info("State locked by %s", lock_id)
+        """Hold the state lock until unlock_state(); False if another process holds it."""
+
+        if fcntl is None:
             return True
-        except FileExistsError:
+        try:
+            if not self._acquire(blocking=False):
+                return self._lock_fd is not None
+        except BlockingIOError:
             self.logger.warning("State already locked")
             return False
+        if self._lock_fd is not None:
+            os.ftruncate(self._lock_fd, 0)
+            os.pwrite(
+                self._lock_fd,
+                json.dumps({"lock_id": lock_id, "pid": os.getpid(), "timestamp": self._get_timestamp()}).encode(),
+                0,
+            )
+        self.logger.info("State locked by %s", lock_id)
+        return True
 
     def unlock_state(self) -> bool:
-        try:
-            os.remove(self._LOCK_FILENAME)
-            self.logger.info("State lock released")
-            return True
-        except FileNotFoundError:
+        if self._lock_fd is None:
             return False
+        self._release()
+        self.logger.info("State lock released")
+        return True
 
     def get_state_version(self) -> int:
         return self._CURRENT_VERSION
@@ -1,5 +1,6 @@
 from functools import lru_cache
 import os 
+from typing import Literal
 from pydantic_settings import BaseSettings 
 from pydantic import Field
 
@@ -9,6 +10,13 @@ class Settings(BaseSettings):
 	# Storage paths
 	logs_directory: str = Field(default="./logs") 
 	state_file: str = Field(default="zyro.state.json")
+	registry_file: str = Field(default="~/.zyro/instances.json")
+
+	# Logging pipeline
+	log_queue_size: int = Field(default=10000, ge=1)
+	log_batch_size: int = Field(default=256, ge=1)
+	log_drop_policy: Literal["drop_new", "drop_oldest", "block"] = Field(default="drop_new")
+	log_format: Literal["text", "json"] = Field(default="text")
 
 @lru_cache
 def get_settings() -> Settings:
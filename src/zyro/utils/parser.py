@@ -1,17 +1,16 @@
 from __future__ import annotations
 from pathlib import Path
-from typing import Any, Dict, List
-import yaml
+from typing import Any, Dict, List, Optional
 
-from zyro.core.config.schema import EndpointConfig, ZyroConfig, ProjectConfig, ServerConfig
+from zyro.core.config.cache import compile_config
+from zyro.core.config.schema import EndpointConfig, ZyroConfig, ProjectConfig, SchemasConfig, ServerConfig
 
-def load_file(file_path: Path) -> ZyroConfig:
+def load_file(file_path: Path, use_cache: bool = True) -> ZyroConfig:
 	"""Load the config file into ZyroConfig"""
 
 	if not file_path.exists():
 		raise FileNotFoundError(f"The file {file_path} does not exist.") 
-	with open(file_path, "r", encoding="utf-8") as file:
-		return ZyroConfig(**yaml.safe_load(file))
+	return compile_config(file_path=file_path, strict=False, use_cache=use_cache).config
 
 def get_project_config(config: ZyroConfig) -> ProjectConfig:
 	"""Extract the project configuration from the ZyroConfig"""
@@ -23,6 +22,11 @@ def get_server_config(config: ZyroConfig) -> ServerConfig:
 
 	return config.server 
 
+def get_schemas_config(config: ZyroConfig) -> Optional[SchemasConfig]:
+	"""Extract the schemas configuration from the ZyroConfig."""
+
+	return config.schemas 
+
 def get_endpoints_config(config: ZyroConfig) -> List[EndpointConfig]:
 	"""Extract endpoints configuration from the ZyroConfig."""
 